@@ -0,0 +1,264 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.network import get_free_port, wait_for_ports
+from tools.logger import get_logger
+
+logger = get_logger("BENCHMARK")
+
+ROOT = Path(__file__).resolve().parent.parent
+BACKEND = ROOT / "benchmarks" / "backend.py"
+# Базовая линия зависит от машины, поэтому не хранится в репозитории (см. .gitignore)
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+
+def get_machine() -> dict[str, str | int]:
+    """
+    Описание машины, на которой записана базовая линия: абсолютный rps сравним только на той же машине.
+    """
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count() or 0,
+        "python": platform.python_version(),
+    }
+
+
+def get_invalid_reason(result: dict) -> str | None:
+    """
+    Возвращает причину, по которой результат нельзя использовать, или None.
+
+    Запуск без запросов (например, все пользователи упали в on_start) или с ошибками измеряет
+    не генератор, а сбой сценария: такой результат не сравнивается и не записывается в базовую линию.
+    """
+    if result["requests"] == 0:
+        return "no requests were made"
+
+    if result["failures"] > 0:
+        return f"{result['failures']} of {result['requests']} requests failed"
+
+    return None
+
+
+def discover_scenarios(pattern: str | None = None) -> dict[str, Path]:
+    """
+    Возвращает сценарии scenarios/{http,grpc}/gateway/* по именам вида http/existing_user_get_operations.
+
+    :param pattern: Подстрока имени для выбора части сценариев.
+    """
+    scenarios = {}
+    for protocol in ("http", "grpc"):
+        for path in sorted((ROOT / "scenarios" / protocol / "gateway").glob("*/scenario.py")):
+            name = f"{protocol}/{path.parent.name}"
+            if pattern is None or pattern in name:
+                scenarios[name] = path
+
+    return scenarios
+
+
+def run_scenario(path: Path, users: int, warmup: float, duration: float) -> dict:
+    """
+    Запускает сценарий в отдельном процессе Locust (с benchmarks/backend.py) против заменителя gateway,
+    запущенного своим процессом (python -m tools.standin).
+
+    Заменитель не поднимается внутри процесса Locust: gRPC в режиме gevent опрашивает очереди
+    в пуле потоков hub-а (10 потоков), и сервер в том же процессе блокируется, когда клиентских
+    вызовов в полёте становится столько же. Кроме того, процессорное время заменителя не попадает
+    в измерение генератора.
+
+    Пользователи работают без пауз (закрытая модель, wait_time = 0), поэтому результат — предельная
+    интенсивность, которую один процесс генератора выдаёт на этом сценарии.
+
+    :param path: Путь к файлу сценария.
+    :param users: Количество виртуальных пользователей.
+    :param warmup: Прогрев после запуска пользователей (в секундах).
+    :param duration: Длительность измерения (в секундах).
+    :return: Результат измерения (rps, cpu_per_request_us, retained_blocks_per_request...).
+    """
+    http_port, grpc_port = get_free_port(), get_free_port()
+    env = {
+        **os.environ,
+        "LOCUST_USER.LOAD_MODEL": "closed",
+        "LOCUST_USER.WAIT_TIME_MIN": "0",
+        "LOCUST_USER.WAIT_TIME_MAX": "0",
+        "GATEWAY_HTTP_CLIENT.URL": f"http://localhost:{http_port}",
+        "GATEWAY_GRPC_CLIENT.HOST": "localhost",
+        "GATEWAY_GRPC_CLIENT.PORT": str(grpc_port),
+        "STANDIN.HOST": "localhost",
+        "STANDIN.HTTP_PORT": str(http_port),
+        "STANDIN.GRPC_PORT": str(grpc_port),
+        "STANDIN.LATENCY_MS": "0",
+        "STANDIN.LATENCY_JITTER_MS": "0",
+        "STANDIN.ERROR_RATE": "0",
+        "STANDIN.METHODS": "{}",
+        "SEEDS.EXHAUSTION_POLICY": "wrap",
+    }
+
+    standin = subprocess.Popen(
+        [sys.executable, "-m", "tools.standin"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_ports([http_port, grpc_port])
+        return run_locust(path, env, users=users, warmup=warmup, duration=duration)
+    finally:
+        standin.terminate()
+        standin.wait()
+
+
+def run_locust(path: Path, env: dict[str, str], users: int, warmup: float, duration: float) -> dict:
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as workdir:
+        output = Path(workdir) / "result.json"
+        command = [
+            sys.executable, "-m", "locust",
+            "-f", f"{BACKEND},{path}",
+            "--headless",
+            "--users", str(users),
+            "--spawn-rate", str(users),
+            "--only-summary",
+            "--loglevel", "WARNING",
+            "--benchmark-output", str(output),
+            "--benchmark-workdir", workdir,
+            "--benchmark-warmup", str(warmup),
+            "--benchmark-duration", str(duration),
+        ]
+        process = subprocess.run(
+            command,
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=duration + warmup + 600
+        )
+        if not output.exists():
+            raise RuntimeError(f"Benchmark of {path} did not produce a result:\n{process.stderr[-4000:]}")
+
+        return json.loads(output.read_text(encoding="utf-8"))
+
+
+def compare(
+        results: dict[str, dict],
+        baseline: dict[str, dict],
+        tolerance: float,
+        retained_tolerance: float
+) -> list[str]:
+    """
+    Сравнивает предельную интенсивность и прирост памяти на запрос с базовой линией.
+
+    Прирост памяти на запрос в норме близок к нулю и колеблется около него, поэтому сравнивается
+    не в процентах, а по абсолютному запасу retained_tolerance (блоков на запрос).
+
+    :return: Описания регрессий: сценарии, у которых rps ниже базового более чем на tolerance
+             или прирост памяти выше базового более чем на retained_tolerance,
+             и некорректные запуски (без запросов или с ошибками).
+    """
+    regressions = []
+    for name, result in results.items():
+        if reason := get_invalid_reason(result):
+            regressions.append(f"{name}: invalid run, {reason}")
+            continue
+
+        expected = baseline.get(name)
+        if expected is None:
+            logger.warning(f"{name}: no baseline, skipped")
+            continue
+
+        change = result["rps"] / expected["rps"] - 1
+        logger.info(
+            f"{name}: {result['rps']} rps (baseline {expected['rps']}, {change:+.1%}), "
+            f"{result['cpu_per_request_us']} us CPU/request, "
+            f"{result['retained_blocks_per_request']} retained blocks/request "
+            f"(baseline {expected.get('retained_blocks_per_request')}), {result['failures']} failures"
+        )
+        if change < -tolerance:
+            regressions.append(f"{name}: {result['rps']} rps is {-change:.1%} below baseline {expected['rps']} rps")
+
+        # Базовая линия, записанная до появления метрики, сравнивается только по rps
+        retained = expected.get("retained_blocks_per_request")
+        if retained is not None and result["retained_blocks_per_request"] > retained + retained_tolerance:
+            regressions.append(
+                f"{name}: {result['retained_blocks_per_request']} retained blocks/request is more than "
+                f"{retained_tolerance} above baseline {retained}"
+            )
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Бенчмарк генератора нагрузки: предельная интенсивность сценариев на заменителе gateway"
+    )
+    parser.add_argument("-k", "--scenario", help="Подстрока имени сценария (например, http/ или get_operations)")
+    parser.add_argument("--users", type=int, default=20, help="Количество виртуальных пользователей")
+    parser.add_argument("--warmup", type=float, default=5, help="Прогрев после запуска пользователей (с)")
+    parser.add_argument("--duration", type=float, default=15, help="Длительность измерения (с)")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Допустимое снижение rps относительно базовой линии")
+    parser.add_argument(
+        "--retained-tolerance",
+        type=float,
+        default=1.0,
+        help="Допустимый рост памяти, остающейся занятой после запроса, относительно базовой линии (блоков на запрос)"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Файл базовой линии")
+    parser.add_argument("--update-baseline", action="store_true", help="Записать результаты как новую базовую линию")
+    parser.add_argument("--output", type=Path, help="Файл для результатов запуска (JSON)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, path in discover_scenarios(args.scenario).items():
+        logger.info(f"{name}: running for {args.warmup + args.duration}s with {args.users} users")
+        results[name] = run_scenario(path, users=args.users, warmup=args.warmup, duration=args.duration)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else None
+    machine = get_machine()
+    if args.update_baseline:
+        invalid = {name: reason for name, result in results.items() if (reason := get_invalid_reason(result))}
+        if invalid:
+            for name, reason in invalid.items():
+                logger.error(f"{name}: invalid run, {reason}")
+
+            logger.error(f"Baseline not updated: {args.baseline}")
+            return 1
+
+        # Результаты другой машины не смешиваются с результатами этой
+        scenarios = baseline["scenarios"] if baseline is not None and baseline["machine"] == machine else {}
+        args.baseline.write_text(
+            json.dumps({"machine": machine, "scenarios": {**scenarios, **results}}, indent=2) + "\n",
+            encoding="utf-8"
+        )
+        logger.info(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        logger.error(f"No baseline at {args.baseline}: record one on this machine with --update-baseline")
+        return 1
+
+    if baseline["machine"] != machine:
+        logger.warning(
+            f"Baseline was recorded on another machine ({baseline['machine']}, this one is {machine}): "
+            f"absolute rps is not comparable, re-record it with --update-baseline"
+        )
+
+    regressions = compare(results, baseline["scenarios"], args.tolerance, args.retained_tolerance)
+    for regression in regressions:
+        logger.error(regression)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
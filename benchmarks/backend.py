@@ -0,0 +1,98 @@
+import gc
+import json
+import os
+import sys
+import time
+
+import gevent
+from locust import events
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+
+from tools.logger import get_logger
+
+# Locust-файл бенчмарка генератора нагрузки: запускается вместе с файлом сценария
+# (locust -f benchmarks/backend.py,<scenario.py>) против заменителя gateway (python -m tools.standin),
+# после прогрева измеряет пропускную способность сценария и сохраняет результат в JSON
+
+logger = get_logger("BENCHMARK")
+
+
+@events.init_command_line_parser.add_listener
+def init_command_line_parser(parser: LocustArgumentParser):
+    parser.add_argument("--benchmark-output", type=str, required=True, help="Файл для результата бенчмарка (JSON)")
+    parser.add_argument("--benchmark-workdir", type=str, required=True, help="Рабочий каталог для дампов сидинга")
+    parser.add_argument("--benchmark-warmup", type=float, default=5, help="Прогрев после запуска пользователей (с)")
+    parser.add_argument("--benchmark-duration", type=float, default=15, help="Длительность измерения (с)")
+    parser.add_argument(
+        "--benchmark-allocation-duration", type=float, default=3, help="Длительность прохода измерения памяти (с)"
+    )
+
+
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    # Настройки уже загружены из .env, дальше рабочий каталог нужен только для дампов сидинга:
+    # бенчмарк не должен перезаписывать дампы в dumps/ репозитория
+    os.chdir(environment.parsed_options.benchmark_workdir)
+
+    # Измерение начинается после запуска всех пользователей и прогрева
+    environment.events.spawning_complete.add_listener(lambda user_count, **_: gevent.spawn(measure, environment))
+
+
+def get_counters() -> dict[str, float]:
+    """
+    Возвращает счётчики процесса: время и процессорное время.
+    """
+    return {"time": time.perf_counter(), "cpu": time.process_time()}
+
+
+def measure_retained_blocks(environment: Environment, duration: float) -> float:
+    """
+    Измеряет отдельным коротким проходом, сколько блоков памяти в среднем остаётся занятым после запроса.
+
+    Число занятых блоков интерпретатора (sys.getallocatedblocks) снимается до и после прохода,
+    оба раза после полной сборки мусора, поэтому временные объекты запроса и циклический мусор
+    в разницу не попадают — остаётся только то, что запросы накопили (кэши, списки, утечки).
+    Сборка мусора останавливает генератор, поэтому проход идёт после измерения интенсивности.
+
+    :param environment: Среда выполнения Locust.
+    :param duration: Длительность прохода (в секундах).
+    :return: Прирост занятых блоков на один запрос.
+    """
+    environment.stats.reset_all()
+    gc.collect()
+    start = sys.getallocatedblocks()
+    gevent.sleep(duration)
+    requests = environment.stats.total.num_requests
+    gc.collect()
+    end = sys.getallocatedblocks()
+    return round((end - start) / max(requests, 1), 2)
+
+
+def measure(environment: Environment) -> None:
+    options = environment.parsed_options
+    gevent.sleep(options.benchmark_warmup)
+
+    environment.stats.reset_all()
+    start = get_counters()
+    gevent.sleep(options.benchmark_duration)
+    end = get_counters()
+
+    total = environment.stats.total
+    requests = max(total.num_requests, 1)
+    result = {
+        "users": environment.runner.user_count,
+        "requests": total.num_requests,
+        "failures": total.num_failures,
+        "rps": round(total.num_requests / (end["time"] - start["time"]), 1),
+        "cpu_per_request_us": round((end["cpu"] - start["cpu"]) / requests * 1_000_000, 1),
+        "median_response_time_ms": total.get_response_time_percentile(0.5),
+    }
+    result["retained_blocks_per_request"] = measure_retained_blocks(
+        environment, options.benchmark_allocation_duration
+    )
+    with open(options.benchmark_output, "w", encoding="utf-8") as file:
+        json.dump(result, file)
+
+    logger.info(f"Benchmark result: {result}")
+    environment.runner.quit()
@@ -0,0 +1,394 @@
+import argparse
+import json
+import platform
+import statistics
+import timeit
+import types
+import uuid
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+from google.protobuf.message_factory import GetMessageClass
+from grpc import Channel, insecure_channel, intercept_channel
+from httpx import Client, MockTransport, Request, Response
+from locust.env import Environment
+from pydantic import BaseModel
+
+# gRPC в режиме gevent, как в процессе генератора нагрузки
+import clients.grpc.client  # noqa: F401
+from benchmarks.network import get_free_port, wait_for_ports
+from clients.grpc.factory import ProtoRequestFactory
+from clients.grpc.gateway.operations import factories as operation_factories
+from clients.grpc.gateway.users.factories import create_user_request_factory
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.wire import WireSizeChannel
+from clients.http.client import HTTPClient
+from clients.http.decoding import decode_response
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.http.templates import get_request_template
+from config import settings
+from tools.config.http import HTTPDecodeMode
+from tools.config.standin import StandInConfig, StandInLatencyDistribution
+from tools.logger import get_logger
+from tools.standin.grpc_server import GATEWAY_SERVICE_MODULES, build_standin_grpc_server
+from tools.standin.http_server import JSON_HEADERS, StandInHTTPApplication
+
+# Микробенчмарки горячего пути клиентов: каждая стадия запроса (сборка и сериализация тела,
+# отправка через httpx или stub, хуки и интерцептор Locust, разбор ответа) измеряется отдельно
+# для каждого эндпоинта. HTTP-запросы обслуживает httpx.MockTransport с телами ответов заменителя
+# gateway, gRPC-вызовы — gRPC-сервер заменителя в этом же процессе
+
+logger = get_logger("MICROBENCHMARK")
+
+# Пакеты, от версий которых зависят результаты
+PACKAGES = ["httpx", "pydantic", "pydantic-core", "grpcio", "protobuf", "locust"]
+
+USER_ID = str(uuid.uuid4())
+CARD_ID = str(uuid.uuid4())
+ACCOUNT_ID = str(uuid.uuid4())
+OPERATION_ID = str(uuid.uuid4())
+
+# Эндпоинты HTTP-клиентов: (класс клиента, высокоуровневый метод, аргументы метода)
+HTTP_CASES: list[tuple[type[HTTPClient], str, dict[str, str]]] = [
+    (UsersGatewayHTTPClient, "get_user", {"user_id": USER_ID}),
+    (UsersGatewayHTTPClient, "create_user", {}),
+    (AccountsGatewayHTTPClient, "get_accounts", {"user_id": USER_ID}),
+    (AccountsGatewayHTTPClient, "open_deposit_account", {"user_id": USER_ID}),
+    (AccountsGatewayHTTPClient, "open_savings_account", {"user_id": USER_ID}),
+    (AccountsGatewayHTTPClient, "open_debit_card_account", {"user_id": USER_ID}),
+    (AccountsGatewayHTTPClient, "open_credit_card_account", {"user_id": USER_ID}),
+    (CardsGatewayHTTPClient, "issue_virtual_card", {"user_id": USER_ID, "account_id": ACCOUNT_ID}),
+    (CardsGatewayHTTPClient, "issue_physical_card", {"user_id": USER_ID, "account_id": ACCOUNT_ID}),
+    (DocumentsGatewayHTTPClient, "get_tariff_document", {"account_id": ACCOUNT_ID}),
+    (DocumentsGatewayHTTPClient, "get_contract_document", {"account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "get_operation", {"operation_id": OPERATION_ID}),
+    (OperationsGatewayHTTPClient, "get_operation_receipt", {"operation_id": OPERATION_ID}),
+    (OperationsGatewayHTTPClient, "get_operations", {"account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "get_operations_summary", {"account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "make_fee_operation", {"card_id": CARD_ID, "account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "make_top_up_operation", {"card_id": CARD_ID, "account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "make_cashback_operation", {"card_id": CARD_ID, "account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "make_transfer_operation", {"card_id": CARD_ID, "account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "make_purchase_operation", {"card_id": CARD_ID, "account_id": ACCOUNT_ID}),
+    (OperationsGatewayHTTPClient, "make_bill_payment_operation", {"card_id": CARD_ID, "account_id": ACCOUNT_ID}),
+    (
+        OperationsGatewayHTTPClient,
+        "make_cash_withdrawal_operation",
+        {"card_id": CARD_ID, "account_id": ACCOUNT_ID}
+    ),
+]
+
+# Фабрики gRPC-запросов, которыми пользуются клиенты; остальные запросы создаются конструктором сообщения
+GRPC_REQUEST_FACTORIES: dict[str, ProtoRequestFactory] = {
+    "CreateUser": create_user_request_factory,
+    "MakeFeeOperation": operation_factories.make_fee_operation_request_factory,
+    "MakeTopUpOperation": operation_factories.make_top_up_operation_request_factory,
+    "MakeCashbackOperation": operation_factories.make_cashback_operation_request_factory,
+    "MakeTransferOperation": operation_factories.make_transfer_operation_request_factory,
+    "MakePurchaseOperation": operation_factories.make_purchase_operation_request_factory,
+    "MakeBillPaymentOperation": operation_factories.make_bill_payment_operation_request_factory,
+    "MakeCashWithdrawalOperation": operation_factories.make_cash_withdrawal_operation_request_factory,
+}
+
+
+class Timer:
+    """
+    Измеряет время вызова функции: repeat серий по number вызовов подряд.
+    """
+
+    def __init__(self, number: int, repeat: int):
+        self.number = number
+        self.repeat = repeat
+
+    def measure(self, func: Callable[[], Any]) -> dict[str, float]:
+        """
+        :param func: Функция без аргументов (одна стадия запроса).
+        :return: Минимальное и медианное по сериям время одного вызова (в микросекундах).
+        """
+        func()  # Прогрев: кеши шаблонов и схем, установка соединения
+        timings = [
+            total / self.number * 1_000_000
+            for total in timeit.repeat(func, number=self.number, repeat=self.repeat)
+        ]
+        return {"min_us": round(min(timings), 2), "median_us": round(statistics.median(timings), 2)}
+
+
+def get_api_argument(api: Callable) -> tuple[type[BaseModel] | None, bool]:
+    """
+    Определяет по аннотации первого аргумента *_api метода, что собирает высокоуровневый метод.
+
+    :param api: Метод клиента, например OperationsGatewayHTTPClient.make_fee_operation_api.
+    :return: Схема аргумента (None — аргументы передаются как есть) и признак тела запроса
+             (Schema | bytes — тело собирается RequestTemplate, иначе это схема query-параметров).
+    """
+    hints = get_type_hints(api)
+    hints.pop("return", None)
+    annotation = next(iter(hints.values()), None)
+
+    if get_origin(annotation) in (Union, types.UnionType):
+        (schema,) = [arg for arg in get_args(annotation) if arg is not bytes]
+        return schema, True
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+
+    return None, False
+
+
+def build_mock_transport(config: StandInConfig) -> MockTransport:
+    """
+    Транспорт httpx без сети: отвечает заранее сериализованными телами маршрутов заменителя gateway.
+    """
+    application = StandInHTTPApplication(config)
+
+    def handle(request: Request) -> Response:
+        route = application.match(request.method, request.url.path)
+        if route is None:
+            raise ValueError(f"Stand-in gateway has no route for {request.method} {request.url.path}")
+
+        return Response(200, headers=JSON_HEADERS, content=route.body)
+
+    return MockTransport(handle)
+
+
+def run_http_case(
+        timer: Timer,
+        plain_client: Client,
+        locust_client: Client,
+        client_class: type[HTTPClient],
+        method: str,
+        values: dict[str, str]
+) -> dict[str, dict[str, float]]:
+    """
+    Измеряет стадии запроса одного эндпоинта HTTP-клиента:
+
+    - build — сборка тела (RequestTemplate) или query-параметров, как в высокоуровневом методе;
+    - build_model и serialize_model — то же тело через Pydantic-модель и model_dump_json (для сравнения);
+    - send — *_api метод на httpx.Client без хуков (кодирование запроса, транспорт, чтение ответа);
+    - send_hooks — то же с event hooks Locust и регистрацией запроса в статистике;
+    - parse_full, parse_trusted, parse_ids — разбор тела ответа в каждом режиме HTTPDecodeMode;
+    - total — высокоуровневый метод клиента с хуками Locust, как его вызывает сценарий.
+    """
+    stages = {}
+    schema, is_body = get_api_argument(getattr(client_class, f"{method}_api"))
+    # Метод аннотирован как DecodedResponse[Schema] — схема ответа первая в объединении
+    response_schema = get_args(get_type_hints(getattr(client_class, method))["return"])[0]
+
+    if schema is None:
+        argument = None
+    elif is_body:
+        template = get_request_template(schema)
+        stages["build"] = timer.measure(lambda: template.render(**values))
+        stages["build_model"] = timer.measure(lambda: schema(**values))
+        model = schema(**values)
+        stages["serialize_model"] = timer.measure(lambda: model.model_dump_json(by_alias=True))
+        argument = template.render(**values)
+    else:
+        stages["build"] = timer.measure(lambda: schema(**values))
+        argument = schema(**values)
+
+    def send(client: HTTPClient) -> Response:
+        api = getattr(client, f"{method}_api")
+        return api(**values) if argument is None else api(argument)
+
+    plain = client_class(client=plain_client)
+    hooked = client_class(client=locust_client)
+    stages["send"] = timer.measure(lambda: send(plain))
+    stages["send_hooks"] = timer.measure(lambda: send(hooked))
+
+    content = send(plain).content
+    for mode in HTTPDecodeMode:
+        stages[f"parse_{mode}"] = timer.measure(lambda mode=mode: decode_response(content, response_schema, mode))
+
+    stages["total"] = timer.measure(lambda: getattr(hooked, method)(**values))
+    return stages
+
+
+def get_id_values(descriptor: Descriptor) -> dict[str, str]:
+    """
+    Возвращает значения строковых идентификаторов запроса (поля id и *_id).
+    """
+    return {
+        field.name: str(uuid.uuid4())
+        for field in descriptor.fields
+        if field.type == FieldDescriptor.TYPE_STRING and (field.name == "id" or field.name.endswith("_id"))
+    }
+
+
+def run_grpc_method(
+        timer: Timer,
+        plain_channel: Channel,
+        locust_channel: Channel,
+        path: str,
+        method_name: str,
+        descriptor
+) -> dict[str, dict[str, float]]:
+    """
+    Измеряет стадии вызова одного метода gRPC:
+
+    - build — сборка запроса фабрикой клиента (ProtoRequestFactory) или конструктором сообщения;
+    - serialize — SerializeToString запроса (выполняется stub-ом при вызове);
+    - call — вызов через канал без интерцептора (сериализация, транспорт, разбор ответа);
+    - call_interceptor — то же через WireSizeChannel и LocustInterceptor с регистрацией в статистике;
+    - parse — разбор ответа из байт (FromString);
+    - byte_size — ByteSize() ответа (размер ответа в интерцепторе без WireSizeChannel).
+    """
+    request_class = GetMessageClass(descriptor.input_type)
+    response_class = GetMessageClass(descriptor.output_type)
+    values = get_id_values(descriptor.input_type)
+
+    factory = GRPC_REQUEST_FACTORIES.get(method_name)
+    build = (lambda: factory.build(**values)) if factory is not None else (lambda: request_class(**values))
+
+    def get_call(channel: Channel):
+        return channel.unary_unary(
+            path,
+            request_serializer=request_class.SerializeToString,
+            response_deserializer=response_class.FromString
+        )
+
+    plain_call, locust_call = get_call(plain_channel), get_call(locust_channel)
+    request = build()
+
+    stages = {
+        "build": timer.measure(build),
+        "serialize": timer.measure(request.SerializeToString),
+        "call": timer.measure(lambda: plain_call(request)),
+        "call_interceptor": timer.measure(lambda: locust_call(request)),
+    }
+
+    response = plain_call(request)
+    payload = response.SerializeToString()
+    stages["parse"] = timer.measure(lambda: response_class.FromString(payload))
+    stages["byte_size"] = timer.measure(response.ByteSize)
+    return stages
+
+
+def normalize_case_name(name: str) -> str:
+    """
+    Приводит имя эндпоинта к виду для поиска: без регистра и подчёркиваний. Тогда make_fee
+    находит и HTTP-метод OperationsGatewayHTTPClient.make_fee_operation, и gRPC-метод .../MakeFeeOperation.
+    """
+    return name.replace("_", "").lower()
+
+
+def matches_case(pattern: str | None, name: str) -> bool:
+    return pattern is None or normalize_case_name(pattern) in normalize_case_name(name)
+
+
+def run_http(timer: Timer, config: StandInConfig, environment: Environment, pattern: str | None) -> dict:
+    transport = build_mock_transport(config)
+    plain_client = Client(base_url="http://stand-in", transport=transport)
+    locust_client = Client(
+        base_url="http://stand-in",
+        transport=transport,
+        event_hooks={
+            "request": [locust_request_event_hook],
+            "response": [locust_response_event_hook(environment)]
+        }
+    )
+
+    results = {}
+    for client_class, method, values in HTTP_CASES:
+        name = f"{client_class.__name__}.{method}"
+        if matches_case(pattern, name):
+            logger.info(f"HTTP {name}")
+            results[name] = run_http_case(timer, plain_client, locust_client, client_class, method, values)
+
+    return results
+
+
+def run_grpc(timer: Timer, config: StandInConfig, environment: Environment, pattern: str | None) -> dict:
+    server = build_standin_grpc_server(config)
+    server.start()
+    wait_for_ports([config.grpc_port])
+
+    address = f"{config.host}:{config.grpc_port}"
+    plain_channel = insecure_channel(address)
+    wire_channel = WireSizeChannel(insecure_channel(address))
+    locust_channel = intercept_channel(wire_channel, LocustInterceptor(environment, wire_channel=wire_channel))
+
+    results = {}
+    try:
+        for module in GATEWAY_SERVICE_MODULES:
+            for service in module.DESCRIPTOR.services_by_name.values():
+                for method in service.methods:
+                    path = f"/{service.full_name}/{method.name}"
+                    if matches_case(pattern, path):
+                        logger.info(f"gRPC {path}")
+                        results[path] = run_grpc_method(
+                            timer, plain_channel, locust_channel, path, method.name, method
+                        )
+    finally:
+        plain_channel.close()
+        wire_channel.close()
+        server.stop(grace=None).wait()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.micro",
+        description="Микробенчмарки стадий запроса HTTP- и gRPC-клиентов gateway"
+    )
+    parser.add_argument(
+        "-k", "--case",
+        help="Подстрока имени эндпоинта без учёта регистра и подчёркиваний: make_fee и MakeFee выбирают "
+             "OperationsGatewayHTTPClient.make_fee_operation и .../OperationsGatewayService/MakeFeeOperation"
+    )
+    parser.add_argument("--protocol", choices=["http", "grpc"], help="Измерять только один протокол")
+    parser.add_argument("--number", type=int, default=200, help="Вызовов в одной серии")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество серий")
+    parser.add_argument("--output", type=Path, help="Файл отчёта (JSON); по умолчанию — stdout")
+    args = parser.parse_args()
+
+    # Заменитель без задержек и ошибок: измеряется только сторона клиента
+    config = settings.standin.model_copy(update={
+        "grpc_port": get_free_port(),
+        "latency_distribution": StandInLatencyDistribution.CONSTANT,
+        "latency_ms": 0,
+        "latency_jitter_ms": 0,
+        "error_rate": 0,
+        "methods": {}
+    })
+    # Запросы регистрируются в статистике Locust так же, как в процессе генератора
+    environment = Environment()
+    environment.create_local_runner()
+
+    timer = Timer(number=args.number, repeat=args.repeat)
+    report = {
+        "environment": {
+            "python": f"{platform.python_implementation()} {platform.python_version()}",
+            "machine": platform.machine(),
+            "packages": {package: metadata.version(package) for package in PACKAGES},
+            "number": args.number,
+            "repeat": args.repeat,
+            "list_size": config.list_size,
+            "document_size": config.document_size,
+        },
+        "http": run_http(timer, config, environment, args.case) if args.protocol in (None, "http") else {},
+        "grpc": run_grpc(timer, config, environment, args.case) if args.protocol in (None, "grpc") else {},
+    }
+    environment.runner.quit()
+
+    for protocol in ("http", "grpc"):
+        if args.protocol in (None, protocol) and not report[protocol]:
+            logger.warning(f"No {protocol} endpoints match {args.case!r}")
+
+    content = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(content, encoding="utf-8")
+    else:
+        print(content, end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import socket
+import time
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_ports(ports: list[int], timeout: float = 30) -> None:
+    """
+    Ждёт, пока на localhost начнут принимать соединения все порты (например, заменителя gateway).
+
+    :param ports: Порты для проверки.
+    :param timeout: Общее время ожидания (в секундах).
+    """
+    deadline = time.monotonic() + timeout
+    for port in ports:
+        while True:
+            try:
+                socket.create_connection(("localhost", port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Stand-in gateway is not listening on port {port}")
+                time.sleep(0.1)
@@ -2,7 +2,7 @@
 import grpc.experimental.gevent as grpc_gevent
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
+from grpc import Channel, aio
 
 # Инициализируем поддержку gevent в gRPC.
 # Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
@@ -29,3 +29,21 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента.
+
+    Хранит асинхронный канал grpc.aio.Channel. Вызовы стабов, созданных поверх такого канала,
+    возвращают awaitable-объекты, поэтому все методы наследников являются корутинами.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал. Создаётся внутри запущенного event loop
+                        и переиспользуется всеми клиентами.
+        """
+        self.channel = channel
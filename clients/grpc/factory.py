@@ -0,0 +1,74 @@
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from google.protobuf.message import Message
+
+T = TypeVar("T", bound=Message)
+
+
+class ProtoRequestFactory(Generic[T]):
+    """
+    Фабрика protobuf-запросов для gRPC-клиентов.
+
+    Поля запроса делятся на три группы:
+    - постоянные — задаются при создании фабрики и хранятся в готовом сообщении-прототипе,
+      которое копируется в каждый новый запрос (CopyFrom) вместо повторной сборки;
+    - генерируемые — заполняются функциями-генераторами на каждый запрос (например, fake.amount);
+    - передаваемые — значения, переданные в build (card_id, account_id...), имеют приоритет над остальными.
+
+    Генераторы вызываются в момент сборки запроса, поэтому функции прокси fake
+    используют генератор текущего виртуального пользователя.
+    """
+
+    def __init__(
+            self,
+            message_type: type[T],
+            generators: dict[str, Callable[[], Any]] | None = None,
+            **fields: Any
+    ):
+        """
+        :param message_type: Класс protobuf-сообщения, например MakeTopUpOperationRequest.
+        :param generators: Генераторы значений скалярных полей: {"amount": fake.amount, ...}.
+        :param fields: Постоянные значения полей прототипа.
+        """
+        self.message_type = message_type
+        self.generators = tuple((generators or {}).items())
+
+        unknown = {name for name, _ in self.generators} - set(message_type.DESCRIPTOR.fields_by_name)
+        if unknown:
+            raise ValueError(f"{message_type.DESCRIPTOR.full_name}: unknown fields {sorted(unknown)}")
+
+        self.prototype = message_type(**fields)
+        # Пустой прототип копировать незачем: новое сообщение и так пустое
+        self.copy_prototype = self.prototype.ByteSize() > 0
+
+    def build(self, **values: Any) -> T:
+        """
+        Собирает запрос.
+
+        :param values: Значения скалярных полей запроса по их именам.
+        :return: Готовое protobuf-сообщение.
+        """
+        message = self.message_type()
+        if self.copy_prototype:
+            message.CopyFrom(self.prototype)
+
+        for name, generate in self.generators:
+            if name not in values:
+                setattr(message, name, generate())
+
+        for name, value in values.items():
+            setattr(message, name, value)
+
+        return message
+
+    def build_many(self, count: int, **values: Any) -> list[T]:
+        """
+        Собирает count запросов с общими переданными значениями полей;
+        генерируемые поля заполняются для каждого запроса заново.
+
+        :param count: Количество запросов.
+        :param values: Значения скалярных полей, общие для всех запросов.
+        :return: Список готовых protobuf-сообщений.
+        """
+        return [self.build(**values) for _ in range(count)]
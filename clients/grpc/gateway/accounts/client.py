@@ -1,3 +1,5 @@
+from collections.abc import Hashable
+
 from grpc import Channel
 from locust.env import Environment
 
@@ -113,7 +115,10 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     """
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
+def build_accounts_gateway_locust_grpc_client(
+        environment: Environment,
+        key: Hashable | None = None
+) -> AccountsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -121,6 +126,7 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для закрепления за каналом пула.
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment, key=key))
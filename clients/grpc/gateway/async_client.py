@@ -0,0 +1,18 @@
+from grpc import aio
+
+from config import settings
+
+
+# Модуль намеренно не импортирует Locust: при импорте Locust выполняет gevent monkey patching,
+# с которым grpc.aio не работает. Асинхронные клиенты используются вне Locust —
+# в сидинге и офлайн-инструментах.
+
+def build_gateway_async_grpc_client() -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Канал должен создаваться внутри запущенного event loop (например, в корутине asyncio.run).
+
+    :return: Асинхронный gRPC-канал (aio.Channel).
+    """
+    return aio.insecure_channel(settings.gateway_grpc_client.client_url)
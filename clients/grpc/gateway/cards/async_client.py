@@ -0,0 +1,74 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardResponse, IssueVirtualCardRequest
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest, IssuePhysicalCardResponse
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с CardsGatewayService.
+    Методы совпадают с CardsGatewayGRPCClient. Предоставляет высокоуровневые методы для выпуска карт.
+    """
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным асинхронным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя и ID акканта пользователя
+        :return: Ответ от сервиса с данными созданной виртуальной карты.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя и ID акканта пользователя
+        :return: Ответ от сервиса с данными созданной физической карты.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """
+        метод выпуска виртуальной карты
+
+        :param user_id: ID пользователя
+        :param account_id: ID аккаунта пользователя
+        :return: Ответ от сервиса с данными созданной виртуальной карты.
+        """
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """
+        метод выпуска физической карты
+
+        :param user_id: ID пользователя
+        :param account_id: ID аккаунта пользователя
+        :return: Ответ от сервиса с данными созданной физической карты.
+        """
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client() -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    Вызывается внутри запущенного event loop, так как создаёт grpc.aio канал.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
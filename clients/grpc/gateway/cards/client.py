@@ -1,3 +1,5 @@
+from collections.abc import Hashable
+
 from grpc import Channel
 from locust.env import Environment
 
@@ -72,7 +74,10 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     """
     return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
+def build_cards_gateway_locust_grpc_client(
+        environment: Environment,
+        key: Hashable | None = None
+) -> CardsGatewayGRPCClient:
     """
     Функция создаёт экземпляр CardsGatewayGRPCClient адаптированного под Locust.
 
@@ -80,6 +85,7 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для закрепления за каналом пула.
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment, key=key))
\ No newline at end of file
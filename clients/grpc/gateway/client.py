@@ -1,31 +1,142 @@
+from collections.abc import Hashable
+
 from grpc import Channel, insecure_channel, intercept_channel
+from clients.grpc.interceptors.deadline_interceptor import DeadlineInterceptor
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.pool import GRPCChannelPool, GRPCUserChannels
+from clients.grpc.wire import WireSizeChannel
 from locust.env import Environment
 from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("GRPC_CHANNEL_POOL")
+
+# Каждый канал пула открывает собственное соединение
+LOCUST_GRPC_POOL_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
 
-def build_gateway_grpc_client() -> Channel:
+def build_gateway_grpc_client(timeout: float | None = None) -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
+    :param timeout: Дедлайн вызовов в секундах, если он не передан в вызов явно (None — без дедлайна).
     :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
     """
     # Создаём небезопасное (без TLS) соединение с gRPC-сервером по адресу localhost:9003
-    return insecure_channel(settings.gateway_grpc_client.client_url)
+    channel = insecure_channel(settings.gateway_grpc_client.client_url)
+    if timeout is None:
+        return channel
+
+    return intercept_channel(channel, DeadlineInterceptor(timeout=timeout))
+
+def build_gateway_locust_grpc_channel(environment: Environment, own_connection: bool = False) -> Channel:
+    """
+    Создаёт новый gRPC-канал со встроенным интерцептором LocustInterceptor,
+    который регистрирует вызовы в системе метрик Locust.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :param own_connection: Открыть для канала собственное соединение. По умолчанию gRPC
+                           переиспользует одно TCP-соединение для всех каналов с одинаковыми
+                           адресом и параметрами.
+    :return: Новый gRPC-канал с интерцептором.
+    """
+    # Создаём обычный канал; обёртка запоминает размеры ответов на проводе для метрик
+    options = LOCUST_GRPC_POOL_CHANNEL_OPTIONS if own_connection else None
+    channel = WireSizeChannel(insecure_channel(settings.gateway_grpc_client.client_url, options=options))
+
+    # Создаём экземпляр интерцептора, передаём в него окружение Locust
+    locust_interceptor = LocustInterceptor(environment=environment, wire_channel=channel)
+
+    # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
+    return intercept_channel(channel, locust_interceptor)
+
+
+def get_gateway_locust_grpc_channel_pool(environment: Environment) -> GRPCChannelPool:
+    """
+    Возвращает общий на процесс пул gRPC-каналов, создавая его при первом обращении.
+
+    Пул хранится в окружении Locust (environment.grpc_channel_pool). Каждый канал пула открывает
+    собственное соединение. По завершении теста метрики по каждому каналу (пользователи, вызовы,
+    пиковое число стримов) пишутся в лог, чтобы можно было сравнить профиль "соединение на
+    пользователя" (POOL_SIZE не меньше числа пользователей) с мультиплексированным.
+    Каналы пула закрываются при завершении процесса Locust.
+
+    :param environment: Среда выполнения Locust.
+    :return: Пул gRPC-каналов.
+    """
+    pool: GRPCChannelPool | None = getattr(environment, "grpc_channel_pool", None)
+    if pool is not None:
+        return pool
 
-def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
+    pool = GRPCChannelPool(
+        size=settings.gateway_grpc_client.pool_size,
+        strategy=settings.gateway_grpc_client.pool_strategy,
+        channel_factory=lambda: build_gateway_locust_grpc_channel(environment, own_connection=True)
+    )
+    environment.grpc_channel_pool = pool
+
+    @environment.events.test_stop.add_listener
+    def log_grpc_channel_pool_metrics(**kwargs):
+        for metrics in pool.snapshot():
+            logger.info(
+                f"Channel {metrics['channel']}: peak_users={metrics['peak_users']}, calls={metrics['calls']}, "
+                f"peak_active_streams={metrics['peak_active_streams']}, connections={metrics['connections']}"
+            )
+
+    environment.events.quitting.add_listener(lambda **kwargs: pool.close())
+
+    return pool
+
+
+def get_gateway_locust_grpc_user_channels(environment: Environment) -> GRPCUserChannels:
+    """
+    Возвращает общий на процесс реестр каналов пользователей (без пула), создавая его при первом обращении.
+
+    Все клиенты одного пользователя работают через один канал. Как и без реестра, каналы
+    переиспользуют общее соединение gRPC с одинаковыми адресом и параметрами.
+
+    :param environment: Среда выполнения Locust.
+    :return: Реестр каналов пользователей.
+    """
+    channels: GRPCUserChannels | None = getattr(environment, "grpc_user_channels", None)
+    if channels is not None:
+        return channels
+
+    channels = GRPCUserChannels(channel_factory=lambda: build_gateway_locust_grpc_channel(environment))
+    environment.grpc_user_channels = channels
+    environment.events.quitting.add_listener(lambda **kwargs: channels.close())
+
+    return channels
+
+
+def build_gateway_locust_grpc_client(environment: Environment, key: Hashable | None = None) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Если включён пул каналов (GATEWAY_GRPC_CLIENT.POOL_SIZE > 0), возвращается канал из общего
+    пула, закреплённый за пользователем key. Без пула возвращается канал пользователя key,
+    общий для всех его клиентов.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :param key: Ключ виртуального пользователя. Если не передан, канал не закрепляется за
+                пользователем и освобождать его не нужно.
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
-    # Создаём экземпляр интерцептора, передаём в него окружение Locust
-    locust_interceptor = LocustInterceptor(environment=environment)
+    if settings.gateway_grpc_client.pool_size > 0:
+        return get_gateway_locust_grpc_channel_pool(environment).acquire(key)
 
-    # Создаём обычный канал
-    channel = insecure_channel(settings.gateway_grpc_client.client_url)
+    return get_gateway_locust_grpc_user_channels(environment).acquire(key)
 
-    # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
-    return intercept_channel(channel, locust_interceptor)
+
+def release_gateway_locust_grpc_client(environment: Environment, key: Hashable) -> None:
+    """
+    Освобождает канал пользователя: открепляет его от канала пула или, без пула, закрывает его канал.
+
+    :param environment: Среда выполнения Locust.
+    :param key: Ключ пользователя, переданный ранее в build_gateway_locust_grpc_client.
+    """
+    if settings.gateway_grpc_client.pool_size > 0:
+        get_gateway_locust_grpc_channel_pool(environment).release(key)
+    else:
+        get_gateway_locust_grpc_user_channels(environment).release(key)
@@ -0,0 +1,67 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client
+from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
+    GetContractDocumentRequest,
+    GetContractDocumentResponse
+)
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
+    GetTariffDocumentRequest,
+    GetTariffDocumentResponse
+)
+
+
+class AsyncDocumentsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с DocumentsGatewayService.
+    Методы совпадают с DocumentsGatewayGRPCClient. Предоставляет высокоуровневые методы для работы с документами.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным асинхронным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к DocumentsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = DocumentsGatewayServiceStub(channel)
+
+    async def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа тарифа.
+        """
+        return await self.stub.GetTariffDocument(request)
+
+    async def get_contract_document_api(self, request: GetContractDocumentRequest) -> GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа контракта.
+        """
+        return await self.stub.GetContractDocument(request)
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        request = GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        request = GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
+def build_documents_gateway_async_grpc_client() -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient.
+
+    Вызывается внутри запущенного event loop, так как создаёт grpc.aio канал.
+
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
@@ -1,3 +1,5 @@
+from collections.abc import Hashable
+
 from grpc import Channel
 from locust.env import Environment
 
@@ -65,7 +67,10 @@ def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
     """
     return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_documents_gateway_locust_grpc_client(environment: Environment) -> DocumentsGatewayGRPCClient:
+def build_documents_gateway_locust_grpc_client(
+        environment: Environment,
+        key: Hashable | None = None
+) -> DocumentsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -73,6 +78,7 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для закрепления за каналом пула.
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment, key=key))
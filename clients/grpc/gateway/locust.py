@@ -3,6 +3,7 @@ from locust import TaskSet, SequentialTaskSet
 # Импортируем типы и билдеры для построения HTTP API клиентов
 from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
 from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
+from clients.grpc.gateway.client import release_gateway_locust_grpc_client
 from clients.grpc.gateway.documents.client import (
     DocumentsGatewayGRPCClient,
     build_documents_gateway_locust_grpc_client
@@ -34,11 +35,20 @@ class GatewayGRPCTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Виртуальный пользователь — ключ канала: все пять клиентов одного пользователя
+        # работают через один канал (из пула, если он включён)
+        environment, key = self.user.environment, self.user
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(environment, key=key)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(environment, key=key)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(environment, key=key)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(environment, key=key)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(environment, key=key)
+
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке TaskSet: освобождает канал пользователя.
+        """
+        release_gateway_locust_grpc_client(self.user.environment, key=self.user)
 
 
 class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
@@ -58,8 +68,17 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Виртуальный пользователь — ключ канала: все пять клиентов одного пользователя
+        # работают через один канал (из пула, если он включён)
+        environment, key = self.user.environment, self.user
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(environment, key=key)
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(environment, key=key)
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(environment, key=key)
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(environment, key=key)
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(environment, key=key)
+
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке TaskSet: освобождает канал пользователя.
+        """
+        release_gateway_locust_grpc_client(self.user.environment, key=self.user)
@@ -0,0 +1,302 @@
+from grpc import aio
+
+from clients.grpc.client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client
+from clients.grpc.gateway.operations.factories import (
+    make_bill_payment_operation_request_factory,
+    make_cash_withdrawal_operation_request_factory,
+    make_cashback_operation_request_factory,
+    make_fee_operation_request_factory,
+    make_purchase_operation_request_factory,
+    make_top_up_operation_request_factory,
+    make_transfer_operation_request_factory
+)
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
+    GetOperationReceiptResponse,
+    GetOperationReceiptRequest
+)
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import (
+    GetOperationRequest,
+    GetOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (
+    MakeTopUpOperationResponse,
+    MakeTopUpOperationRequest
+)
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (
+    GetOperationsSummaryResponse,
+    GetOperationsSummaryRequest
+)
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+    MakeBillPaymentOperationRequest,
+    MakeBillPaymentOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (
+    MakePurchaseOperationRequest,
+    MakePurchaseOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (
+    MakeFeeOperationRequest,
+    MakeFeeOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationResponse,
+    MakeCashWithdrawalOperationRequest
+)
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import (
+    GetOperationsRequest,
+    GetOperationsResponse
+)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (
+    MakeTransferOperationRequest,
+    MakeTransferOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (
+    MakeCashbackOperationRequest,
+    MakeCashbackOperationResponse
+)
+
+
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с OperationGatewayService.
+    Методы совпадают с OperationsGatewayGRPCClient. Предоставляет высокоуровневые методы для работы с операциями.
+    """
+
+    def __init__(self, channel: aio.Channel):
+        """
+        Инициализация клиента с указанным асинхронным gRPC-каналом.
+
+        :param channel: Асинхронный gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """
+        Низкоуровневый вызов метода GetOperation через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными об операции с operation_id
+        """
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        """
+        Низкоуровневый вызов метода GetOperationReceipt через gRPC.
+
+        :param request: gRPC-запрос с ID операции.
+        :return: Ответ от сервиса с данными о чеке по операции с operation_id
+        """
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        """
+        Низкоуровневый вызов метода GetOperations через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта.
+        :return: Ответ от сервиса с данными списка операций для определённого счёта
+        """
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        """
+        Низкоуровневый вызов метода GetOperationsSummary через gRPC.
+
+        :param request: gRPC-запрос с ID аккаунта.
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.GetOperationsSummary(request)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeFeeOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTopUpOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashbackOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeTransferOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """
+        Низкоуровневый вызов метода MakePurchaseOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством, категорией
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequest) -> MakeBillPaymentOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeBillPaymentOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequest) -> MakeCashWithdrawalOperationResponse:
+        """
+        Низкоуровневый вызов метода MakeCashWithdrawalOperation через gRPC.
+
+        :param request: gRPC-запрос с ID карты, ID аккаунта, статусом, количеством
+        :return: Ответ от сервиса с данными об операции.
+        """
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    async def get_operation(self, operation_id) -> GetOperationResponse:
+        """
+        Высокоуровневый вызов метода GetOperation через gRPC
+
+        :param operation_id: строка, ID операции
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id) -> GetOperationReceiptResponse:
+        """
+        Высокоуровневый вызов метода GetOperationReceipt через gRPC
+
+        :param operation_id: строка, ID операции
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id) -> GetOperationsResponse:
+        """
+        Высокоуровневый вызов метода GetOperations через gRPC
+
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операциям
+        """
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id) -> GetOperationsSummaryResponse:
+        """
+        Высокоуровневый вызов метода GetOperationsSummary через gRPC
+
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса со сводкой по операциям
+        """
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id, account_id) -> MakeFeeOperationResponse:
+        """
+        Высокоуровневый вызов метода MakeFeeOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_fee_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation (self, card_id, account_id) -> MakeTopUpOperationResponse:
+        """
+        Высокоуровневый вызов метода MakeTopUpOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_top_up_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(self, card_id, account_id) -> MakeCashbackOperationResponse:
+        """
+        Высокоуровневый вызов метода MakeCashbackOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_cashback_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(self, card_id, account_id) -> MakeTransferOperationResponse:
+        """
+        Высокоуровневый вызов метода MakeTransferOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_transfer_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id, account_id) -> MakePurchaseOperationResponse:
+        """
+        Высокоуровневый вызов метода MakePurchaseOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_purchase_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(self, card_id, account_id) -> MakeBillPaymentOperationResponse:
+        """
+        Высокоуровневый вызов метода MakeBillPaymentOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_bill_payment_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id, account_id) -> MakeCashWithdrawalOperationResponse:
+        """
+        Высокоуровневый вызов метода MakeCashWithdrawalOperation через gRPC
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервиса с данными об операции.
+        """
+        request = make_cash_withdrawal_operation_request_factory.build(card_id=card_id, account_id=account_id)
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_async_grpc_client() -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+
+    Вызывается внутри запущенного event loop, так как создаёт grpc.aio канал.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
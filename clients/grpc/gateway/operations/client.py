@@ -1,11 +1,19 @@
+from collections.abc import Hashable
+
 from grpc import Channel
 from locust.env import Environment
 
-from contracts.services.operations.operation_pb2 import OperationStatus
-from tools.fakers import fake
-
 from clients.grpc.client import GRPCClient
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.operations.factories import (
+    make_bill_payment_operation_request_factory,
+    make_cash_withdrawal_operation_request_factory,
+    make_cashback_operation_request_factory,
+    make_fee_operation_request_factory,
+    make_purchase_operation_request_factory,
+    make_top_up_operation_request_factory,
+    make_transfer_operation_request_factory
+)
 from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
 from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
     GetOperationReceiptResponse,
@@ -216,10 +224,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakeFeeOperationRequest(card_id=card_id,
-                                          account_id=account_id,
-                                          amount=fake.amount(),
-                                          status=fake.proto_enum(OperationStatus))
+        request = make_fee_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_fee_operation_api(request)
 
     def make_top_up_operation (self, card_id, account_id) -> MakeTopUpOperationResponse:
@@ -230,10 +235,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakeTopUpOperationRequest(card_id=card_id,
-                                            account_id=account_id,
-                                            amount=fake.amount(),
-                                            status=fake.proto_enum(OperationStatus))
+        request = make_top_up_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_top_up_operation_api(request)
 
     def make_cashback_operation(self, card_id, account_id) -> MakeCashbackOperationResponse:
@@ -244,10 +246,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakeCashbackOperationRequest(card_id=card_id,
-                                               account_id=account_id,
-                                               amount=fake.amount(),
-                                               status=fake.proto_enum(OperationStatus))
+        request = make_cashback_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_cashback_operation_api(request)
 
     def make_transfer_operation(self, card_id, account_id) -> MakeTransferOperationResponse:
@@ -258,10 +257,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakeTransferOperationRequest(card_id=card_id,
-                                               account_id=account_id,
-                                               amount=fake.amount(),
-                                               status=fake.proto_enum(OperationStatus))
+        request = make_transfer_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_transfer_operation_api(request)
 
     def make_purchase_operation(self, card_id, account_id) -> MakePurchaseOperationResponse:
@@ -272,11 +268,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakePurchaseOperationRequest(card_id=card_id,
-                                               account_id=account_id,
-                                               amount=fake.amount(),
-                                               status=fake.proto_enum(OperationStatus),
-                                               category=fake.category())
+        request = make_purchase_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_purchase_operation_api(request)
 
     def make_bill_payment_operation(self, card_id, account_id) -> MakeBillPaymentOperationResponse:
@@ -287,10 +279,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakeBillPaymentOperationRequest(card_id=card_id,
-                                                  account_id=account_id,
-                                                  amount=fake.amount(),
-                                                  status=fake.proto_enum(OperationStatus))
+        request = make_bill_payment_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_bill_payment_operation_api(request)
 
     def make_cash_withdrawal_operation(self, card_id, account_id) -> MakeCashWithdrawalOperationResponse:
@@ -301,10 +290,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервиса с данными об операции.
         """
-        request = MakeCashWithdrawalOperationRequest(card_id=card_id,
-                                                     account_id=account_id,
-                                                     amount=fake.amount(),
-                                                     status=fake.proto_enum(OperationStatus))
+        request = make_cash_withdrawal_operation_request_factory.build(card_id=card_id, account_id=account_id)
         return self.make_cash_withdrawal_operation_api(request)
 
 
@@ -316,7 +302,10 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     """
     return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
-def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
+def build_operations_gateway_locust_grpc_client(
+        environment: Environment,
+        key: Hashable | None = None
+) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -324,6 +313,7 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для закрепления за каналом пула.
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment, key=key))
@@ -0,0 +1,50 @@
+from functools import partial
+
+from clients.grpc.factory import ProtoRequestFactory
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import MakeBillPaymentOperationRequest
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest
+)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import MakeCashbackOperationRequest
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import MakeFeeOperationRequest
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationRequest
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationRequest
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationRequest
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+# Случайные сумма и статус — общие поля всех запросов на создание операции;
+# card_id и account_id передаются при сборке запроса
+OPERATION_GENERATORS = {
+    "amount": fake.amount,
+    "status": partial(fake.proto_enum, OperationStatus)
+}
+
+make_fee_operation_request_factory = ProtoRequestFactory(
+    MakeFeeOperationRequest,
+    OPERATION_GENERATORS
+)
+make_top_up_operation_request_factory = ProtoRequestFactory(
+    MakeTopUpOperationRequest,
+    OPERATION_GENERATORS
+)
+make_cashback_operation_request_factory = ProtoRequestFactory(
+    MakeCashbackOperationRequest,
+    OPERATION_GENERATORS
+)
+make_transfer_operation_request_factory = ProtoRequestFactory(
+    MakeTransferOperationRequest,
+    OPERATION_GENERATORS
+)
+make_purchase_operation_request_factory = ProtoRequestFactory(
+    MakePurchaseOperationRequest,
+    {**OPERATION_GENERATORS, "category": fake.category}
+)
+make_bill_payment_operation_request_factory = ProtoRequestFactory(
+    MakeBillPaymentOperationRequest,
+    OPERATION_GENERATORS
+)
+make_cash_withdrawal_operation_request_factory = ProtoRequestFactory(
+    MakeCashWithdrawalOperationRequest,
+    OPERATION_GENERATORS
+)
@@ -1,3 +1,5 @@
+from collections.abc import Hashable
+
 from grpc import Channel
 
 from clients.grpc.client import GRPCClient
@@ -5,7 +7,7 @@ from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
 from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
 from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
-from tools.fakers import fake
+from clients.grpc.gateway.users.factories import create_user_request_factory
 
 from locust.env import Environment
 
@@ -60,13 +62,7 @@ class UsersGatewayGRPCClient(GRPCClient):
 
         :return: Ответ с информацией о созданном пользователе.
         """
-        request = CreateUserRequest(
-            email=fake.email(),
-            last_name=fake.last_name(),
-            first_name=fake.first_name(),
-            middle_name=fake.middle_name(),
-            phone_number=fake.phone_number()
-        )
+        request = create_user_request_factory.build()
         return self.create_user_api(request)
 
 
@@ -79,7 +75,10 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
+def build_users_gateway_locust_grpc_client(
+        environment: Environment,
+        key: Hashable | None = None
+) -> UsersGatewayGRPCClient:
     """
     Функция создаёт экземпляр UsersGatewayGRPCClient адаптированного под Locust.
 
@@ -87,6 +86,7 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для закрепления за каналом пула.
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment, key=key))
@@ -0,0 +1,14 @@
+from clients.grpc.factory import ProtoRequestFactory
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest
+from tools.fakers import fake
+
+create_user_request_factory = ProtoRequestFactory(
+    CreateUserRequest,
+    {
+        "email": fake.email,
+        "last_name": fake.last_name,
+        "first_name": fake.first_name,
+        "middle_name": fake.middle_name,
+        "phone_number": fake.phone_number
+    }
+)
@@ -0,0 +1,54 @@
+from grpc import (
+    ClientCallDetails,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor
+)
+
+
+class DeadlineClientCallDetails(ClientCallDetails):
+    """
+    Детали вызова с заданным таймаутом; остальные поля копируются из исходных деталей.
+    """
+
+    def __init__(self, details: ClientCallDetails, timeout: float):
+        self.method = details.method
+        self.timeout = timeout
+        self.metadata = details.metadata
+        self.credentials = details.credentials
+        self.wait_for_ready = getattr(details, "wait_for_ready", None)
+        self.compression = getattr(details, "compression", None)
+
+
+class DeadlineInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor
+):
+    """
+    gRPC-интерцептор, задающий дедлайн вызовам, для которых он не передан явно.
+
+    Без дедлайна зависший вызов (сервер принял запрос, но не отвечает) блокирует вызывающий код
+    навсегда. С дедлайном вызов завершается ошибкой DEADLINE_EXCEEDED и может быть повторён.
+    """
+
+    def __init__(self, timeout: float):
+        """
+        :param timeout: Дедлайн вызова в секундах.
+        """
+        self.timeout = timeout
+
+    def get_call_details(self, client_call_details: ClientCallDetails) -> ClientCallDetails:
+        if client_call_details.timeout is not None:
+            return client_call_details
+
+        return DeadlineClientCallDetails(client_call_details, self.timeout)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(self.get_call_details(client_call_details), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self.get_call_details(client_call_details), request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return continuation(self.get_call_details(client_call_details), request_iterator)
@@ -1,20 +1,118 @@
 import time
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
+from grpc import (
+    Call,
+    Future,
+    RpcError,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor
+)
 from locust.env import Environment
 
+from clients.grpc.wire import WireSizeChannel
+from tools.locust.metrics import get_request_metrics_emitter
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+
+class LocustStreamCall:
+    """
+    Обёртка над unary-stream вызовом: суммирует размер сообщений по мере чтения стрима
+    и регистрирует вызов в Locust, когда стрим вычитан до конца или завершился ошибкой.
+
+    Все остальные атрибуты (code, details, cancel, add_done_callback и т.д.)
+    делегируются исходному вызову.
+    """
+
+    def __init__(self, interceptor: "LocustInterceptor", call, method: str, start_time: float):
+        self._interceptor = interceptor
+        self._call = call
+        self._method = method
+        self._start_time = start_time
+        self._response_length = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            message = next(self._call)
+        except StopIteration:
+            self._interceptor.fire(self._method, self._start_time, self._call, None, self._response_length)
+            raise
+        except RpcError as error:
+            self._interceptor.fire(self._method, self._start_time, self._call, error, self._response_length)
+            raise
+
+        self._response_length += self._interceptor.get_response_length(message)
+        return message
+
+    def __getattr__(self, name: str):
+        return getattr(self._call, name)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Интерцептор не блокируется на результате вызова: метрика регистрируется в done-callback,
+    поэтому вызовы через .future() не теряют асинхронности и один пользователь может
+    выполнять несколько запросов параллельно. Размер ответа берётся из байт, полученных
+    по сети (WireSizeChannel), а не повторной сериализацией сообщения.
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: Environment, wire_channel: WireSizeChannel | None = None):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param wire_channel: Канал, запоминающий размеры ответов на проводе. Если не передан,
+                             размер ответа вычисляется через ByteSize().
         """
         self.environment = environment
+        self.wire_channel = wire_channel
+        self.emitter = get_request_metrics_emitter(environment)
+
+    def get_response_length(self, message) -> int:
+        """
+        Возвращает размер сообщения ответа в байтах.
+        """
+        if self.wire_channel is not None:
+            return self.wire_channel.pop_size(message)
+
+        return message.ByteSize()
+
+    def fire(self, method: str, start_time: float, response, exception: BaseException | None, response_length: int):
+        """
+        Регистрирует вызов в системе метрик Locust через emitter метрик процесса.
+        """
+        self.emitter.emit(
+            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
+            name=method,  # Имя метода (например, "/users.UsersService/CreateUser")
+            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
+            response_length=response_length,  # Размер ответа в байтах
+            exception=exception,  # Если произошла ошибка — передаём её сюда
+            response=response,  # Объект ответа (если нужен для контекста)
+        )
+
+    def _intercept_unary_response(self, continuation, client_call_details, request):
+        start_time = time.perf_counter()  # Засекаем время начала запроса
+
+        # Для блокирующих вызовов continuation возвращает уже завершённый future (или RpcError),
+        # для .future() — выполняющийся. В обоих случаях метрика регистрируется по завершении.
+        call: Future = continuation(client_call_details, request)
+
+        def on_done(future: Future):
+            exception = future.exception()
+            response_length = 0 if exception is not None else self.get_response_length(future.result())
+            self.fire(client_call_details.method, start_time, future, exception, response_length)
+
+        call.add_done_callback(on_done)
+
+        # Возвращаем результат вызова (future-объект)
+        return call
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,31 +123,31 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
-        start_time = time.perf_counter()  # Засекаем время начала запроса
-        response_length = 0
+        return self._intercept_unary_response(continuation, client_call_details, request)
 
-        try:
-            # Выполняем gRPC вызов и получаем response future
-            response = continuation(client_call_details, request)
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов.
 
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
-            exception = error
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса.
+        :param request_iterator: Итератор сообщений запроса.
+        :return: gRPC response (future объект).
+        """
+        return self._intercept_unary_response(continuation, client_call_details, request_iterator)
 
-        # Регистрируем вызов в системе метрик Locust
-        self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
-            exception=exception,  # Если произошла ошибка — передаём её сюда
-            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
-            response_length=response_length,  # Размер ответа в байтах
-        )
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов.
 
-        # Возвращаем результат вызова (future-объект)
-        return response
+        Время вызова — от отправки запроса до окончания чтения стрима,
+        размер ответа — сумма размеров всех сообщений стрима.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса.
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Итератор сообщений ответа с интерфейсом gRPC Call.
+        """
+        start_time = time.perf_counter()
+        call: Call = continuation(client_call_details, request)
+        return LocustStreamCall(self, call, client_call_details.method, start_time)
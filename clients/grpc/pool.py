@@ -0,0 +1,260 @@
+import itertools
+import threading
+from collections.abc import Callable, Hashable
+
+from grpc import (
+    Channel,
+    ChannelConnectivity,
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    intercept_channel
+)
+
+from tools.config.grpc import GRPCChannelPoolStrategy
+
+
+class GRPCChannelSlot:
+    """
+    Один канал (одно HTTP/2 соединение) в пуле и его счётчики.
+
+    Соединения считаются по состоянию канала: каждый переход в READY — установленное
+    TCP/HTTP/2 соединение (в том числе переподключение после обрыва). Канал должен
+    создаваться с локальным пулом подканалов (grpc.use_local_subchannel_pool), иначе
+    каналы с одинаковыми параметрами делят одно соединение и счётчики не совпадут с сетью.
+
+    Attributes:
+        index: Порядковый номер канала в пуле.
+        channel: gRPC-канал, который получают клиенты.
+        users: Сколько виртуальных пользователей сейчас закреплено за каналом.
+        peak_users: Максимальное число пользователей, одновременно закреплённых за каналом.
+        active_streams: Сколько вызовов (HTTP/2 стримов) выполняется в канале прямо сейчас.
+        peak_active_streams: Максимальное число одновременных стримов за время теста.
+        calls: Общее число вызовов, прошедших через канал.
+        connections: Сколько раз канал установил соединение.
+        connected: Соединение канала сейчас установлено.
+    """
+
+    def __init__(self, index: int, channel_factory: Callable[[], Channel]):
+        self.index = index
+        self.users = 0
+        self.peak_users = 0
+        self.calls = 0
+        self.active_streams = 0
+        self.peak_active_streams = 0
+        self.connections = 0
+        self.connected = False
+        self.lock = threading.Lock()
+        self.channel = intercept_channel(channel_factory(), GRPCChannelSlotInterceptor(self))
+        self.channel.subscribe(self.on_connectivity_changed, try_to_connect=False)
+
+    def on_connectivity_changed(self, state: ChannelConnectivity) -> None:
+        with self.lock:
+            if state == ChannelConnectivity.READY and not self.connected:
+                self.connections += 1
+
+            self.connected = state == ChannelConnectivity.READY
+
+    def on_call_started(self) -> None:
+        with self.lock:
+            self.calls += 1
+            self.active_streams += 1
+            self.peak_active_streams = max(self.peak_active_streams, self.active_streams)
+
+    def on_call_finished(self) -> None:
+        with self.lock:
+            self.active_streams -= 1
+
+
+class GRPCChannelSlotInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor
+):
+    """
+    Интерцептор, который считает активные стримы в канале пула.
+    Стрим считается завершённым, когда вызов перешёл в состояние done.
+    """
+
+    def __init__(self, slot: GRPCChannelSlot):
+        self.slot = slot
+
+    def _intercept(self, continuation, client_call_details, request):
+        self.slot.on_call_started()
+        try:
+            call = continuation(client_call_details, request)
+        except Exception:
+            self.slot.on_call_finished()
+            raise
+
+        call.add_done_callback(lambda _: self.slot.on_call_finished())
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return self._intercept(continuation, client_call_details, request_iterator)
+
+
+class GRPCChannelPool:
+    """
+    Общий на процесс пул gRPC-каналов.
+
+    Вместо отдельного канала на каждый клиент каждого виртуального пользователя
+    все пользователи мультиплексируются поверх pool_size HTTP/2 соединений.
+    Все клиенты одного пользователя (ключа) получают один и тот же канал.
+    """
+
+    def __init__(
+            self,
+            size: int,
+            strategy: GRPCChannelPoolStrategy,
+            channel_factory: Callable[[], Channel]
+    ):
+        """
+        :param size: Количество каналов в пуле.
+        :param strategy: Стратегия назначения пользователей на каналы.
+        :param channel_factory: Функция, создающая новый канал (например, с LocustInterceptor).
+        """
+        self.size = size
+        self.strategy = strategy
+        self.slots = [GRPCChannelSlot(index=index, channel_factory=channel_factory) for index in range(size)]
+
+        self._lock = threading.Lock()
+        self._round_robin = itertools.cycle(range(size))
+        # Ключ пользователя -> (номер канала, количество выданных этому ключу клиентов)
+        self._assignments: dict[Hashable, tuple[int, int]] = {}
+
+    def _select_slot(self, key: Hashable) -> GRPCChannelSlot:
+        match self.strategy:
+            case GRPCChannelPoolStrategy.STICKY:
+                return self.slots[hash(key) % self.size]
+            case GRPCChannelPoolStrategy.LEAST_LOADED:
+                return min(self.slots, key=lambda slot: (slot.users, slot.active_streams))
+            case _:
+                return self.slots[next(self._round_robin)]
+
+    def acquire(self, key: Hashable | None = None) -> Channel:
+        """
+        Возвращает канал для пользователя.
+
+        :param key: Ключ пользователя (например, объект Locust User).
+                    Если не передан, канал выбирается для каждого вызова отдельно и не закрепляется
+                    (освобождать нечего).
+        :return: gRPC-канал из пула.
+        """
+        with self._lock:
+            if key is None:
+                return self._select_slot(object()).channel
+
+            if key in self._assignments:
+                index, clients = self._assignments[key]
+                self._assignments[key] = (index, clients + 1)
+                return self.slots[index].channel
+
+            slot = self._select_slot(key)
+            slot.users += 1
+            slot.peak_users = max(slot.peak_users, slot.users)
+            self._assignments[key] = (slot.index, 1)
+            return slot.channel
+
+    def release(self, key: Hashable) -> None:
+        """
+        Открепляет пользователя от канала. Сам канал остаётся открытым для других пользователей.
+
+        :param key: Ключ пользователя, переданный ранее в acquire.
+        """
+        with self._lock:
+            if key not in self._assignments:
+                return
+
+            index, _ = self._assignments.pop(key)
+            self.slots[index].users -= 1
+
+    def close(self) -> None:
+        """
+        Закрывает все каналы пула.
+        """
+        for slot in self.slots:
+            slot.channel.close()
+
+    def snapshot(self) -> list[dict[str, int]]:
+        """
+        Возвращает метрики по каждому каналу пула: число пользователей, стримов и установленных соединений.
+
+        :return: Список словарей, по одному на канал.
+        """
+        return [
+            {
+                "channel": slot.index,
+                "users": slot.users,
+                "peak_users": slot.peak_users,
+                "calls": slot.calls,
+                "active_streams": slot.active_streams,
+                "peak_active_streams": slot.peak_active_streams,
+                "connections": slot.connections,
+                "connected": int(slot.connected),
+            }
+            for slot in self.slots
+        ]
+
+
+class GRPCUserChannels:
+    """
+    Каналы без пула: по одному каналу на виртуального пользователя, общему для всех его клиентов.
+
+    Канал закрывается, когда пользователь останавливается (release), поэтому пользователи,
+    которые останавливаются и запускаются заново, не оставляют открытых каналов.
+    """
+
+    def __init__(self, channel_factory: Callable[[], Channel]):
+        """
+        :param channel_factory: Функция, создающая новый канал (например, с LocustInterceptor).
+        """
+        self.channel_factory = channel_factory
+        self._lock = threading.Lock()
+        self._channels: dict[Hashable, Channel] = {}
+
+    def acquire(self, key: Hashable | None = None) -> Channel:
+        """
+        Возвращает канал пользователя, создавая его при первом обращении.
+
+        :param key: Ключ пользователя. Если не передан, создаётся отдельный канал,
+                    который закрывает вызывающий код.
+        :return: gRPC-канал.
+        """
+        if key is None:
+            return self.channel_factory()
+
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._channels[key] = self.channel_factory()
+
+            return channel
+
+    def release(self, key: Hashable) -> None:
+        """
+        Закрывает канал пользователя.
+
+        :param key: Ключ пользователя, переданный ранее в acquire.
+        """
+        with self._lock:
+            channel = self._channels.pop(key, None)
+
+        if channel is not None:
+            channel.close()
+
+    def close(self) -> None:
+        """
+        Закрывает каналы всех пользователей.
+        """
+        with self._lock:
+            channels, self._channels = list(self._channels.values()), {}
+
+        for channel in channels:
+            channel.close()
@@ -0,0 +1,91 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from grpc import Channel
+
+# Сколько размеров, ещё не забранных интерцептором, хранит канал. Обычно размер забирается
+# сразу после разбора сообщения; непрочитанные (например, у отменённого стрима) вытесняются
+# начиная с самых старых, чтобы словарь не рос бесконечно
+MAX_PENDING_SIZES = 1024
+
+
+class WireSizeChannel(Channel):
+    """
+    Обёртка над gRPC-каналом, которая запоминает размер ответа "на проводе".
+
+    Десериализатор ответа каждого метода оборачивается: перед разбором сообщения
+    запоминается длина полученных байт. Размер сохраняется по id разобранного сообщения
+    вместе с самим сообщением и забирается интерцептором (pop_size). Пока запись хранит
+    ссылку на сообщение, его id не может достаться другому объекту, поэтому чужой размер
+    не вернётся; незабранные записи вытесняются (MAX_PENDING_SIZES). Это избавляет
+    от повторной сериализации ответа ради ByteSize().
+
+    Оборачиваются только unary-unary, unary-stream и stream-unary методы — именно их
+    обрабатывает LocustInterceptor; для остальных размеры некому забирать.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        :param channel: Исходный gRPC-канал.
+        """
+        self.channel = channel
+        # id сообщения -> (сообщение, размер на проводе)
+        self.sizes: dict[int, tuple[Any, int]] = {}
+        self.lock = threading.Lock()
+
+    def _wrap(self, deserializer: Callable[[bytes], Any] | None) -> Callable[[bytes], Any]:
+        def deserialize(data: bytes) -> Any:
+            message = deserializer(data) if deserializer is not None else data
+            with self.lock:
+                self.sizes[id(message)] = (message, len(data))
+                if len(self.sizes) > MAX_PENDING_SIZES:
+                    # Словарь упорядочен по вставке — вытесняем самую старую запись
+                    del self.sizes[next(iter(self.sizes))]
+
+            return message
+
+        return deserialize
+
+    def pop_size(self, message: Any) -> int:
+        """
+        Возвращает и забывает размер сообщения на проводе.
+
+        :param message: Разобранное сообщение ответа.
+        :return: Размер сообщения в байтах (0, если размер неизвестен).
+        """
+        with self.lock:
+            entry = self.sizes.pop(id(message), None)
+
+        if entry is None or entry[0] is not message:
+            return 0
+
+        return entry[1]
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.unary_unary(method, request_serializer, self._wrap(response_deserializer), *args, **kwargs)
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.unary_stream(method, request_serializer, self._wrap(response_deserializer), *args, **kwargs)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.stream_unary(method, request_serializer, self._wrap(response_deserializer), *args, **kwargs)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        return self.channel.stream_stream(method, request_serializer, response_deserializer, *args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
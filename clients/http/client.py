@@ -1,6 +1,13 @@
 from typing import Any, TypedDict
 
-from httpx import Client, Response, QueryParams, URL
+from httpx import AsyncClient, Client, Response, QueryParams, URL
+
+from clients.http.decoding import DecodedResponse, T, decode_response
+from tools.config.http import HTTPDecodeMode
+
+
+# Заголовки запроса с готовым JSON-телом (при json= их выставляет httpx)
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 # Тип расширений, которые можно передать в запрос
@@ -14,10 +21,22 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param decode_mode: режим декодирования ответов в высокоуровневых методах (см. HTTPDecodeMode)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, decode_mode: HTTPDecodeMode = HTTPDecodeMode.FULL) -> None:
         self.client = client
+        self.decode_mode = decode_mode
+
+    def decode(self, response: Response, schema: type[T]) -> DecodedResponse[T]:
+        """
+        Разбирает JSON-ответ согласно режиму декодирования клиента.
+
+        :param response: Объект Response.
+        :param schema: Схема ответа.
+        :return: Модель схемы (full), представление без валидации (trusted) или модель только с идентификаторами (ids).
+        """
+        return decode_response(response.content, schema, self.decode_mode)
 
     def get(
             self,
@@ -39,7 +58,8 @@ class HTTPClient:
             self,
             url: str | URL,
             json: Any | None = None,
-            extensions: HTTPClientExtensions | None = None  # Поддержка extensions для POST-запросов
+            extensions: HTTPClientExtensions | None = None,  # Поддержка extensions для POST-запросов
+            content: bytes | None = None
     ) -> Response:
         """
         Выполняет POST-запрос.
@@ -47,6 +67,73 @@ class HTTPClient:
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :param content: Готовое тело JSON в байтах (например, из RequestTemplate) — отправляется без сериализации.
         :return: Объект Response с данными ответа.
         """
+        if content is not None:
+            return self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+
+class AsyncHTTPClient:
+    """
+    Асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Повторяет интерфейс HTTPClient, но все методы являются корутинами.
+    Позволяет держать тысячи запросов "в полёте" в одном процессе (например, при сидинге).
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param decode_mode: режим декодирования ответов в высокоуровневых методах (см. HTTPDecodeMode)
+    """
+
+    def __init__(self, client: AsyncClient, decode_mode: HTTPDecodeMode = HTTPDecodeMode.FULL) -> None:
+        self.client = client
+        self.decode_mode = decode_mode
+
+    def decode(self, response: Response, schema: type[T]) -> DecodedResponse[T]:
+        """
+        Разбирает JSON-ответ согласно режиму декодирования клиента.
+
+        :param response: Объект Response.
+        :param schema: Схема ответа.
+        :return: Модель схемы (full), представление без валидации (trusted) или модель только с идентификаторами (ids).
+        """
+        return decode_response(response.content, schema, self.decode_mode)
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url=url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None,
+            content: bytes | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :param content: Готовое тело JSON в байтах (например, из RequestTemplate) — отправляется без сериализации.
+        :return: Объект Response с данными ответа.
+        """
+        if content is not None:
+            return await self.client.post(url=url, content=content, headers=JSON_HEADERS, extensions=extensions)
+
+        return await self.client.post(url=url, json=json, extensions=extensions)
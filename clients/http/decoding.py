@@ -0,0 +1,176 @@
+import types
+from collections.abc import Sequence
+from functools import cache
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field, create_model
+from pydantic_core import from_json
+
+from tools.config.http import HTTPDecodeMode
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def get_model_type(annotation: Any) -> type[BaseModel] | None:
+    """
+    Возвращает вложенную модель из аннотации поля (Model или Model | None), иначе None.
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        models = [get_model_type(arg) for arg in get_args(annotation)]
+        return next((model for model in models if model is not None), None)
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+def get_list_model_type(annotation: Any) -> type[BaseModel] | None:
+    """
+    Возвращает модель элементов из аннотации list[Model], иначе None.
+    """
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation)
+        return get_model_type(item)
+
+    return None
+
+
+def is_id_field(name: str) -> bool:
+    return name == "id" or name.endswith("_id")
+
+
+@cache
+def get_ids_schema(schema: type[BaseModel]) -> type[BaseModel]:
+    """
+    Строит по схеме ответа облегчённую схему, в которой остаются только идентификаторы
+    (поля id и *_id) и вложенные модели, в которых они лежат. Остальные поля ответа
+    (даты, перечисления, суммы) при валидации пропускаются без разбора.
+
+    :param schema: Схема ответа, например GetOperationsResponseSchema.
+    :return: Схема с тем же именованием полей и алиасами, содержащая только идентификаторы.
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        if model := get_model_type(field.annotation):
+            annotation = get_ids_schema(model)
+        elif model := get_list_model_type(field.annotation):
+            annotation = list[get_ids_schema(model)]
+        elif is_id_field(name):
+            annotation = field.annotation
+        else:
+            continue
+
+        fields[name] = (annotation, Field(alias=field.alias) if field.alias else ...)
+
+    return create_model(f"{schema.__name__}Ids", __base__=BaseModel, **fields)
+
+
+class TrustedList(Sequence):
+    """
+    Список из ответа без валидации: элементы-модели оборачиваются в TrustedModel при обращении.
+    """
+
+    __slots__ = ("_items", "_schema")
+
+    def __init__(self, items: list, schema: type[BaseModel]):
+        self._items = items
+        self._schema = schema
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TrustedModel(item, self._schema) for item in self._items[index]]
+
+        return TrustedModel(self._items[index], self._schema)
+
+    def __repr__(self) -> str:
+        return f"TrustedList({self._schema.__name__}, len={len(self)})"
+
+
+@cache
+def get_trusted_fields(schema: type[BaseModel]) -> dict[str, tuple[str, type[BaseModel] | None, bool]]:
+    """
+    Возвращает для каждого поля схемы ключ в JSON (алиас), вложенную модель и признак списка моделей.
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        key = field.alias or name
+        if model := get_model_type(field.annotation):
+            fields[name] = (key, model, False)
+        elif model := get_list_model_type(field.annotation):
+            fields[name] = (key, model, True)
+        else:
+            fields[name] = (key, None, False)
+
+    return fields
+
+
+class TrustedModel:
+    """
+    Представление ответа без валидации: JSON разбирается в словари, а атрибуты схемы
+    читаются из них по алиасам только при обращении (результат запоминается).
+
+    Значения возвращаются в том виде, в котором пришли в JSON: даты — строками,
+    перечисления — строками, числа — int/float. Вложенные модели и списки моделей
+    оборачиваются в TrustedModel/TrustedList, поэтому обращения вида
+    response.account.cards[0].id работают так же, как с моделью.
+    """
+
+    def __init__(self, data: dict, schema: type[BaseModel]):
+        self._data = data
+        self._schema = schema
+
+    def __getattr__(self, name: str) -> Any:
+        # Служебные атрибуты не являются полями схемы. Без этой проверки copy и pickle, создающие
+        # объект без __init__, рекурсивно ищут _schema через __getattr__
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        fields = get_trusted_fields(self._schema)
+        if name not in fields:
+            raise AttributeError(f"{self._schema.__name__!r} has no field {name!r}")
+
+        key, model, is_list = fields[name]
+        value = self._data[key]
+        if model is not None and value is not None:
+            value = TrustedList(value, model) if is_list else TrustedModel(value, model)
+
+        setattr(self, name, value)
+        return value
+
+    def to_model(self) -> BaseModel:
+        """
+        Выполняет полную валидацию представления и возвращает модель схемы.
+        """
+        return self._schema.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"Trusted{self._schema.__name__}({self._data!r})"
+
+
+# Результат разбора ответа схемы T: модель T (full), представление TrustedModel без валидации (trusted)
+# или модель облегчённой схемы только с идентификаторами (ids, get_ids_schema(T) — не подкласс T).
+# Обращения к полям-идентификаторам и вложенным моделям с ними работают во всех трёх режимах
+DecodedResponse = Union[T, TrustedModel, BaseModel]
+
+
+def decode_response(content: bytes, schema: type[T], mode: HTTPDecodeMode) -> DecodedResponse[T]:
+    """
+    Разбирает тело JSON-ответа согласно режиму декодирования.
+
+    :param content: Тело ответа в байтах (без промежуточного декодирования в str).
+    :param schema: Схема ответа.
+    :param mode: full — полная валидация схемы; trusted — TrustedModel без валидации;
+                 ids — валидация только идентификаторов (get_ids_schema).
+    :return: Модель схемы, TrustedModel или модель облегчённой схемы.
+    """
+    match mode:
+        case HTTPDecodeMode.TRUSTED:
+            return TrustedModel(from_json(content), schema)
+        case HTTPDecodeMode.IDS:
+            return get_ids_schema(schema).model_validate_json(content)
+        case _:
+            return schema.model_validate_json(content)
@@ -1,60 +1,110 @@
 import time
+from collections.abc import Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, SyncByteStream
 from locust.env import Environment
 
+from tools.locust.metrics import get_request_metrics_emitter
+
+
+class LocustResponseStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая считает байты, полученные от транспорта.
+
+    Тело не буферизуется хуком: байты считаются по мере того, как их читает сам клиент
+    (response.read(), response.text, iter_bytes и т.д.). Когда поток закрывается
+    (тело вычитано или ответ закрыт), вызывается on_close с количеством прочитанных байт.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int], None]):
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length)
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет показания монотонных часов высокого разрешения (time.perf_counter)
+    в `request.extensions["start_time"]`, чтобы потом использовать их для расчёта времени ответа.
     """
-    request.extensions["start_time"] = time.time()
+    request.extensions["start_time"] = time.perf_counter()
 
 
 def locust_response_event_hook(environment: Environment):
     """
-    Возвращает HTTPX event hook, вызываемый после получения ответа.
+    Возвращает HTTPX event hook, вызываемый после получения заголовков ответа.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Время до первого байта (TTFB) фиксируется в момент вызова хука, а полное время и размер
+    тела — при закрытии потока ответа, после того как тело прочитал сам клиент.
+    Размер ответа — количество байт тела, полученных от транспорта (до распаковки).
     Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Отправляет собранные метрики через emitter метрик процесса (см. tools/locust/metrics.py):
+    сразу в `environment.events.request` или через буфер в статистику Locust.
+    TTFB передаётся в context события под ключом "time_to_first_byte" (в мс).
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
     :return: Функция-хук для HTTPX response event hook.
     """
 
+    emitter = get_request_metrics_emitter(environment)
+
     def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+        request = response.request
 
-        try:
-            # Проверка на статус ошибки (например, 500, 404 и т.д.)
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
-            exception = error
+        # Время начала запроса, установленное в request event hook
+        start_time = request.extensions.get("start_time")
+        if start_time is None:
+            start_time = time.perf_counter()
 
-        request = response.request
+        # Время до первого байта: заголовки получены, тело ещё не читалось
+        time_to_first_byte = (time.perf_counter() - start_time) * 1000
+
+        exception: HTTPStatusError | None = None
+        # raise_for_status вызывается только для не-2xx ответов (как и прежде, 1xx и 3xx тоже считаются ошибкой),
+        # чтобы не платить за try/except на каждом успешном ответе
+        if not response.is_success:
+            try:
+                # Проверка на статус ошибки (например, 500, 404, 302 и т.д.)
+                response.raise_for_status()
+            except HTTPStatusError as error:
+                exception = error
 
         # Получаем route, если он был передан через extensions, иначе используем raw path
         route = request.extensions.get("route", request.url.path)
-        # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
-
-        # Отправляем событие в Locust
-        environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
-            response=response,  # Объект ответа (опционально)
-            exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
-        )
+
+        def on_close(response_length: int) -> None:
+            # Отправляем метрику в Locust
+            emitter.emit(
+                request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+                name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
+                response_time=(time.perf_counter() - start_time) * 1000,  # Полное время запроса в мс
+                response_length=response_length,  # Размер тела ответа, полученного от транспорта
+                exception=exception,  # Исключение, если оно произошло
+                context={"time_to_first_byte": time_to_first_byte},  # TTFB в мс
+                response=response,  # Объект ответа (опционально)
+            )
+
+        if response.is_closed:
+            # Тело уже прочитано при создании ответа (например, MockTransport) — регистрируем сразу
+            on_close(len(response.content))
+            return
+
+        response.stream = LocustResponseStream(response.stream, on_close)
 
     return inner
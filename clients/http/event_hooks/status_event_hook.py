@@ -0,0 +1,12 @@
+from httpx import Response
+
+
+def raise_for_status_event_hook(response: Response) -> None:
+    """
+    HTTPX event hook, вызываемый после получения заголовков ответа.
+
+    Ответ с кодом 4xx или 5xx завершает запрос исключением HTTPStatusError со статусом ответа,
+    а не ошибкой валидации тела ответа с ошибкой: по статусу вызывающий код решает,
+    можно ли повторить запрос.
+    """
+    response.raise_for_status()
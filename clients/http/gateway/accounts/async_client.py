@@ -0,0 +1,121 @@
+from httpx import Response, QueryParams
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.accounts.schema import (
+    GetAccountsQuerySchema,
+    GetAccountsResponseSchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema
+)
+from clients.http.templates import get_request_template, serialize_request
+from tools.routes import APIRoutes
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    Методы и схемы совпадают с AccountsGatewayHTTPClient.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema):
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Pydantic-модель с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            APIRoutes.ACCOUNTS,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-deposit-account",
+            content=serialize_request(request)
+        )
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-savings-account",
+            content=serialize_request(request)
+        )
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            content=serialize_request(request)
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Pydantic-модель с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            content=serialize_request(request)
+        )
+
+    async def get_accounts(self, user_id: str) -> DecodedResponse[GetAccountsResponseSchema]:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return self.decode(response, GetAccountsResponseSchema)
+
+    async def open_deposit_account(self, user_id: str) -> DecodedResponse[OpenDepositAccountResponseSchema]:
+        request = get_request_template(OpenDepositAccountRequestSchema).render(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.decode(response, OpenDepositAccountResponseSchema)
+
+    async def open_savings_account(self, user_id: str) -> DecodedResponse[OpenSavingsAccountResponseSchema]:
+        request = get_request_template(OpenSavingsAccountRequestSchema).render(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.decode(response, OpenSavingsAccountResponseSchema)
+
+    async def open_debit_card_account(self, user_id: str) -> DecodedResponse[OpenDebitCardAccountResponseSchema]:
+        request = get_request_template(OpenDebitCardAccountRequestSchema).render(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.decode(response, OpenDebitCardAccountResponseSchema)
+
+    async def open_credit_card_account(self, user_id: str) -> DecodedResponse[OpenCreditCardAccountResponseSchema]:
+        request = get_request_template(OpenCreditCardAccountRequestSchema).render(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.decode(response, OpenCreditCardAccountResponseSchema)
+
+
+def build_accounts_gateway_async_http_client() -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client())
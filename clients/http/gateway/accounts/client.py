@@ -1,7 +1,11 @@
+from collections.abc import Hashable
+
 from httpx import Response, QueryParams
 from locust.env import Environment
 
+from config import settings
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     GetAccountsResponseSchema,
@@ -18,6 +22,8 @@ from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client
 )
+from clients.http.templates import get_request_template, serialize_request
+from tools.config.http import HTTPDecodeMode
 from tools.routes import APIRoutes
 
 
@@ -39,7 +45,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route=APIRoutes.ACCOUNTS)
         )
 
-    def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+    def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия депозитного счёта.
 
@@ -48,10 +54,10 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            content=serialize_request(request)
         )
 
-    def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+    def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия сберегательного счёта.
 
@@ -60,10 +66,10 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            content=serialize_request(request)
         )
 
-    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия дебетовой карты.
 
@@ -72,10 +78,10 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            content=serialize_request(request)
         )
 
-    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия кредитной карты.
 
@@ -84,33 +90,33 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            content=serialize_request(request)
         )
 
-    def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+    def get_accounts(self, user_id: str) -> DecodedResponse[GetAccountsResponseSchema]:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetAccountsResponseSchema)
 
-    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
-        request = OpenDepositAccountRequestSchema(user_id=user_id)
+    def open_deposit_account(self, user_id: str) -> DecodedResponse[OpenDepositAccountResponseSchema]:
+        request = get_request_template(OpenDepositAccountRequestSchema).render(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenDepositAccountResponseSchema)
 
-    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
-        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+    def open_savings_account(self, user_id: str) -> DecodedResponse[OpenSavingsAccountResponseSchema]:
+        request = get_request_template(OpenSavingsAccountRequestSchema).render(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenSavingsAccountResponseSchema)
 
-    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
-        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+    def open_debit_card_account(self, user_id: str) -> DecodedResponse[OpenDebitCardAccountResponseSchema]:
+        request = get_request_template(OpenDebitCardAccountRequestSchema).render(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenDebitCardAccountResponseSchema)
 
-    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
-        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+    def open_credit_card_account(self, user_id: str) -> DecodedResponse[OpenCreditCardAccountResponseSchema]:
+        request = get_request_template(OpenCreditCardAccountRequestSchema).render(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.decode(response, OpenCreditCardAccountResponseSchema)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
@@ -121,7 +127,11 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     """
     return AccountsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        key: Hashable | None = None,
+        decode_mode: HTTPDecodeMode | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -129,6 +139,11 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для переиспользования транспорта.
+    :param decode_mode: режим декодирования ответов (по умолчанию GATEWAY_HTTP_CLIENT.DECODE_MODE).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, key=key),
+        decode_mode=decode_mode or settings.gateway_http_client.decode_mode
+    )
@@ -0,0 +1,15 @@
+from httpx import AsyncClient
+
+from config import settings
+
+
+# Модуль намеренно не импортирует Locust: при импорте Locust выполняет gevent monkey patching,
+# несовместимый с asyncio. Асинхронные клиенты используются вне Locust — в сидинге и офлайн-инструментах.
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(timeout=settings.gateway_http_client.timeout, base_url=settings.gateway_http_client.client_url)
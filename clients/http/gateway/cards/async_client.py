@@ -0,0 +1,63 @@
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient
+from clients.http.decoding import DecodedResponse
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.cards.schema import (
+    IssueVirtualCardRequestSchema,
+    IssueVirtualCardResponseSchema,
+    IssuePhysicalCardRequestSchema,
+    IssuePhysicalCardResponseSchema
+)
+from clients.http.templates import get_request_template, serialize_request
+from tools.routes import APIRoutes
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    Методы и схемы совпадают с CardsGatewayHTTPClient.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema | bytes) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Pydantic-модель с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            f"{APIRoutes.CARDS}/issue-virtual-card",
+            content=serialize_request(request)
+        )
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema | bytes) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Pydantic-модель с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(
+            f"{APIRoutes.CARDS}/issue-physical-card",
+            content=serialize_request(request)
+        )
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> DecodedResponse[IssueVirtualCardResponseSchema]:
+        request = get_request_template(IssueVirtualCardRequestSchema).render(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return self.decode(response, IssueVirtualCardResponseSchema)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> DecodedResponse[IssuePhysicalCardResponseSchema]:
+        request = get_request_template(IssuePhysicalCardRequestSchema).render(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return self.decode(response, IssuePhysicalCardResponseSchema)
+
+
+def build_cards_gateway_async_http_client() -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -1,7 +1,11 @@
+from collections.abc import Hashable
+
 from httpx import Response
 from locust.env import Environment
 
+from config import settings
 from clients.http.client import HTTPClient
+from clients.http.decoding import DecodedResponse
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssueVirtualCardResponseSchema,
@@ -12,6 +16,8 @@ from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client
 )
+from clients.http.templates import get_request_template, serialize_request
+from tools.config.http import HTTPDecodeMode
 from tools.routes import APIRoutes
 
 
@@ -20,7 +26,7 @@ class CardsGatewayHTTPClient(HTTPClient):
     Клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
     """
 
-    def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+    def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema | bytes) -> Response:
         """
         Выпуск виртуальной карты.
 
@@ -29,10 +35,10 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.CARDS}/issue-virtual-card",
-            json=request.model_dump(by_alias=True)
+            content=serialize_request(request)
         )
 
-    def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+    def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema | bytes) -> Response:
         """
         Выпуск физической карты.
 
@@ -41,18 +47,18 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             f"{APIRoutes.CARDS}/issue-physical-card",
-            json=request.model_dump(by_alias=True)
+            content=serialize_request(request)
         )
 
-    def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
-        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+    def issue_virtual_card(self, user_id: str, account_id: str) -> DecodedResponse[IssueVirtualCardResponseSchema]:
+        request = get_request_template(IssueVirtualCardRequestSchema).render(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.decode(response, IssueVirtualCardResponseSchema)
 
-    def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
-        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+    def issue_physical_card(self, user_id: str, account_id: str) -> DecodedResponse[IssuePhysicalCardResponseSchema]:
+        request = get_request_template(IssuePhysicalCardRequestSchema).render(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.decode(response, IssuePhysicalCardResponseSchema)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -63,7 +69,11 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     """
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        key: Hashable | None = None,
+        decode_mode: HTTPDecodeMode | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -71,6 +81,11 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для переиспользования транспорта.
+    :param decode_mode: режим декодирования ответов (по умолчанию GATEWAY_HTTP_CLIENT.DECODE_MODE).
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, key=key),
+        decode_mode=decode_mode or settings.gateway_http_client.decode_mode
+    )
@@ -1,24 +1,92 @@
 import logging
+from collections.abc import Hashable
+
 from config import settings
 from httpx import Client
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
+from clients.http.pool import HTTPTransportPool, PooledHTTPTransport
+from tools.logger import get_logger
+
+from clients.http.event_hooks.status_event_hook import raise_for_status_event_hook
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
 
+logger = get_logger("HTTP_TRANSPORT_POOL")
+
+
+def build_gateway_http_transport() -> PooledHTTPTransport:
+    """
+    Функция создаёт транспорт httpx (пул соединений) с лимитами, keep-alive и HTTP/2 из настроек.
 
-def build_gateway_http_client() -> Client:
+    :return: Новый транспорт httpx.
+    """
+    return PooledHTTPTransport(
+        limits=settings.gateway_http_client.limits,
+        http2=settings.gateway_http_client.http2
+    )
+
+
+def build_gateway_http_client(raise_for_status: bool = False) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    :param raise_for_status: Завершать запрос исключением HTTPStatusError, если сервис ответил кодом 4xx или 5xx.
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=settings.gateway_http_client.timeout, base_url=settings.gateway_http_client.client_url)
+    return Client(
+        timeout=settings.gateway_http_client.timeout,
+        base_url=settings.gateway_http_client.client_url,
+        transport=build_gateway_http_transport(),
+        event_hooks={"response": [raise_for_status_event_hook]} if raise_for_status else None
+    )
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def get_gateway_locust_http_transport_pool(environment: Environment) -> HTTPTransportPool:
+    """
+    Возвращает общий на процесс пул транспортов httpx, создавая его при первом обращении.
+
+    Пул хранится в окружении Locust (environment.http_transport_pool). По завершении теста
+    в лог пишется число транспортов, запросов и открытых TCP-соединений — по нему видно,
+    не связана ли деградация латентности с переоткрытием соединений на стороне клиента.
+
+    :param environment: Объект окружения Locust.
+    :return: Пул транспортов httpx.
+    """
+    pool: HTTPTransportPool | None = getattr(environment, "http_transport_pool", None)
+    if pool is not None:
+        return pool
+
+    pool = HTTPTransportPool(
+        scope=settings.gateway_http_client.transport_scope,
+        transport_factory=build_gateway_http_transport
+    )
+    environment.http_transport_pool = pool
+
+    @environment.events.test_stop.add_listener
+    def log_http_transport_pool_metrics(**kwargs):
+        metrics = pool.snapshot()
+        logger.info(
+            f"Scope {pool.scope}: transports={metrics['transports']} (closed {metrics['closed_transports']}), "
+            f"requests={metrics['requests']}, connections={metrics['connections']}"
+        )
+
+    return pool
+
+
+def release_gateway_locust_http_client(environment: Environment, key: Hashable) -> None:
+    """
+    Закрывает транспорты виртуального пользователя (области client и user).
+
+    :param environment: Объект окружения Locust.
+    :param key: Ключ пользователя, переданный ранее в build_gateway_locust_http_client.
+    """
+    get_gateway_locust_http_transport_pool(environment).release(key)
+
+
+def build_gateway_locust_http_client(environment: Environment, key: Hashable | None = None) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -30,7 +98,11 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Транспорт (пул соединений) берётся из общего пула согласно GATEWAY_HTTP_CLIENT.TRANSPORT_SCOPE:
+    отдельный на клиента, общий на пользователя key или общий на процесс.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param key: Ключ виртуального пользователя для области переиспользования user.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
@@ -40,6 +112,7 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        transport=get_gateway_locust_http_transport_pool(environment).acquire(key),
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
             "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
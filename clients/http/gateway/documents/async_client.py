@@ -0,0 +1,66 @@
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.documents.schema import (
+    GetContractDocumentResponseSchema,
+    GetTariffDocumentResponseSchema
+)
+from tools.routes import APIRoutes
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    Методы и схемы совпадают с DocumentsGatewayHTTPClient.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить документ тарифа по счету через апи.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"{APIRoutes.DOCUMENTS}/tariff-document/{account_id}",
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/tariff-document/{{account_id}}"))
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить документ контракта по счету через апи.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}"))
+
+    async def get_tariff_document(self, account_id: str) -> DecodedResponse[GetTariffDocumentResponseSchema]:
+        """
+        Получить документ тарифа
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект JSON).
+        """
+        response = await self.get_tariff_document_api(account_id)
+        return self.decode(response, GetTariffDocumentResponseSchema)
+
+    async def get_contract_document(self, account_id: str) -> DecodedResponse[GetContractDocumentResponseSchema]:
+        """
+        Получить документ контракта
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект JSON).
+        """
+        response = await self.get_contract_document_api(account_id)
+        return self.decode(response, GetContractDocumentResponseSchema)
+
+
+def build_documents_gateway_async_http_client() -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -1,7 +1,11 @@
+from collections.abc import Hashable
+
 from httpx import Response
 from locust.env import Environment
 
+from config import settings
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client
@@ -10,6 +14,7 @@ from clients.http.gateway.documents.schema import (
     GetContractDocumentResponseSchema,
     GetTariffDocumentResponseSchema
 )
+from tools.config.http import HTTPDecodeMode
 from tools.routes import APIRoutes
 
 
@@ -38,7 +43,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         return self.get(f"{APIRoutes.DOCUMENTS}/contract-document/{account_id}",
                         extensions=HTTPClientExtensions(route=f"{APIRoutes.DOCUMENTS}/contract-document/{{account_id}}"))
 
-    def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+    def get_tariff_document(self, account_id: str) -> DecodedResponse[GetTariffDocumentResponseSchema]:
         """
         Получить документ тарифа
 
@@ -46,9 +51,9 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект JSON).
         """
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetTariffDocumentResponseSchema)
 
-    def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+    def get_contract_document(self, account_id: str) -> DecodedResponse[GetContractDocumentResponseSchema]:
         """
         Получить документ контракта
 
@@ -56,7 +61,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект JSON).
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -67,7 +72,11 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     """
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        key: Hashable | None = None,
+        decode_mode: HTTPDecodeMode | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -75,6 +84,11 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для переиспользования транспорта.
+    :param decode_mode: режим декодирования ответов (по умолчанию GATEWAY_HTTP_CLIENT.DECODE_MODE).
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, key=key),
+        decode_mode=decode_mode or settings.gateway_http_client.decode_mode
+    )
@@ -2,6 +2,7 @@ from locust import TaskSet, SequentialTaskSet
 
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.client import release_gateway_locust_http_client
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
     build_documents_gateway_locust_http_client
@@ -11,6 +12,7 @@ from clients.http.gateway.operations.client import (
     build_operations_gateway_locust_http_client
 )
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from tools.config.http import HTTPDecodeMode
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -21,6 +23,10 @@ class GatewayHTTPTaskSet(TaskSet):
     Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
     """
 
+    # Режим декодирования ответов клиентами; None — GATEWAY_HTTP_CLIENT.DECODE_MODE.
+    # Сценарий, которому нужны только идентификаторы из ответов, может указать HTTPDecodeMode.IDS
+    decode_mode: HTTPDecodeMode | None = None
+
     # Аннотации полей с клиентами (появятся в self после on_start)
     users_gateway_client: UsersGatewayHTTPClient
     cards_gateway_client: CardsGatewayHTTPClient
@@ -33,11 +39,20 @@ class GatewayHTTPTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Виртуальный пользователь — ключ переиспользования транспорта (для области user):
+        # все пять клиентов одного пользователя работают через один пул соединений
+        environment, key, mode = self.user.environment, self.user, self.decode_mode
+        self.users_gateway_client = build_users_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке TaskSet: освобождает транспорт пользователя.
+        """
+        release_gateway_locust_http_client(self.user.environment, key=self.user)
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -48,6 +63,8 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
     """
 
+    decode_mode: HTTPDecodeMode | None = None
+
     users_gateway_client: UsersGatewayHTTPClient
     cards_gateway_client: CardsGatewayHTTPClient
     accounts_gateway_client: AccountsGatewayHTTPClient
@@ -58,8 +75,17 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Виртуальный пользователь — ключ переиспользования транспорта (для области user):
+        # все пять клиентов одного пользователя работают через один пул соединений
+        environment, key, mode = self.user.environment, self.user, self.decode_mode
+        self.users_gateway_client = build_users_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(environment, key=key, decode_mode=mode)
+
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке TaskSet: освобождает транспорт пользователя.
+        """
+        release_gateway_locust_http_client(self.user.environment, key=self.user)
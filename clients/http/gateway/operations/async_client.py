@@ -0,0 +1,324 @@
+from httpx import Response, QueryParams
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.operations.schema import (
+    GetOperationsQuerySchema,
+    GetOperationsResponseSchema,
+    GetOperationResponseSchema,
+    GetOperationsSummaryResponseSchema,
+    GetOperationReceiptResponseSchema,
+    MakeFeeOperationResponseSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashWithdrawalOperationResponseSchema,
+    MakeOperationRequestSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeTransferOperationResponseSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeCashbackOperationResponseSchema,
+    MakePurchaseOperationRequestSchema)
+from clients.http.templates import get_request_template, serialize_request
+from tools.routes import APIRoutes
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    Методы и схемы совпадают с OperationsGatewayHTTPClient.
+    """
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Выполняет GET-запрос на получение информации об операции по operation_id
+
+        :param operation_id: Строка с operation_id, например '123'.
+        :return: Объект httpx.Response с данными об операции с operation_id
+        """
+        return await self.get(f"{APIRoutes.OPERATIONS}/{operation_id}",
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/{{operation_id}}"))
+
+    async def get_operation_receipt_api(self, operation_id: str) -> Response:
+        """
+        Выполняет GET-запрос на получение чека по операции по operation_id
+
+        :param operation_id: Строка с operation_id, например '123'.
+        :return: Объект httpx.Response с данными о чеке по операции с operation_id
+        """
+        return await self.get(f"/api/v1/operation-receipt/{operation_id}",
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operation-receipt/{{operation_id}}"))
+
+    async def get_operations_api(self, account_id: str) -> Response:
+        """
+        Выполняет GET-запрос на получение списка операций для определённого счёта
+
+        :param account_id: ID счёта
+        :return: Объект httpx.Response с данными списка операций для определённого счёта
+        """
+        query = GetOperationsQuerySchema(account_id=account_id)
+        return await self.get(APIRoutes.OPERATIONS, params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(route=APIRoutes.OPERATIONS))
+
+    async def get_operations_summary_api(self, account_id: str) -> Response:
+        """
+        Выполняет GET-запрос на получение статистики по операциям для определённого счёта
+
+        :param account_id: ID счёта
+        :return: Объект httpx.Response с данными об операции.
+        """
+        query = GetOperationsQuerySchema(account_id=account_id)
+        return await self.get(f"{APIRoutes.OPERATIONS}/operations-summary", params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary"))
+
+    async def make_fee_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции комиссии
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string"
+                                                                }.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-fee-operation", content=serialize_request(request))
+
+    async def make_top_up_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции пополнения
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string"
+                                                                }.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", content=serialize_request(request))
+
+    async def make_cashback_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции кэшбэка
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string"
+                                                                }.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-cashback-operation", content=serialize_request(request))
+
+    async def make_transfer_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции перевода
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string"
+                                                                }.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", content=serialize_request(request))
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции покупки
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string",
+                                                                  "category": "string"
+                                                                }
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", content=serialize_request(request))
+
+    async def make_bill_payment_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции оплаты по счету
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string"
+                                                                }.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", content=serialize_request(request))
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
+        """
+        Выполняет POST-запрос на создание операции снятия наличных денег
+
+        :param request: Словарь с параметрами запроса, например: {
+                                                                  "status": "FAILED",
+                                                                  "amount": 0,
+                                                                  "cardId": "string",
+                                                                  "accountId": "string"
+                                                                }.
+        :return: Объект httpx.Response с данными об операции.
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", content=serialize_request(request))
+
+    async def get_operation(self, operation_id: str) -> DecodedResponse[GetOperationResponseSchema]:
+        """
+        Вызов метода get_operation_api
+
+        :param operation_id: Строка с operation_id, например '123'.
+        :return: Ответ от сервера (объект JSON).
+        """
+        response = await self.get_operation_api(operation_id)
+        return self.decode(response, GetOperationResponseSchema)
+
+    async def get_operation_receipt(self, operation_id: str) -> DecodedResponse[GetOperationReceiptResponseSchema]:
+        """
+        Вызов метода get_operation_receipt
+
+        :param operation_id: Строка с operation_id, например '123'.
+        :return: Ответ от сервера (объект JSON).
+        """
+        response = await self.get_operation_receipt_api(operation_id)
+        return self.decode(response, GetOperationReceiptResponseSchema)
+
+    async def get_operations(self, account_id: str) -> DecodedResponse[GetOperationsResponseSchema]:
+        """
+        Вызов метода get_operations
+
+        :param account_id: ID счета
+        :return: Ответ от сервера (объект JSON).
+        """
+        response = await self.get_operations_api(account_id)
+        return self.decode(response, GetOperationsResponseSchema)
+
+    async def get_operations_summary(self, account_id: str) -> DecodedResponse[GetOperationsSummaryResponseSchema]:
+        """
+        Вызов метода get_operations_summary
+
+        :param account_id: ID счета
+        :return: Ответ от сервера (объект JSON).
+        """
+        response = await self.get_operations_summary_api(account_id)
+        return self.decode(response, GetOperationsSummaryResponseSchema)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeFeeOperationResponseSchema]:
+        """
+        Вызов метода make_fee_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakeOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_fee_operation_api(request)
+        return self.decode(response, MakeFeeOperationResponseSchema)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeTopUpOperationResponseSchema]:
+        """
+        Вызов метода make_top_up_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakeOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_top_up_operation_api(request)
+        return self.decode(response, MakeTopUpOperationResponseSchema)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeCashbackOperationResponseSchema]:
+        """
+        Вызов метода make_cashback_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakeOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cashback_operation_api(request)
+        return self.decode(response, MakeCashbackOperationResponseSchema)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeTransferOperationResponseSchema]:
+        """
+        Вызов метода make_transfer_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakeOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_transfer_operation_api(request)
+        return self.decode(response, MakeTransferOperationResponseSchema)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakePurchaseOperationResponseSchema]:
+        """
+        Вызов метода make_purchase_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakePurchaseOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_purchase_operation_api(request)
+        return self.decode(response, MakePurchaseOperationResponseSchema)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeBillPaymentOperationResponseSchema]:
+        """
+        Вызов метода make_bill_payment_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakeOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_bill_payment_operation_api(request)
+        return self.decode(response, MakeBillPaymentOperationResponseSchema)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeCashWithdrawalOperationResponseSchema]:
+        """
+        Вызов метода make_cash_withdrawal_operation
+
+        :param card_id: строка, идентификатор карты
+        :param account_id: строка, идентификатор аккаунта
+        :return: Ответ от сервера (объект JSON).
+        """
+        request = get_request_template(MakeOperationRequestSchema).render(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.decode(response, MakeCashWithdrawalOperationResponseSchema)
+
+
+def build_operations_gateway_async_http_client() -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncOperationsGatewayHTTPClient.
+    """
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client())
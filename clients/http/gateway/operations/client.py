@@ -1,7 +1,11 @@
+from collections.abc import Hashable
+
 from httpx import Response, QueryParams
 from locust.env import Environment
 
+from config import settings
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client
@@ -21,6 +25,8 @@ from clients.http.gateway.operations.schema import (
     MakeTopUpOperationResponseSchema,
     MakeCashbackOperationResponseSchema,
     MakePurchaseOperationRequestSchema)
+from clients.http.templates import get_request_template, serialize_request
+from tools.config.http import HTTPDecodeMode
 from tools.routes import APIRoutes
 
 
@@ -71,7 +77,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         return self.get(f"{APIRoutes.OPERATIONS}/operations-summary", params=QueryParams(**query.model_dump(by_alias=True)),
                         extensions=HTTPClientExtensions(route=f"{APIRoutes.OPERATIONS}/operations-summary"))
 
-    def make_fee_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+    def make_fee_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции комиссии
 
@@ -83,9 +89,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }.
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-fee-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-fee-operation", content=serialize_request(request))
 
-    def make_top_up_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+    def make_top_up_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции пополнения
 
@@ -97,9 +103,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }.
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", content=serialize_request(request))
 
-    def make_cashback_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+    def make_cashback_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции кэшбэка
 
@@ -111,9 +117,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }.
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-cashback-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-cashback-operation", content=serialize_request(request))
 
-    def make_transfer_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+    def make_transfer_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции перевода
 
@@ -125,9 +131,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }.
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", content=serialize_request(request))
 
-    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции покупки
 
@@ -140,9 +146,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", content=serialize_request(request))
 
-    def make_bill_payment_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+    def make_bill_payment_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции оплаты по счету
 
@@ -154,9 +160,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }.
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-bill-payment-operation", content=serialize_request(request))
 
-    def make_cash_withdrawal_operation_api(self, request: MakeOperationRequestSchema) -> Response:
+    def make_cash_withdrawal_operation_api(self, request: MakeOperationRequestSchema | bytes) -> Response:
         """
         Выполняет POST-запрос на создание операции снятия наличных денег
 
@@ -168,9 +174,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
                                                                 }.
         :return: Объект httpx.Response с данными об операции.
         """
-        return self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", json=request.model_dump(by_alias=True))
+        return self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", content=serialize_request(request))
 
-    def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+    def get_operation(self, operation_id: str) -> DecodedResponse[GetOperationResponseSchema]:
         """
         Вызов метода get_operation_api
 
@@ -178,9 +184,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект JSON).
         """
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationResponseSchema)
 
-    def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+    def get_operation_receipt(self, operation_id: str) -> DecodedResponse[GetOperationReceiptResponseSchema]:
         """
         Вызов метода get_operation_receipt
 
@@ -188,9 +194,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект JSON).
         """
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationReceiptResponseSchema)
 
-    def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+    def get_operations(self, account_id: str) -> DecodedResponse[GetOperationsResponseSchema]:
         """
         Вызов метода get_operations
 
@@ -198,9 +204,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект JSON).
         """
         response = self.get_operations_api(account_id)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationsResponseSchema)
 
-    def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+    def get_operations_summary(self, account_id: str) -> DecodedResponse[GetOperationsSummaryResponseSchema]:
         """
         Вызов метода get_operations_summary
 
@@ -208,9 +214,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ от сервера (объект JSON).
         """
         response = self.get_operations_summary_api(account_id)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetOperationsSummaryResponseSchema)
 
-    def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+    def make_fee_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeFeeOperationResponseSchema]:
         """
         Вызов метода make_fee_operation
 
@@ -218,14 +224,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakeOperationRequestSchema(
+        request = get_request_template(MakeOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakeFeeOperationResponseSchema)
 
-    def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+    def make_top_up_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeTopUpOperationResponseSchema]:
         """
         Вызов метода make_top_up_operation
 
@@ -233,14 +239,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakeOperationRequestSchema(
+        request = get_request_template(MakeOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakeTopUpOperationResponseSchema)
 
-    def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+    def make_cashback_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeCashbackOperationResponseSchema]:
         """
         Вызов метода make_cashback_operation
 
@@ -248,14 +254,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakeOperationRequestSchema(
+        request = get_request_template(MakeOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakeCashbackOperationResponseSchema)
 
-    def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+    def make_transfer_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeTransferOperationResponseSchema]:
         """
         Вызов метода make_transfer_operation
 
@@ -263,14 +269,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakeOperationRequestSchema(
+        request = get_request_template(MakeOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakeTransferOperationResponseSchema)
 
-    def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+    def make_purchase_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakePurchaseOperationResponseSchema]:
         """
         Вызов метода make_purchase_operation
 
@@ -278,14 +284,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakePurchaseOperationRequestSchema(
+        request = get_request_template(MakePurchaseOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakePurchaseOperationResponseSchema)
 
-    def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+    def make_bill_payment_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeBillPaymentOperationResponseSchema]:
         """
         Вызов метода make_bill_payment_operation
 
@@ -293,14 +299,14 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakeOperationRequestSchema(
+        request = get_request_template(MakeOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakeBillPaymentOperationResponseSchema)
 
-    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> DecodedResponse[MakeCashWithdrawalOperationResponseSchema]:
         """
         Вызов метода make_cash_withdrawal_operation
 
@@ -308,12 +314,12 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param account_id: строка, идентификатор аккаунта
         :return: Ответ от сервера (объект JSON).
         """
-        request = MakeOperationRequestSchema(
+        request = get_request_template(MakeOperationRequestSchema).render(
             card_id=card_id,
             account_id=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.decode(response, MakeCashWithdrawalOperationResponseSchema)
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
@@ -323,7 +329,11 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        key: Hashable | None = None,
+        decode_mode: HTTPDecodeMode | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -331,6 +341,11 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для переиспользования транспорта.
+    :param decode_mode: режим декодирования ответов (по умолчанию GATEWAY_HTTP_CLIENT.DECODE_MODE).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, key=key),
+        decode_mode=decode_mode or settings.gateway_http_client.decode_mode
+    )
@@ -0,0 +1,63 @@
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.users.schema import (
+    GetUserResponseSchema,
+    CreateUserRequestSchema,
+    CreateUserResponseSchema
+)
+from clients.http.templates import get_request_template, serialize_request
+from tools.routes import APIRoutes
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    Методы и схемы совпадают с UsersGatewayHTTPClient.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+
+        return await self.get(
+            f"{APIRoutes.USERS}/{user_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")  # Явно передаём логическое имя маршрута
+        )
+
+    # Теперь используем pydantic-модель для аннотации
+    async def create_user_api(self, request: CreateUserRequestSchema | bytes) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Pydantic-модель с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        # Тело из шаблона передаётся как есть, модель сериализуется с использованием alias
+        return await self.post(APIRoutes.USERS, content=serialize_request(request))
+
+    async def get_user(self, user_id: str) -> DecodedResponse[GetUserResponseSchema]:
+        response = await self.get_user_api(user_id)
+        # Инициализируем модель через валидацию JSON строки
+        return self.decode(response, GetUserResponseSchema)
+
+    # Теперь используем pydantic-модель для аннотации
+    async def create_user(self) -> DecodedResponse[CreateUserResponseSchema]:
+        request = get_request_template(CreateUserRequestSchema).render()
+        response = await self.create_user_api(request)
+        return self.decode(response, CreateUserResponseSchema)
+
+
+def build_users_gateway_async_http_client() -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным httpx.AsyncClient.
+
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client())
@@ -1,7 +1,11 @@
+from collections.abc import Hashable
+
 from httpx import Response
 from locust.env import Environment
 
+from config import settings
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.decoding import DecodedResponse
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client
@@ -11,6 +15,8 @@ from clients.http.gateway.users.schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema
 )
+from clients.http.templates import get_request_template, serialize_request
+from tools.config.http import HTTPDecodeMode
 from tools.routes import APIRoutes
 
 
@@ -33,26 +39,26 @@ class UsersGatewayHTTPClient(HTTPClient):
         )
 
     # Теперь используем pydantic-модель для аннотации
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+    def create_user_api(self, request: CreateUserRequestSchema | bytes) -> Response:
         """
         Создание нового пользователя.
 
         :param request: Pydantic-модель с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        # Сериализуем модель в словарь с использованием alias
-        return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        # Тело из шаблона передаётся как есть, модель сериализуется с использованием alias
+        return self.post(APIRoutes.USERS, content=serialize_request(request))
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+    def get_user(self, user_id: str) -> DecodedResponse[GetUserResponseSchema]:
         response = self.get_user_api(user_id)
         # Инициализируем модель через валидацию JSON строки
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.decode(response, GetUserResponseSchema)
 
     # Теперь используем pydantic-модель для аннотации
-    def create_user(self) -> CreateUserResponseSchema:
-        request = CreateUserRequestSchema()
+    def create_user(self) -> DecodedResponse[CreateUserResponseSchema]:
+        request = get_request_template(CreateUserRequestSchema).render()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.decode(response, CreateUserResponseSchema)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -63,7 +69,11 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     """
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        key: Hashable | None = None,
+        decode_mode: HTTPDecodeMode | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -71,6 +81,11 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param key: ключ виртуального пользователя для переиспользования транспорта.
+    :param decode_mode: режим декодирования ответов (по умолчанию GATEWAY_HTTP_CLIENT.DECODE_MODE).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, key=key),
+        decode_mode=decode_mode or settings.gateway_http_client.decode_mode
+    )
\ No newline at end of file
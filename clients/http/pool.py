@@ -0,0 +1,179 @@
+import threading
+from collections.abc import Callable, Hashable
+
+from httpx import BaseTransport, HTTPTransport, Request, Response
+
+from tools.config.http import HTTPTransportScope
+
+
+class PooledHTTPTransport(HTTPTransport):
+    """
+    httpx.HTTPTransport, который считает запросы и новые TCP-соединения.
+
+    Новые соединения фиксируются через trace-расширение httpcore
+    (событие connection.connect_tcp.complete). Соотношение соединений и запросов
+    показывает, есть ли на стороне клиента "churn" соединений.
+
+    При закрытии транспорта вызывается on_close — так пул перестаёт учитывать его как открытый.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.on_close: Callable[["PooledHTTPTransport"], None] | None = None
+
+    def trace(self, event_name: str, info: dict) -> None:
+        """
+        Обработчик trace-событий httpcore. Считает установленные TCP-соединения.
+        """
+        if event_name == "connection.connect_tcp.complete":
+            with self.lock:
+                self.connections += 1
+
+    def handle_request(self, request: Request) -> Response:
+        with self.lock:
+            self.requests += 1
+
+        # Если запрос уже содержит собственный trace-обработчик — вызываем оба
+        outer_trace = request.extensions.get("trace")
+
+        def trace(event_name: str, info: dict) -> None:
+            self.trace(event_name, info)
+            if outer_trace is not None:
+                outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        return super().handle_request(request)
+
+    def close(self) -> None:
+        super().close()
+        if self.on_close is not None:
+            self.on_close(self)
+
+
+class SharedHTTPTransport(BaseTransport):
+    """
+    Общий транспорт процесса, который клиенты не могут закрыть.
+
+    httpx.Client закрывает свой транспорт в close() и при выходе из with. Для транспорта,
+    общего на все клиенты процесса, это оборвало бы соединения остальных пользователей,
+    поэтому close() обёртки ничего не делает — транспорт закрывает только пул.
+    """
+
+    def __init__(self, transport: PooledHTTPTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class HTTPTransportPool:
+    """
+    Пул транспортов httpx (пулов соединений) с настраиваемой областью переиспользования.
+
+    - client: каждый вызов acquire создаёт новый транспорт (поведение по умолчанию httpx);
+    - user: все клиенты одного пользователя (ключа) получают общий транспорт;
+    - process: все клиенты процесса получают один и тот же транспорт.
+
+    Транспорты областей client и user закрываются в release; закрытый транспорт
+    (в том числе закрытый самим клиентом) удаляется из пула, а его счётчики
+    запросов и соединений переносятся в итоговые.
+    """
+
+    def __init__(self, scope: HTTPTransportScope, transport_factory: Callable[[], PooledHTTPTransport]):
+        """
+        :param scope: Область переиспользования транспорта.
+        :param transport_factory: Функция, создающая новый транспорт с нужными лимитами.
+        """
+        self.scope = scope
+        self.transport_factory = transport_factory
+        # Открытые транспорты
+        self.transports: list[PooledHTTPTransport] = []
+        # Счётчики уже закрытых транспортов
+        self.closed_transports = 0
+        self.closed_requests = 0
+        self.closed_connections = 0
+
+        self._lock = threading.Lock()
+        self._shared: SharedHTTPTransport | None = None
+        # Ключ пользователя -> транспорты, выданные клиентам этого пользователя
+        self._assignments: dict[Hashable, list[PooledHTTPTransport]] = {}
+
+    def _create(self) -> PooledHTTPTransport:
+        transport = self.transport_factory()
+        transport.on_close = self._forget
+        self.transports.append(transport)
+        return transport
+
+    def _forget(self, transport: PooledHTTPTransport) -> None:
+        with self._lock:
+            if transport not in self.transports:
+                return
+
+            self.transports.remove(transport)
+            self.closed_transports += 1
+            self.closed_requests += transport.requests
+            self.closed_connections += transport.connections
+
+    def acquire(self, key: Hashable | None = None) -> BaseTransport:
+        """
+        Возвращает транспорт для клиента согласно области переиспользования.
+
+        :param key: Ключ виртуального пользователя. В области user по нему выдаётся общий транспорт,
+                    в области client по нему закрываются транспорты пользователя в release.
+        :return: Транспорт httpx.
+        """
+        with self._lock:
+            if self.scope == HTTPTransportScope.PROCESS:
+                if self._shared is None or self._shared.transport not in self.transports:
+                    self._shared = SharedHTTPTransport(self._create())
+
+                return self._shared
+
+            if key is None:
+                return self._create()
+
+            transports = self._assignments.setdefault(key, [])
+            if self.scope == HTTPTransportScope.USER and transports:
+                return transports[0]
+
+            transport = self._create()
+            transports.append(transport)
+            return transport
+
+    def release(self, key: Hashable) -> None:
+        """
+        Закрывает транспорты пользователя (области client и user).
+        Общий транспорт процесса остаётся открытым.
+
+        :param key: Ключ пользователя, переданный ранее в acquire.
+        """
+        with self._lock:
+            transports = self._assignments.pop(key, [])
+
+        for transport in transports:
+            transport.close()
+
+    def snapshot(self) -> dict[str, int]:
+        """
+        Возвращает агрегированные метрики по всем созданным транспортам.
+
+        :return: Количество открытых и закрытых транспортов, запросов и установленных TCP-соединений.
+        """
+        with self._lock:
+            transports = list(self.transports)
+            closed_transports = self.closed_transports
+            closed_requests = self.closed_requests
+            closed_connections = self.closed_connections
+
+        return {
+            "transports": len(transports),
+            "closed_transports": closed_transports,
+            "requests": closed_requests + sum(transport.requests for transport in transports),
+            "connections": closed_connections + sum(transport.connections for transport in transports),
+        }
@@ -0,0 +1,114 @@
+import math
+from enum import Enum
+from functools import cache
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined, to_json
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Кодирует значение поля в JSON (в байтах).
+    Строки, перечисления и числа кодируются напрямую, остальные типы — через pydantic_core.
+    NaN и бесконечности не имеют представления в JSON, поэтому для них выбрасывается ValueError.
+    """
+    if isinstance(value, Enum):
+        value = value.value
+
+    if isinstance(value, str):
+        return encode_basestring_ascii(value).encode("ascii")
+
+    if isinstance(value, bool) or value is None:
+        return b"true" if value is True else b"false" if value is False else b"null"
+
+    if isinstance(value, int):
+        return repr(value).encode("ascii")
+
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot encode non-finite float {value!r} as JSON")
+
+        return repr(value).encode("ascii")
+
+    return to_json(value)
+
+
+class RequestTemplate:
+    """
+    Шаблон тела JSON-запроса, построенный по Pydantic-схеме.
+
+    Статическая часть тела — скобки, ключи (алиасы полей) и разделители — сериализуется
+    один раз при создании шаблона. При отправке запроса в неё подставляются только
+    закодированные значения полей, без создания модели, её валидации и model_dump.
+
+    Значения полей, не переданных в render, берутся из default/default_factory схемы
+    (например, fake.amount), как при создании модели.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        """
+        :param schema: Схема тела запроса, например MakeOperationRequestSchema.
+        """
+        self.schema = schema
+        self.fields: list[tuple[str, bytes, Callable[[], Any] | None, Any]] = []
+
+        separator = b"{"
+        for name, field in schema.model_fields.items():
+            key = field.serialization_alias or field.alias or name
+            # Фрагмент перед значением поля: '{"status":' для первого поля, ',"amount":' для остальных
+            prefix = separator + encode_basestring_ascii(key).encode("ascii") + b":"
+            self.fields.append((name, prefix, field.default_factory, field.default))
+            separator = b","
+
+        self.suffix = b"}" if self.fields else b"{}"
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Собирает тело запроса.
+
+        :param values: Значения полей по их именам в схеме (card_id=..., account_id=...).
+        :return: Тело запроса в виде JSON (байты), готовое для передачи в content.
+        """
+        chunks = []
+        for name, prefix, default_factory, default in self.fields:
+            if name in values:
+                value = values[name]
+            elif default_factory is not None:
+                value = default_factory()
+            elif default is not PydanticUndefined:
+                value = default
+            else:
+                raise TypeError(f"{self.schema.__name__}: missing required field {name!r}")
+
+            chunks.append(prefix)
+            chunks.append(encode_value(value))
+
+        chunks.append(self.suffix)
+        return b"".join(chunks)
+
+
+@cache
+def get_request_template(schema: type[BaseModel]) -> RequestTemplate:
+    """
+    Возвращает шаблон тела запроса для схемы (создаётся один раз на процесс).
+
+    :param schema: Схема тела запроса.
+    :return: RequestTemplate.
+    """
+    return RequestTemplate(schema)
+
+
+def serialize_request(request: BaseModel | bytes) -> bytes:
+    """
+    Возвращает тело запроса в байтах: готовое тело из шаблона передаётся как есть,
+    Pydantic-модель сериализуется по алиасам.
+
+    :param request: Модель запроса или тело, собранное RequestTemplate.render.
+    :return: Тело запроса (JSON).
+    """
+    if isinstance(request, bytes):
+        return request
+
+    return request.model_dump_json(by_alias=True).encode("utf-8")
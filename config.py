@@ -1,26 +1,17 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import locust.stats  # Модуль Locust, отвечающий за сбор и хранение статистики
 
 # Импортируем вложенные модели
+from tools.config.fakers import FakeConfig
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
-from tools.config.locust import LocustUserConfig
+from tools.config.locust import LocustUserConfig, LocustMetricsConfig
+from tools.config.seeds import SeedsConfig
+from tools.config.standin import StandInConfig
 
-
-# Настройка списка процентилей, которые будут попадать в отчёты Locust
-locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
-
-# Интервал (в секундах) между записями агрегированной статистики в CSV
-locust.stats.CSV_STATS_INTERVAL_SEC = 5
-
-# Интервал (в секундах) между записями "исторической" статистики (динамика значений)
-locust.stats.HISTORY_STATS_INTERVAL_SEC = 5
-
-# Интервал (в секундах) между обновлением статистики в консоли Locust
-locust.stats.CONSOLE_STATS_INTERVAL_SEC = 5
-
-# Интервал (в секундах) между принудительной записью CSV на диск
-locust.stats.CSV_STATS_FLUSH_INTERVAL_SEC = 5
+# Настройки статистики Locust (процентили, интервалы CSV) вынесены в tools/locust/user.py:
+# импорт Locust выполняет gevent monkey patching, поэтому config.py не должен его импортировать —
+# иначе настройки нельзя будет использовать в асинхронных (asyncio) инструментах.
 
 
 class Settings(BaseSettings):
@@ -34,8 +25,12 @@ class Settings(BaseSettings):
 
     # Вложенные секции настроек
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
+    locust_metrics: LocustMetricsConfig = Field(default_factory=LocustMetricsConfig)  # Доставка метрик в Locust
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга
+    fake: FakeConfig = Field(default_factory=FakeConfig)  # Генерация тестовых данных
+    standin: StandInConfig = Field(default_factory=StandInConfig)  # Локальный заменитель gateway для бенчмарков
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
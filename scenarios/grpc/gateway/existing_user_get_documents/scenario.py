@@ -14,11 +14,9 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем генерацию данных (на master или локально) и загружаем в окружение Locust
+    # пользователей текущего процесса: worker получает от master только свой срез
+    environment.seeds = seeds_scenario.setup(environment)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
@@ -33,6 +31,15 @@ class GetDocumentsTaskSet(GatewayGRPCTaskSet):
         # Получаем следующего пользователя из списка (по порядку!)
         self.seed_user = self.user.environment.seeds.get_next_user()
 
+    # Метод вызывается при остановке сессии: возвращаем пользователя для повторной выдачи
+    def on_stop(self) -> None:
+        super().on_stop()
+
+        # Если on_start упал до получения пользователя, возвращать нечего
+        seed_user = getattr(self, "seed_user", None)
+        if seed_user is not None:
+            self.user.environment.seeds.return_user(seed_user)
+
     @task(1)
     def get_accounts(self):
         # Запрашиваем список счетов
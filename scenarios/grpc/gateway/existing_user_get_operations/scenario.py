@@ -12,10 +12,9 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Создаём пользователей, счета, карты и операции (на master или локально)
+    # и загружаем пользователей текущего процесса: worker получает от master только свой срез
+    environment.seeds = seeds_scenario.setup(environment)
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
@@ -15,11 +15,9 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем генерацию данных (на master или локально) и загружаем в окружение Locust
+    # пользователей текущего процесса: worker получает от master только свой срез
+    environment.seeds = seeds_scenario.setup(environment)
 
 class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
     # Типизируем объект пользователя из сидинга
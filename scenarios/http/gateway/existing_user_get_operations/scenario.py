@@ -4,6 +4,7 @@ from locust.env import Environment
 from clients.http.gateway.locust import GatewayHTTPTaskSet
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.config.http import HTTPDecodeMode
 from tools.locust.user import LocustBaseUser
 
 
@@ -12,13 +13,14 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Создаём пользователей, счета, карты и операции (на master или локально)
+    # и загружаем пользователей текущего процесса: worker получает от master только свой срез
+    environment.seeds = seeds_scenario.setup(environment)
 
 
 class GetOperationsTaskSet(GatewayHTTPTaskSet):
+    # Ответы сценария не используются: вместо полной валидации списков операций проверяем только идентификаторы
+    decode_mode = HTTPDecodeMode.IDS
     seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
 
     def on_start(self) -> None:
@@ -1,11 +1,19 @@
-from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
-from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
-from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
-from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
-from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
-from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
-from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
-from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from gevent.pool import Pool
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from config import settings
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -18,6 +26,14 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from seeds.retry import SeedsRetryPolicy, describe_error
+from seeds.telemetry import SeedsTelemetry
+from tools.config.seeds import SeedsRetryConfig, SeedsFailurePolicy
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_BUILDER")
+
+T = TypeVar("T")
 
 
 class SeedsBuilder:
@@ -30,6 +46,11 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Количество пользователей, создаваемых параллельно (размер пула greenlet'ов)
+        telemetry: Телеметрия генерации (время и ошибки вызовов gateway, созданные сущности, прогресс)
+        retry_policy: Политика повторов вызовов gateway при временных ошибках
+        failure_policy: Поведение при ошибке создания пользователя после всех повторов вызовов
+        user_attempts: Количество попыток создать пользователя для политики retry
     """
 
     def __init__(
@@ -37,12 +58,34 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            workers: int = 1,
+            telemetry: SeedsTelemetry | None = None,
+            retry_policy: SeedsRetryPolicy | None = None,
+            failure_policy: SeedsFailurePolicy = SeedsFailurePolicy.ABORT,
+            user_attempts: int = 1
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.workers = workers
+        self.telemetry = telemetry or SeedsTelemetry()
+        self.retry_policy = retry_policy or SeedsRetryPolicy(SeedsRetryConfig())
+        self.failure_policy = failure_policy
+        self.user_attempts = user_attempts
+
+    def _call(self, method: Callable[..., T], **kwargs: Any) -> T:
+        """
+        Вызывает метод клиента gateway, повторяя его при временных ошибках (self.retry_policy).
+        Каждая попытка учитывается в телеметрии под именем метода.
+        """
+        name = method.__name__
+        return self.retry_policy.call(
+            name,
+            lambda: self.telemetry.call(name, method, **kwargs),
+            on_retry=lambda: self.telemetry.record_retry(name)
+        )
 
     def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -55,7 +98,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной виртуальной карты
         """
-        response = self.cards_gateway_client.issue_virtual_card(
+        response = self._call(
+            self.cards_gateway_client.issue_virtual_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +116,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self._call(
+            self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -89,7 +134,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self._call(
+            self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -106,7 +152,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self._call(
+            self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -120,7 +167,8 @@ class SeedsBuilder:
         :param account_id: ID аккаунта
         :return: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self._call(
+            self.operations_gateway_client.make_transfer_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -134,7 +182,8 @@ class SeedsBuilder:
         :param account_id: ID аккаунта
         :return: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
+        response = self._call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -150,7 +199,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self._call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -163,7 +212,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self._call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -180,7 +229,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
+        response = self._call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
         card_id = response.account.cards[0].id
         account_id = response.account.id
 
@@ -225,7 +274,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
+        response = self._call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
         card_id = response.account.cards[0].id
         account_id = response.account.id
 
@@ -268,7 +317,7 @@ class SeedsBuilder:
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
+        response = self._call(self.users_gateway_client.create_user)
 
         return SeedUserResult(
             user_id=response.user.id,
@@ -290,19 +339,125 @@ class SeedsBuilder:
             ]
         )
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def try_build_user(self, plan: SeedUsersPlan) -> SeedUserResult | None:
+        """
+        Создаёт пользователя с учётом политики ошибок (self.failure_policy):
+        - abort: ошибка пробрасывается;
+        - skip: пользователь пропускается;
+        - retry: пользователь создаётся заново, пока не исчерпаны self.user_attempts попыток.
+
+        Сущности, созданные до ошибки, остаются в сервисе, но в результат не попадают.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult | None: Созданный пользователь или None, если пользователь пропущен
+        """
+        attempt = 1
+        while True:
+            try:
+                return self.build_user(plan=plan)
+            except Exception as error:
+                if self.failure_policy == SeedsFailurePolicy.SKIP:
+                    logger.warning(f"Skipping user after error: {describe_error(error)}")
+                    self.telemetry.record_skipped_user()
+                    return None
+
+                if self.failure_policy == SeedsFailurePolicy.ABORT or attempt >= self.user_attempts:
+                    raise
+
+                logger.warning(
+                    f"Rebuilding user after error ({describe_error(error)}), "
+                    f"attempt {attempt + 1}/{self.user_attempts}"
+                )
+                self.telemetry.record_user_retry()
+                attempt += 1
+
+    def build(
+            self,
+            plan: SeedsPlan,
+            users: list[SeedUserResult] | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        Если workers > 1, пользователи создаются параллельно в пуле greenlet'ов.
+        Внутри одного пользователя порядок вызовов сохраняется
+        (пользователь → счета → карты → операции), а итоговый список
+        пользователей упорядочен так же, как при последовательной генерации.
+
+        Если переданы уже созданные пользователи (продолжение прерванной генерации
+        или дозаполнение дампа под увеличенный план), создаётся только недостающая часть.
+
+        Ошибка создания пользователя обрабатывается согласно self.failure_policy
+        (см. try_build_user): при политике skip пользователей в результате может быть меньше,
+        чем по плану.
+
+        Телеметрия (self.telemetry) сбрасывается в начале генерации и после неё содержит
+        статистику вызовов и созданных сущностей (см. SeedsTelemetry.get_summary).
+
         Args:
             plan: Полный план генерации данных
+            users: Уже созданные пользователи по тому же плану пользователя
+            on_user: Вызывается для каждого нового пользователя сразу после его создания
+                (например, для записи в чекпоинт)
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        users = list(users or [])[:plan.users.count]
+        self.telemetry.start(planned_users=plan.users.count, reused_users=len(users), workers=self.workers)
+
+        def build_user(_: int) -> SeedUserResult | None:
+            user = self.try_build_user(plan=plan.users)
+            if user is None:
+                return None
+
+            self.telemetry.record_user(user)
+            if on_user is not None:
+                on_user(user)
+
+            return user
+
+        missing = range(plan.users.count - len(users))
+        if self.workers <= 1:
+            users.extend(build_user(index) for index in missing)
+            return SeedsResult(users=[user for user in users if user is not None])
+
+        pool = Pool(size=self.workers)
+        try:
+            # imap возвращает результаты в порядке запуска задач, а не в порядке их завершения,
+            # поэтому порядок пользователей в результате детерминирован
+            users.extend(pool.imap(build_user, missing))
+        finally:
+            # Если один из пользователей упал с ошибкой — останавливаем остальные greenlet'ы
+            pool.kill()
+
+        # Пропущенные пользователи (политика skip) в результат не попадают
+        return SeedsResult(users=[user for user in users if user is not None])
+
+    def check_user(self, user_id: str) -> bool:
+        """
+        Проверяет, что ранее созданный пользователь существует в сервисе.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            bool: True, если сервис вернул пользователя
+        """
+        try:
+            response = self.users_gateway_client.get_user(user_id=user_id)
+        except Exception:
+            # gRPC-клиент сообщает об ошибке исключением RpcError,
+            # HTTP-клиент сидера — исключением HTTPStatusError
+            return False
+
+        return response.user.id == user_id
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -312,11 +467,18 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
+    # Вызовы сидера ограничены дедлайном: зависший вызов завершается DEADLINE_EXCEEDED и повторяется
+    deadline = settings.seeds.retry.deadline
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_grpc_client(),
-        cards_gateway_client=build_cards_gateway_grpc_client(),
-        accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        users_gateway_client=UsersGatewayGRPCClient(channel=build_gateway_grpc_client(timeout=deadline)),
+        cards_gateway_client=CardsGatewayGRPCClient(channel=build_gateway_grpc_client(timeout=deadline)),
+        accounts_gateway_client=AccountsGatewayGRPCClient(channel=build_gateway_grpc_client(timeout=deadline)),
+        operations_gateway_client=OperationsGatewayGRPCClient(channel=build_gateway_grpc_client(timeout=deadline)),
+        workers=settings.seeds.workers,
+        telemetry=SeedsTelemetry(progress_interval=settings.seeds.progress_interval),
+        retry_policy=SeedsRetryPolicy(settings.seeds.retry),
+        failure_policy=settings.seeds.failure_policy,
+        user_attempts=settings.seeds.user_attempts
     )
 
 
@@ -327,9 +489,15 @@ def build_http_seeds_builder():
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
+    # Ответы 4xx/5xx завершаются HTTPStatusError: по статусу политика повторов отличает временные ошибки
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_http_client(),
-        cards_gateway_client=build_cards_gateway_http_client(),
-        accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        users_gateway_client=UsersGatewayHTTPClient(client=build_gateway_http_client(raise_for_status=True)),
+        cards_gateway_client=CardsGatewayHTTPClient(client=build_gateway_http_client(raise_for_status=True)),
+        accounts_gateway_client=AccountsGatewayHTTPClient(client=build_gateway_http_client(raise_for_status=True)),
+        operations_gateway_client=OperationsGatewayHTTPClient(client=build_gateway_http_client(raise_for_status=True)),
+        workers=settings.seeds.workers,
+        telemetry=SeedsTelemetry(progress_interval=settings.seeds.progress_interval),
+        retry_policy=SeedsRetryPolicy(settings.seeds.retry),
+        failure_policy=settings.seeds.failure_policy,
+        user_attempts=settings.seeds.user_attempts
     )
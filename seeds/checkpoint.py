@@ -0,0 +1,105 @@
+import json
+import os
+from typing import TextIO
+
+from seeds.schema.result import SeedUserResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_CHECKPOINT")
+
+
+class SeedsCheckpoint:
+    """
+    Чекпоинт сидинга — файл JSON Lines, в который каждый созданный пользователь
+    дописывается сразу по завершении, а не только в конце генерации.
+
+    Первая строка файла — заголовок с отпечатком плана пользователя ({"fingerprint": ...}),
+    далее по одной строке SeedUserResult. Если генерация прервалась, повторный запуск
+    с тем же отпечатком продолжит с уже созданных пользователей.
+    """
+
+    def __init__(self, scenario: str, fingerprint: str):
+        """
+        :param scenario: Название сценария нагрузки. Используется для генерации имени файла.
+        :param fingerprint: Отпечаток плана одного пользователя и адреса сервиса.
+        """
+        self.path = f"./dumps/{scenario}_seeds.checkpoint.jsonl"
+        self.fingerprint = fingerprint
+        self.file: TextIO | None = None
+
+    def load(self) -> list[SeedUserResult]:
+        """
+        Загружает пользователей из чекпоинта прерванной генерации.
+
+        Чекпоинт с другим отпечатком игнорируется. Недописанная последняя строка
+        (процесс упал во время записи) отбрасывается.
+
+        :return: Список ранее созданных пользователей.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        users: list[SeedUserResult] = []
+        with open(self.path, 'r', encoding="utf-8") as file:
+            try:
+                header = json.loads(file.readline())
+            except json.JSONDecodeError:
+                return []
+
+            if header.get("fingerprint") != self.fingerprint:
+                logger.info(f"Checkpoint {self.path} was created for another plan, ignoring it")
+                return []
+
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+
+                users.append(SeedUserResult.model_validate_json(line))
+
+        logger.debug(f"Loaded {len(users)} users from checkpoint: {self.path}")
+        return users
+
+    def open(self, users: list[SeedUserResult]) -> None:
+        """
+        Создаёт чекпоинт заново: пишет заголовок и уже имеющихся пользователей.
+
+        :param users: Пользователи, с которых продолжается генерация.
+        """
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+
+        self.file = open(self.path, 'w', encoding="utf-8")
+        self.file.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+        for user in users:
+            self.file.write(user.model_dump_json() + "\n")
+
+        self.file.flush()
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Дописывает созданного пользователя в чекпоинт.
+
+        Запись выполняется одной операцией без переключения greenlet'ов,
+        поэтому метод безопасно вызывать из параллельно работающих greenlet'ов билдера.
+
+        :param user: Полностью созданный пользователь.
+        """
+        self.file.write(user.model_dump_json() + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        Закрывает файл чекпоинта, сохраняя его на диске.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def remove(self) -> None:
+        """
+        Закрывает и удаляет чекпоинт после успешного сохранения итогового дампа.
+        """
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            logger.debug(f"Checkpoint removed: {self.path}")
@@ -0,0 +1,352 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import overload
+
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+
+# Списки карт и операций счёта в порядке полей SeedAccountResult
+ACCOUNT_CARDS_FIELDS = ("physical_cards", "virtual_cards")
+ACCOUNT_OPERATIONS_FIELDS = (
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+)
+# Списки счетов пользователя в порядке полей SeedUserResult
+USER_ACCOUNTS_FIELDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+
+
+class CompactStrings:
+    """
+    Таблица строк: все идентификаторы хранятся в одном буфере байт, строка адресуется номером.
+
+    Вместо отдельного объекта str на каждый идентификатор хранится только его текст
+    и 4 байта смещения. Одинаковые строки при добавлении дедуплицируются.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offsets = array("I", [0])
+        self._interned: dict[str, int] | None = {}
+
+    def add(self, value: str) -> int:
+        """
+        Добавляет строку в таблицу (или находит ранее добавленную).
+
+        :param value: Строка.
+        :return: Номер строки в таблице.
+        """
+        index = self._interned.get(value)
+        if index is None:
+            index = len(self.offsets) - 1
+            self.buffer += value.encode("utf-8")
+            self.offsets.append(len(self.buffer))
+            self._interned[value] = index
+
+        return index
+
+    def freeze(self) -> None:
+        """
+        Завершает наполнение таблицы: словарь дедупликации больше не нужен и освобождается.
+        """
+        self._interned = None
+        self.buffer = bytes(self.buffer)
+
+    def __getitem__(self, index: int) -> str:
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+
+class CompactRelation:
+    """
+    Отношение "один ко многим" в формате CSR: дочерние номера строки i лежат
+    в values[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self):
+        self.offsets = array("I", [0])
+        self.values = array("I")
+
+    def append(self, values: Sequence[int]) -> None:
+        self.values.extend(values)
+        self.offsets.append(len(self.values))
+
+    def __getitem__(self, index: int) -> array:
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+
+class CompactList(Sequence):
+    """
+    Неизменяемый список представлений, создаваемых по обращению к элементу.
+    """
+
+    __slots__ = ("_indexes", "_factory")
+
+    def __init__(self, indexes: array, factory):
+        self._indexes = indexes
+        self._factory = factory
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._factory(value) for value in self._indexes[index]]
+
+        return self._factory(self._indexes[index])
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class CompactSeedCard:
+    """
+    Представление карты из компактного результата. Повторяет атрибуты SeedCardResult.
+    """
+
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+    def __repr__(self) -> str:
+        return f"CompactSeedCard(card_id={self.card_id!r})"
+
+
+class CompactSeedOperation:
+    """
+    Представление операции из компактного результата. Повторяет атрибуты SeedOperationResult.
+    """
+
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+    def __repr__(self) -> str:
+        return f"CompactSeedOperation(operation_id={self.operation_id!r})"
+
+
+class CompactSeedAccount:
+    """
+    Представление счёта из компактного результата. Повторяет атрибуты SeedAccountResult.
+    """
+
+    __slots__ = ("_result", "_index")
+
+    def __init__(self, result: "CompactSeedsResult", index: int):
+        self._result = result
+        self._index = index
+
+    @property
+    def account_id(self) -> str:
+        return self._result.strings[self._result.account_ids[self._index]]
+
+    def _cards(self, field: str) -> CompactList:
+        strings = self._result.strings
+        return CompactList(self._result.account_cards[field][self._index], lambda i: CompactSeedCard(strings[i]))
+
+    def _operations(self, field: str) -> CompactList:
+        strings = self._result.strings
+        return CompactList(
+            self._result.account_operations[field][self._index],
+            lambda i: CompactSeedOperation(strings[i])
+        )
+
+    @property
+    def physical_cards(self) -> CompactList:
+        return self._cards("physical_cards")
+
+    @property
+    def virtual_cards(self) -> CompactList:
+        return self._cards("virtual_cards")
+
+    @property
+    def top_up_operations(self) -> CompactList:
+        return self._operations("top_up_operations")
+
+    @property
+    def purchase_operations(self) -> CompactList:
+        return self._operations("purchase_operations")
+
+    @property
+    def transfer_operations(self) -> CompactList:
+        return self._operations("transfer_operations")
+
+    @property
+    def cash_withdrawal_operations(self) -> CompactList:
+        return self._operations("cash_withdrawal_operations")
+
+    def to_model(self) -> SeedAccountResult:
+        """
+        Преобразует представление в модель SeedAccountResult.
+        """
+        return SeedAccountResult(
+            account_id=self.account_id,
+            **{
+                field: [SeedCardResult(card_id=card.card_id) for card in self._cards(field)]
+                for field in ACCOUNT_CARDS_FIELDS
+            },
+            **{
+                field: [
+                    SeedOperationResult(operation_id=operation.operation_id)
+                    for operation in self._operations(field)
+                ]
+                for field in ACCOUNT_OPERATIONS_FIELDS
+            }
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactSeedAccount(account_id={self.account_id!r})"
+
+
+class CompactSeedUser:
+    """
+    Представление пользователя из компактного результата. Повторяет атрибуты SeedUserResult,
+    поэтому используется в сценариях вместо модели без изменений:
+    seed_user.credit_card_accounts[0].account_id.
+    """
+
+    __slots__ = ("_result", "_index")
+
+    def __init__(self, result: "CompactSeedsResult", index: int):
+        self._result = result
+        self._index = index
+
+    @property
+    def user_id(self) -> str:
+        return self._result.strings[self._result.user_ids[self._index]]
+
+    def _accounts(self, field: str) -> CompactList:
+        result = self._result
+        return CompactList(result.user_accounts[field][self._index], lambda i: CompactSeedAccount(result, i))
+
+    @property
+    def deposit_accounts(self) -> CompactList:
+        return self._accounts("deposit_accounts")
+
+    @property
+    def savings_accounts(self) -> CompactList:
+        return self._accounts("savings_accounts")
+
+    @property
+    def debit_card_accounts(self) -> CompactList:
+        return self._accounts("debit_card_accounts")
+
+    @property
+    def credit_card_accounts(self) -> CompactList:
+        return self._accounts("credit_card_accounts")
+
+    def to_model(self) -> SeedUserResult:
+        """
+        Преобразует представление в модель SeedUserResult.
+        """
+        return SeedUserResult(
+            user_id=self.user_id,
+            **{
+                field: [account.to_model() for account in self._accounts(field)]
+                for field in USER_ACCOUNTS_FIELDS
+            }
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactSeedUser(user_id={self.user_id!r})"
+
+
+class CompactSeedsResult(Sequence[CompactSeedUser]):
+    """
+    Компактное представление результата сидинга в памяти.
+
+    Идентификаторы хранятся в таблице строк (CompactStrings), связи пользователь → счета
+    и счёт → карты/операции — в массивах номеров (CompactRelation). Объекты-представления
+    пользователей, счетов, карт и операций создаются только при обращении к ним.
+
+    Является последовательностью пользователей, поэтому подставляется в SeedsResult.users
+    (через to_seeds_result) и раздаётся виртуальным юзерам так же, как список моделей.
+    """
+
+    def __init__(self):
+        self.strings = CompactStrings()
+        self.user_ids = array("I")
+        self.account_ids = array("I")
+        self.user_accounts = {field: CompactRelation() for field in USER_ACCOUNTS_FIELDS}
+        self.account_cards = {field: CompactRelation() for field in ACCOUNT_CARDS_FIELDS}
+        self.account_operations = {field: CompactRelation() for field in ACCOUNT_OPERATIONS_FIELDS}
+
+    def _add_account(self, account: SeedAccountResult) -> int:
+        index = len(self.account_ids)
+        self.account_ids.append(self.strings.add(account.account_id))
+
+        for field, relation in self.account_cards.items():
+            relation.append([self.strings.add(card.card_id) for card in getattr(account, field)])
+
+        for field, relation in self.account_operations.items():
+            relation.append([self.strings.add(operation.operation_id) for operation in getattr(account, field)])
+
+        return index
+
+    def _add_user(self, user: SeedUserResult) -> None:
+        self.user_ids.append(self.strings.add(user.user_id))
+
+        for field, relation in self.user_accounts.items():
+            relation.append([self._add_account(account) for account in getattr(user, field)])
+
+    @classmethod
+    def from_result(cls, result: SeedsResult) -> "CompactSeedsResult":
+        """
+        Строит компактное представление из результата сидинга.
+
+        :param result: Результат сидинга (Pydantic-модели).
+        :return: Компактное представление с теми же данными.
+        """
+        compact = cls()
+        for user in result.users:
+            compact._add_user(user)
+
+        compact.strings.freeze()
+        return compact
+
+    def to_result(self) -> SeedsResult:
+        """
+        Преобразует компактное представление обратно в результат сидинга без потерь.
+
+        :return: SeedsResult с Pydantic-моделями.
+        """
+        return SeedsResult(users=[user.to_model() for user in self])
+
+    def to_seeds_result(self) -> SeedsResult:
+        """
+        Возвращает SeedsResult, пользователями которого являются компактные представления
+        (без создания моделей).
+        """
+        return SeedsResult.model_construct(users=self)
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> CompactSeedUser: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CompactSeedUser]: ...
+
+    def __getitem__(self, index: int | slice) -> CompactSeedUser | list[CompactSeedUser]:
+        if isinstance(index, slice):
+            return [CompactSeedUser(self, i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("seed user index out of range")
+
+        return CompactSeedUser(self, index)
+
+    def __iter__(self) -> Iterator[CompactSeedUser]:
+        for index in range(len(self)):
+            yield CompactSeedUser(self, index)
@@ -0,0 +1,136 @@
+import random
+import threading
+from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Generic, TypeVar
+
+from tools.config.seeds import SeedsExhaustionPolicy
+
+T = TypeVar("T")
+
+
+class SeedsExhaustedError(Exception):
+    """
+    Ошибка исчерпания сидинговых данных: все пользователи уже выданы,
+    а политика раздачи не позволяет продолжить.
+    """
+
+
+class SeedsDispenser(Generic[T]):
+    """
+    Раздатчик сидинговых пользователей.
+
+    Последовательная выдача выполняется сдвигом курсора по неизменяемому списку — O(1)
+    вместо list.pop(0), который сдвигает весь список. Случайный выбор — O(1) по индексу.
+
+    Пользователь, выданный через take(), можно вернуть через release(): возвращённые
+    пользователи выдаются повторно раньше, чем раздача упрётся в политику исчерпания.
+    Это позволяет переиспользовать пользователей между сессиями виртуальных пользователей.
+    """
+
+    def __init__(
+            self,
+            items: Sequence[T],
+            policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL,
+            block_timeout: float | None = None
+    ):
+        """
+        :param items: Сидинговые пользователи (список не копируется и не изменяется).
+        :param policy: Поведение при исчерпании последовательной выдачи.
+        :param block_timeout: Максимальное время ожидания возврата для политики block (None — без ограничения).
+        """
+        self.items = items
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self._cursor = 0
+        self._returned: deque[T] = deque()
+        # Под gevent threading.Condition пропатчен и ожидание не блокирует весь процесс
+        self._condition = threading.Condition()
+
+    @property
+    def remaining(self) -> int:
+        """
+        Количество пользователей, которые ещё можно получить без срабатывания политики исчерпания.
+        """
+        return len(self.items) - self._cursor + len(self._returned)
+
+    def _take_available(self) -> T | None:
+        if self._returned:
+            return self._returned.popleft()
+
+        if self._cursor < len(self.items):
+            item = self.items[self._cursor]
+            self._cursor += 1
+            return item
+
+        return None
+
+    def take(self) -> T:
+        """
+        Возвращает следующего пользователя по порядку.
+
+        :return: Сидинговый пользователь.
+        :raises SeedsExhaustedError: Если пользователей нет и политика не позволяет продолжить.
+        """
+        with self._condition:
+            item = self._take_available()
+            if item is not None:
+                return item
+
+            if not self.items:
+                raise SeedsExhaustedError("Seeds result is empty: nothing to dispense")
+
+            match self.policy:
+                case SeedsExhaustionPolicy.WRAP:
+                    self._cursor = 1
+                    return self.items[0]
+                case SeedsExhaustionPolicy.BLOCK:
+                    # wait_for возвращает управление с захваченной блокировкой,
+                    # поэтому возвращённого пользователя не перехватит другой ожидающий
+                    if self._condition.wait_for(lambda: self._returned, timeout=self.block_timeout):
+                        return self._returned.popleft()
+
+                    raise SeedsExhaustedError(
+                        f"No seeded user was returned within {self.block_timeout}s: "
+                        f"all {len(self.items)} users are in use"
+                    )
+                case _:
+                    raise SeedsExhaustedError(
+                        f"All {len(self.items)} seeded users have been dispensed. "
+                        f"Seed more users, return them with release() or change SEEDS.EXHAUSTION_POLICY"
+                    )
+
+    def pick(self) -> T:
+        """
+        Возвращает случайного пользователя без изъятия из раздачи.
+
+        :return: Сидинговый пользователь.
+        :raises SeedsExhaustedError: Если результат сидинга пуст.
+        """
+        if not self.items:
+            raise SeedsExhaustedError("Seeds result is empty: nothing to pick")
+
+        return self.items[random.randrange(len(self.items))]
+
+    def release(self, item: T) -> None:
+        """
+        Возвращает ранее выданного пользователя для повторной выдачи.
+
+        :param item: Пользователь, полученный через take().
+        """
+        with self._condition:
+            self._returned.append(item)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self) -> Iterator[T]:
+        """
+        Выдаёт пользователя на время блока with и возвращает его по выходу из блока.
+        """
+        item = self.take()
+        try:
+            yield item
+        finally:
+            self.release(item)
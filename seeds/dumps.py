@@ -1,14 +1,90 @@
+import mmap
 import os
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import overload
 
-from seeds.schema.result import SeedsResult
+from config import settings
+from seeds.schema.meta import SeedsMeta
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.schema.summary import SeedsSummary
+from tools.config.seeds import SeedsDumpFormat
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 path = f"./dumps/"
 
+
+class SeedUsersDump(Sequence[SeedUserResult]):
+    """
+    Ленивое представление пользователей из дампа формата jsonl.
+
+    Файл данных и индекс смещений отображаются в память через mmap: при загрузке ничего не
+    читается и не валидируется, пользователь разбирается из своей строки только при обращении
+    к нему по индексу. Индекс хранит N + 1 смещений (uint64): строка i занимает байты
+    [offsets[i], offsets[i + 1]) файла данных.
+    """
+
+    def __init__(self, data_path: str, index_path: str):
+        """
+        :param data_path: Путь к файлу с пользователями (по одному JSON на строку).
+        :param index_path: Путь к файлу индекса смещений.
+        """
+        self._data = self._map(data_path)
+        self._index = self._map(index_path)
+        self._offsets = memoryview(self._index).cast("Q")
+
+    @staticmethod
+    def _map(file_path: str) -> mmap.mmap | bytes:
+        with open(file_path, 'rb') as file:
+            # Пустой файл отобразить в память нельзя
+            if os.fstat(file.fileno()).st_size == 0:
+                return b""
+
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return max(len(self._offsets) - 1, 0)
+
+    @overload
+    def __getitem__(self, index: int) -> SeedUserResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SeedUserResult]: ...
+
+    def __getitem__(self, index: int | slice) -> SeedUserResult | list[SeedUserResult]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("seed user index out of range")
+
+        return SeedUserResult.model_validate_json(self._data[self._offsets[index]:self._offsets[index + 1]])
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def get_seeds_result_path(scenario: str) -> str:
+    """
+    Возвращает путь к дампу сидинга в формате, заданном в SEEDS.DUMP_FORMAT.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+        return f"./dumps/{scenario}_seeds.jsonl"
+
+    return f"./dumps/{scenario}_seeds.json"
+
+
 def save_seeds_result(result: SeedsResult, scenario: str):
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Сохраняет результат сидинга (SeedsResult) в JSON-файл
+    (или в JSON Lines с индексом смещений, если SEEDS.DUMP_FORMAT=jsonl).
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
@@ -18,21 +94,110 @@ def save_seeds_result(result: SeedsResult, scenario: str):
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
+    if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+        save_seeds_result_jsonl(result=result, scenario=scenario)
+        return
+
     # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
     with open(f"./dumps/{scenario}_seeds.json", 'w+', encoding="utf-8") as file:
         file.write(result.model_dump_json())
         logger.debug(f"Seeding result saved to file: {path}{scenario}_seeds.json")
 
 
+def save_seeds_result_jsonl(result: SeedsResult, scenario: str):
+    """
+    Сохраняет пользователей по одному на строку в {scenario}_seeds.jsonl и индекс смещений строк в {scenario}_seeds.idx.
+
+    :param result: Результат сидинга, сгенерированный билдером.
+    :param scenario: Название сценария нагрузки.
+    """
+    offsets = array("Q", [0])
+    with open(f"./dumps/{scenario}_seeds.jsonl", 'wb') as file:
+        for user in result.users:
+            file.write(user.model_dump_json().encode("utf-8") + b"\n")
+            offsets.append(file.tell())
+
+    with open(f"./dumps/{scenario}_seeds.idx", 'wb') as file:
+        offsets.tofile(file)
+
+    logger.debug(f"Seeding result saved to file: {path}{scenario}_seeds.jsonl")
+
 
 def load_seeds_result(scenario: str) -> SeedsResult:
     """
     Загружает результат сидинга из JSON-файла.
 
+    Для формата jsonl пользователи не валидируются при загрузке: SeedsResult.users
+    будет ленивой последовательностью SeedUsersDump.
+
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
     :return: Объект SeedsResult, восстановленный из файла.
     """
+    if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+        logger.debug(f"Seeding result loaded from file: {path}{scenario}_seeds.jsonl")
+        users = SeedUsersDump(f"./dumps/{scenario}_seeds.jsonl", f"./dumps/{scenario}_seeds.idx")
+        # model_construct не валидирует и не копирует последовательность пользователей
+        return SeedsResult.model_construct(users=users)
+
     # Открываем файл и валидируем его как объект SeedsResult
     with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
         logger.debug(f"Seeding result loaded from file: {path}{scenario}_seeds.json")
         return SeedsResult.model_validate_json(file.read())
+
+
+def save_seeds_meta(meta: SeedsMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга (SeedsMeta) рядом с самим дампом.
+
+    :param meta: Метаданные дампа: отпечаток плана, адрес сервиса, время создания.
+    :param scenario: Название сценария нагрузки. Используется для генерации имени файла.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(f"./dumps/{scenario}_seeds.meta.json", 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json(indent=2))
+        logger.debug(f"Seeding meta saved to file: {path}{scenario}_seeds.meta.json")
+
+
+def save_seeds_summary(summary: SeedsSummary, scenario: str):
+    """
+    Сохраняет итоги генерации сидинга (SeedsSummary) рядом с дампом.
+
+    :param summary: Итоги генерации: время и ошибки вызовов gateway, созданные сущности, пропускная способность.
+    :param scenario: Название сценария нагрузки. Используется для генерации имени файла.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(f"./dumps/{scenario}_seeds.summary.json", 'w+', encoding="utf-8") as file:
+        file.write(summary.model_dump_json(indent=2))
+        logger.debug(f"Seeding summary saved to file: {path}{scenario}_seeds.summary.json")
+
+
+def load_seeds_meta(scenario: str) -> SeedsMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsMeta или None, если дампа или метаданных нет.
+    """
+    if not os.path.exists(get_seeds_result_path(scenario)):
+        return None
+
+    if not os.path.exists(f"./dumps/{scenario}_seeds.meta.json"):
+        return None
+
+    with open(f"./dumps/{scenario}_seeds.meta.json", 'r', encoding="utf-8") as file:
+        return SeedsMeta.model_validate_json(file.read())
+
+
+def remove_seeds_meta(scenario: str):
+    """
+    Удаляет метаданные дампа сидинга, тем самым инвалидируя кэш: при следующем запуске данные будут созданы заново.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    if os.path.exists(f"./dumps/{scenario}_seeds.meta.json"):
+        os.remove(f"./dumps/{scenario}_seeds.meta.json")
+        logger.debug(f"Seeding meta removed: {path}{scenario}_seeds.meta.json")
@@ -0,0 +1,102 @@
+import random
+from collections.abc import Callable
+from typing import TypeVar
+
+import gevent
+from grpc import Call, RpcError, StatusCode
+from httpx import HTTPStatusError, NetworkError, RemoteProtocolError, TimeoutException
+
+from tools.config.seeds import SeedsRetryConfig
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_RETRY")
+
+T = TypeVar("T")
+
+
+class SeedsRetryPolicy:
+    """
+    Политика повторов вызовов gateway при сидинге.
+
+    Повторяются только временные ошибки: коды gRPC и HTTP-статусы из настроек, а также сетевые
+    ошибки и таймауты HTTP. Ошибки запроса (INVALID_ARGUMENT, NOT_FOUND, 4xx и т.д.) и ошибки
+    валидации ответа сразу пробрасываются — повтор их не исправит.
+
+    Пауза перед повтором выбирается случайно от 0 до границы, которая растёт экспоненциально
+    (initial_backoff * multiplier ** (попытка - 1), не больше max_backoff). Разброс не даёт
+    параллельным greenlet'ам сидера повторять вызовы одновременно и снова перегружать стенд.
+
+    Повтор создающего вызова после DEADLINE_EXCEEDED или обрыва соединения может создать
+    лишнюю сущность, если сервис успел выполнить первый вызов. Для сидинга это безопасно:
+    в результат попадает только сущность из успешного ответа.
+    """
+
+    def __init__(self, config: SeedsRetryConfig):
+        """
+        :param config: Настройки повторов (SEEDS.RETRY).
+        """
+        self.config = config
+        self.retryable_grpc_codes = {StatusCode[name] for name in config.retryable_grpc_codes}
+        self.retryable_http_statuses = set(config.retryable_http_statuses)
+        # Отдельный генератор: паузы не должны сдвигать последовательность глобального random
+        self.random = random.Random()
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Проверяет, что ошибка временная и вызов можно повторить.
+        """
+        if isinstance(error, RpcError):
+            return isinstance(error, Call) and error.code() in self.retryable_grpc_codes
+
+        if isinstance(error, HTTPStatusError):
+            return error.response.status_code in self.retryable_http_statuses
+
+        return isinstance(error, (TimeoutException, NetworkError, RemoteProtocolError))
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Возвращает паузу в секундах перед повтором после неудачной попытки attempt (начиная с 1).
+        """
+        ceiling = min(self.config.max_backoff, self.config.initial_backoff * self.config.multiplier ** (attempt - 1))
+        return self.random.uniform(0, ceiling)
+
+    def call(self, name: str, func: Callable[[], T], on_retry: Callable[[], None] | None = None) -> T:
+        """
+        Выполняет вызов, повторяя его при временных ошибках.
+
+        :param name: Имя вызова для логов.
+        :param func: Вызов без аргументов.
+        :param on_retry: Вызывается перед каждым повтором (например, для учёта повтора в телеметрии).
+        :return: Результат первой успешной попытки.
+        """
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as error:
+                if attempt >= self.config.attempts or not self.is_retryable(error):
+                    raise
+
+                backoff = self.get_backoff(attempt)
+                logger.warning(
+                    f"{name} failed ({describe_error(error)}), "
+                    f"retry {attempt}/{self.config.attempts - 1} in {backoff:.2f}s"
+                )
+                if on_retry is not None:
+                    on_retry()
+
+                gevent.sleep(backoff)
+                attempt += 1
+
+
+def describe_error(error: Exception) -> str:
+    """
+    Возвращает краткое описание ошибки вызова gateway: код gRPC, HTTP-статус или тип исключения.
+    """
+    if isinstance(error, RpcError) and isinstance(error, Call):
+        return f"{error.code().name}: {error.details()}"
+
+    if isinstance(error, HTTPStatusError):
+        return f"HTTP {error.response.status_code}"
+
+    return f"{type(error).__name__}: {error}"
@@ -1,14 +1,47 @@
+import hashlib
+import random
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 
+import gevent
+from gevent.event import AsyncResult
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import MasterRunner, WorkerRunner, STATE_MISSING
+
+from config import settings
 from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.checkpoint import SeedsCheckpoint
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import (
+    save_seeds_result,
+    load_seeds_result,
+    save_seeds_meta,
+    load_seeds_meta,
+    remove_seeds_meta,
+    save_seeds_summary
+)
+from seeds.schema.meta import SeedsMeta
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsDistribution
 from tools.logger import get_logger
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
 logger = get_logger("SEEDS_SCENARIO")
 
+# Типы сообщений Locust для передачи срезов сидинговых данных от master к worker'ам
+SEEDS_REQUEST_MESSAGE = "seeds_request"
+SEEDS_RESPONSE_MESSAGE = "seeds_response"
+SEEDS_ERROR_MESSAGE = "seeds_error"
+
+
+class SeedsDistributionError(Exception):
+    """
+    Ошибка получения worker'ом среза сидинговых данных: сидинг на master завершился ошибкой
+    или worker'ов больше, чем --expect-workers.
+    """
+
 
 class SeedsScenario(ABC):
     """
@@ -41,6 +74,133 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def host(self) -> str:
+        """
+        Адрес сервиса, в котором создаются данные. Входит в отпечаток кэша:
+        дамп, созданный на другом стенде, не переиспользуется.
+        """
+        return settings.gateway_grpc_client.client_url
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток сидинга: sha256 от плана (со всеми значениями, включая значения по умолчанию) и адреса сервиса.
+        """
+        payload = f"{self.host}\n{self.plan.model_dump_json()}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def users_fingerprint(self) -> str:
+        """
+        Отпечаток плана одного пользователя (без количества пользователей) и адреса сервиса.
+        Пользователи с одинаковым отпечатком взаимозаменяемы: по нему продолжается прерванная
+        генерация и дозаполняется дамп при увеличении количества пользователей.
+        """
+        payload = f"{self.host}\n{self.plan.users.model_dump_json(exclude={'count'})}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def checkpoint(self) -> SeedsCheckpoint:
+        """
+        Чекпоинт генерации, в который пользователи записываются по мере создания.
+        """
+        return SeedsCheckpoint(scenario=self.scenario, fingerprint=self.users_fingerprint)
+
+    def invalidate(self) -> None:
+        """
+        Инвалидирует кэш сидинга: при следующем вызове build данные будут созданы заново,
+        без продолжения из чекпоинта и дозаполнения существующего дампа.
+        """
+        logger.info(f"[{self.scenario}] Invalidating seeding cache.")
+        remove_seeds_meta(scenario=self.scenario)
+        self.checkpoint.remove()
+
+    def load_reusable_users(self, checkpoint: SeedsCheckpoint) -> list[SeedUserResult]:
+        """
+        Возвращает уже созданных пользователей, которых можно переиспользовать в новой генерации:
+        из чекпоинта прерванной генерации или из предыдущего дампа с тем же планом пользователя.
+        :param checkpoint: Чекпоинт текущей генерации.
+        :return: Список пользователей (пустой, если переиспользовать нечего).
+        """
+        if settings.seeds.force_rebuild:
+            return []
+
+        users = checkpoint.load()
+        if users:
+            logger.info(f"[{self.scenario}] Resuming seeding from checkpoint with {len(users)} users.")
+            return users
+
+        # Дамп дозаполняется, только если изменилось лишь количество пользователей,
+        # а сами пользователи дампа актуальны
+        meta = load_seeds_meta(scenario=self.scenario)
+        if (
+                settings.seeds.cache
+                and meta is not None
+                and meta.fingerprint != self.fingerprint
+                and meta.users_fingerprint == self.users_fingerprint
+                and self.is_reusable(meta)
+        ):
+            users = load_seeds_result(scenario=self.scenario).users
+            logger.info(f"[{self.scenario}] Topping up existing dump with {len(users)} users.")
+            return users
+
+        return []
+
+    def is_fresh(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать существующий дамп вместо повторного сидинга.
+
+        Дамп переиспользуется, если совпадает отпечаток плана и адреса сервиса, формат дампа, не истёк TTL
+        (SEEDS.CACHE_TTL) и выборочная проверка пользователей через gateway (SEEDS.LIVENESS_SAMPLE) успешна.
+        :return: True, если дамп актуален.
+        """
+        if not settings.seeds.cache or settings.seeds.force_rebuild:
+            return False
+
+        meta = load_seeds_meta(scenario=self.scenario)
+        if meta is None:
+            logger.info(f"[{self.scenario}] Seeding cache miss: no dump metadata found.")
+            return False
+
+        if meta.fingerprint != self.fingerprint:
+            logger.info(f"[{self.scenario}] Seeding cache miss: plan or host has changed.")
+            return False
+
+        return self.is_reusable(meta)
+
+    def is_reusable(self, meta: SeedsMeta) -> bool:
+        """
+        Проверяет, что пользователи существующего дампа ещё можно использовать:
+        дамп сохранён в текущем формате (SEEDS.DUMP_FORMAT), не истёк TTL (SEEDS.CACHE_TTL)
+        и выборочная проверка пользователей через gateway (SEEDS.LIVENESS_SAMPLE) успешна.
+        :param meta: Метаданные существующего дампа.
+        :return: True, если пользователи дампа актуальны.
+        """
+        # Дамп читается в формате из текущих настроек: дамп в другом формате (например, устаревший
+        # JSON-дамп рядом с новыми метаданными) считается отсутствующим
+        if meta.dump_format != settings.seeds.dump_format:
+            logger.info(
+                f"[{self.scenario}] Seeding cache miss: dump format {meta.dump_format} "
+                f"differs from {settings.seeds.dump_format}."
+            )
+            return False
+
+        ttl = settings.seeds.cache_ttl
+        if ttl is not None and datetime.now() - meta.created_at > timedelta(seconds=ttl):
+            logger.info(f"[{self.scenario}] Seeding cache miss: dump created at {meta.created_at} is older than {ttl}s.")
+            return False
+
+        if settings.seeds.liveness_sample > 0:
+            users = load_seeds_result(scenario=self.scenario).users
+            sample = random.sample(users, k=min(settings.seeds.liveness_sample, len(users)))
+            missing = [user.user_id for user in sample if not self.builder.check_user(user.user_id)]
+            if missing:
+                logger.info(f"[{self.scenario}] Seeding cache miss: users not found in {self.host}: {missing}")
+                return False
+
+        return True
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -52,6 +212,44 @@ class SeedsScenario(ABC):
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
+    def save_summary(self, completed: bool) -> None:
+        """
+        Сохраняет итоги генерации рядом с дампом и выводит их в лог.
+        :param completed: Генерация завершилась успешно.
+        """
+        summary = self.builder.telemetry.get_summary(scenario=self.scenario, host=self.host, completed=completed)
+        save_seeds_summary(summary=summary, scenario=self.scenario)
+
+        errors = sum(call.errors for call in summary.calls.values())
+        retries = sum(call.retries for call in summary.calls.values())
+        # Методы, на которые пришлась большая часть времени генерации
+        slowest = sorted(summary.calls.items(), key=lambda item: item[1].total_s, reverse=True)[:3]
+        logger.info(
+            f"[{self.scenario}] Seeding summary: {summary.created.users} users, {summary.created.accounts} accounts, "
+            f"{summary.created.cards} cards, {summary.created.operations} operations in {summary.duration_s}s "
+            f"({summary.throughput.users_per_second} users/s, {summary.throughput.operations_per_second} operations/s), "
+            f"{errors} errors, {retries} retries, {summary.skipped_users} skipped users, "
+            f"{summary.user_retries} user retries; most time in: "
+            + ", ".join(f"{name} {call.total_s}s (p99 {call.p99_ms} ms)" for name, call in slowest)
+        )
+
+    @staticmethod
+    def prepare(result: SeedsResult) -> SeedsResult:
+        """
+        Подготавливает загруженный результат к раздаче пользователей виртуальным юзерам:
+        при SEEDS.COMPACT переводит его в компактное представление и настраивает раздачу.
+        :param result: Объект SeedsResult, пользователи которого будут раздаваться.
+        :return: Объект SeedsResult, готовый к раздаче.
+        """
+        if settings.seeds.compact:
+            result = CompactSeedsResult.from_result(result).to_seeds_result()
+
+        result.configure_dispenser(
+            policy=settings.seeds.exhaustion_policy,
+            block_timeout=settings.seeds.block_timeout
+        )
+        return result
+
     def load(self) -> SeedsResult:
         """
         Загружает результаты сидинга из файла.
@@ -59,7 +257,8 @@ class SeedsScenario(ABC):
         """
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        # Подготавливаем раздачу пользователей виртуальным юзерам
+        result = self.prepare(load_seeds_result(scenario=self.scenario))
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
@@ -67,14 +266,205 @@ class SeedsScenario(ABC):
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если дамп для того же плана и сервиса уже есть и актуален, генерация пропускается.
         """
+        if self.is_fresh():
+            logger.info(f"[{self.scenario}] Seeding cache hit: reusing existing dump, generation skipped.")
+            return
+
+        # Пользователей из чекпоинта или предыдущего дампа создавать повторно не нужно
+        checkpoint = self.checkpoint
+        users = self.load_reusable_users(checkpoint)
+
+        # Сбрасываем метаданные до генерации: прерванный сидинг не должен оставить "свежий" дамп
+        remove_seeds_meta(scenario=self.scenario)
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
+        # Запускаем генерацию, записывая каждого созданного пользователя в чекпоинт
+        checkpoint.open(users)
+        completed = False
+        try:
+            result = self.builder.build(self.plan, users=users, on_user=checkpoint.append)
+            completed = True
+        finally:
+            checkpoint.close()
+            # Итоги сохраняются и при ошибке: по ним видно, на каком вызове остановилась генерация
+            self.save_summary(completed=completed)
         # Логируем завершение генерации
         logger.info(f"[{self.scenario}] Seeding data generation completed.")
         # Сохраняем результат
         self.save(result)
+        if len(result.users) < self.plan.users.count:
+            # Часть пользователей пропущена (SEEDS.FAILURE_POLICY=skip): неполный дамп не считается
+            # актуальным, а чекпоинт сохраняется — следующий запуск создаст недостающих пользователей
+            logger.warning(
+                f"[{self.scenario}] Seeding result is partial: {len(result.users)} of {self.plan.users.count} users. "
+                f"Missing users will be created on the next run."
+            )
+            return
+
+        # Сохраняем метаданные дампа для переиспользования при следующих запусках
+        save_seeds_meta(
+            meta=SeedsMeta(
+                scenario=self.scenario,
+                fingerprint=self.fingerprint,
+                users_fingerprint=self.users_fingerprint,
+                host=self.host,
+                created_at=datetime.now(),
+                users_count=len(result.users),
+                dump_format=settings.seeds.dump_format
+            ),
+            scenario=self.scenario
+        )
+        # Итоговый дамп сохранён — чекпоинт больше не нужен
+        checkpoint.remove()
+
+    def setup(self, environment: Environment) -> SeedsResult:
+        """
+        Выполняет сидинг и возвращает пользователей для текущего процесса Locust.
+
+        - В локальном запуске (и в режиме replicate) процесс сам генерирует и загружает данные.
+        - Master генерирует данные один раз и по запросу отдаёт каждому worker'у его срез.
+        - Worker не выполняет сидинг, а запрашивает у master свой срез пользователей.
+
+        Срез с номером i — это каждый N-й пользователь, начиная с i-го, где N — ожидаемое
+        количество worker'ов (--expect-workers). Номера срезов раздаёт master (см. setup_master).
+        Срезы не пересекаются, поэтому разные worker'ы не работают с одними и теми же счетами.
+
+        :param environment: Объект окружения Locust (вызывается из обработчика events.init).
+        :return: Объект SeedsResult с пользователями текущего процесса.
+        """
+        runner = environment.runner
+        if settings.seeds.distribution == SeedsDistribution.PARTITION:
+            if isinstance(runner, MasterRunner):
+                return self.setup_master(runner)
+
+            if isinstance(runner, WorkerRunner):
+                return self.setup_worker(runner)
+
+        self.build()
+        return self.load()
+
+    def setup_master(self, runner: MasterRunner) -> SeedsResult:
+        """
+        Генерирует данные на master и отвечает worker'ам их срезами.
+
+        Номер среза закрепляется за worker'ом при первом запросе: первый свободный номер
+        от 0 до N - 1, где N — --expect-workers. Номера отключившихся worker'ов освобождаются,
+        поэтому переподключившийся worker получает срез, который больше никто не использует.
+        Если свободного номера нет (worker'ов больше, чем --expect-workers), worker получает ошибку:
+        иначе два worker'а работали бы с одними и теми же пользователями.
+
+        Если сидинг на master завершился ошибкой, worker'ы получают её сразу, а не по истечении
+        SEEDS.DISTRIBUTION_TIMEOUT.
+
+        :param runner: Master-раннер Locust.
+        :return: Объект SeedsResult со всеми пользователями.
+        """
+        ready: AsyncResult = AsyncResult()
+        workers = max(runner.environment.parsed_options.expect_workers, 1)
+        # node_id worker'а -> номер его среза
+        partitions: dict[str, int] = {}
+
+        if workers == 1:
+            logger.warning(
+                f"[{self.scenario}] --expect-workers is not set or is 1: all users go to a single worker, "
+                f"any additional worker will be rejected. Set --expect-workers to the number of workers."
+            )
+
+        def get_partition_index(node_id: str) -> int | None:
+            if node_id in partitions:
+                return partitions[node_id]
+
+            # Освобождаем номера worker'ов, которые отключились или перестали присылать heartbeat
+            for stale in list(partitions):
+                worker = runner.clients.get(stale)
+                if worker is None or worker.state == STATE_MISSING:
+                    del partitions[stale]
+
+            used = set(partitions.values())
+            index = next((index for index in range(workers) if index not in used), None)
+            if index is not None:
+                partitions[node_id] = index
+
+            return index
+
+        def send_error(node_id: str, error: str) -> None:
+            logger.error(f"[{self.scenario}] Rejecting seeding request from worker {node_id}: {error}")
+            runner.send_message(SEEDS_ERROR_MESSAGE, data=error, client_id=node_id)
+
+        def on_seeds_request(environment: Environment, msg: Message, **kwargs):
+            # Номер среза назначается до ожидания сидинга — в порядке подключения worker'ов
+            index = get_partition_index(msg.node_id)
+            if index is None:
+                send_error(
+                    msg.node_id,
+                    f"all {workers} partitions are taken by connected workers {sorted(partitions)}; "
+                    f"--expect-workers must be at least the number of workers"
+                )
+                return
+
+            # Обработчик запускается в отдельном greenlet'е (concurrent=True),
+            # поэтому ожидание окончания сидинга не блокирует обмен сообщениями с worker'ами
+            try:
+                result: SeedsResult = ready.get()
+            except Exception as error:
+                send_error(msg.node_id, f"seeding failed on master: {error!r}")
+                return
+
+            # Пользователи могут быть компактными представлениями — валидируем по атрибутам
+            partition = SeedsResult.model_validate(
+                {"users": result.users[index::workers]},
+                from_attributes=True
+            )
+
+            logger.info(
+                f"[{self.scenario}] Sending {len(partition.users)} of {len(result.users)} users "
+                f"to worker {msg.node_id} (partition {index} of {workers})"
+            )
+            runner.send_message(SEEDS_RESPONSE_MESSAGE, data=partition.model_dump_json(), client_id=msg.node_id)
+
+        # Регистрируем обработчик до начала сидинга, чтобы не потерять ранние запросы worker'ов
+        runner.register_message(SEEDS_REQUEST_MESSAGE, on_seeds_request, concurrent=True)
+
+        try:
+            self.build()
+            result = self.load()
+        except Exception as error:
+            ready.set_exception(error)
+            # Даём ожидающим обработчикам отправить ошибку worker'ам до завершения master
+            gevent.idle()
+            raise
+
+        ready.set(result)
+        return result
+
+    def setup_worker(self, runner: WorkerRunner) -> SeedsResult:
+        """
+        Запрашивает у master срез сидинговых данных для текущего worker'а.
+        :param runner: Worker-раннер Locust.
+        :return: Объект SeedsResult с пользователями среза.
+        :raises SeedsDistributionError: Master не выдал срез (сидинг упал или все срезы заняты).
+        """
+        response: AsyncResult = AsyncResult()
+
+        def on_seeds_response(environment: Environment, msg: Message, **kwargs):
+            response.set(msg.data)
+
+        def on_seeds_error(environment: Environment, msg: Message, **kwargs):
+            response.set_exception(SeedsDistributionError(msg.data))
+
+        runner.register_message(SEEDS_RESPONSE_MESSAGE, on_seeds_response)
+        runner.register_message(SEEDS_ERROR_MESSAGE, on_seeds_error)
+
+        logger.info(f"[{self.scenario}] Requesting seeding partition from master.")
+        runner.send_message(SEEDS_REQUEST_MESSAGE)
+
+        result = self.prepare(
+            SeedsResult.model_validate_json(response.get(timeout=settings.seeds.distribution_timeout))
+        )
+
+        logger.info(f"[{self.scenario}] Received {len(result.users)} users from master.")
+        return result
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from tools.config.seeds import SeedsDumpFormat
+
+
+class SeedsMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, по которым решается, можно ли переиспользовать дамп.
+
+    Attributes:
+        scenario (str): Название сценария, для которого создан дамп.
+        fingerprint (str): sha256 от плана сидинга и адреса целевого сервиса.
+        users_fingerprint (str | None): sha256 от плана одного пользователя (без количества) и адреса сервиса.
+            Совпадение означает, что дамп можно дозаполнить под план с большим количеством пользователей.
+        host (str): Адрес сервиса, в котором были созданы данные.
+        created_at (datetime): Время создания дампа.
+        users_count (int): Количество пользователей в дампе.
+        dump_format (SeedsDumpFormat | None): Формат, в котором сохранён дамп (SEEDS.DUMP_FORMAT).
+            None — метаданные записаны до появления поля, формат дампа неизвестен.
+    """
+    scenario: str
+    fingerprint: str
+    users_fingerprint: str | None = None
+    host: str
+    created_at: datetime
+    users_count: int
+    dump_format: SeedsDumpFormat | None = None
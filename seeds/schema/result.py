@@ -1,6 +1,10 @@
-import random
+from collections.abc import Iterator
+from contextlib import contextmanager
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from seeds.dispenser import SeedsDispenser
+from tools.config.seeds import SeedsExhaustionPolicy
 
 
 class SeedCardResult(BaseModel):
@@ -64,23 +68,75 @@ class SeedsResult(BaseModel):
     """
     Главная модель результата сидинга — агрегирует всех созданных пользователей.
 
+    Раздача пользователей виртуальным юзерам выполняется через SeedsDispenser:
+    список users при этом не изменяется. Для дампа в формате jsonl users — ленивая
+    последовательность (SeedUsersDump), пользователи которой читаются с диска по обращению.
+
     Attributes:
         users (list[SeedUserResult]): Список сгенерированных пользователей.
     """
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    _dispenser: SeedsDispenser[SeedUserResult] | None = PrivateAttr(default=None)
+
+    @property
+    def dispenser(self) -> SeedsDispenser[SeedUserResult]:
+        """
+        Раздатчик пользователей. Создаётся при первом обращении с политикой fail,
+        если не был настроен через configure_dispenser.
+        """
+        if self._dispenser is None:
+            self._dispenser = SeedsDispenser(self.users)
+
+        return self._dispenser
+
+    def configure_dispenser(
+            self,
+            policy: SeedsExhaustionPolicy,
+            block_timeout: float | None = None
+    ) -> None:
+        """
+        Настраивает раздачу пользователей. Сбрасывает состояние раздачи.
+
+        Args:
+            policy (SeedsExhaustionPolicy): Поведение при исчерпании последовательной выдачи.
+            block_timeout (float | None): Максимальное время ожидания для политики block.
+        """
+        self._dispenser = SeedsDispenser(self.users, policy=policy, block_timeout=block_timeout)
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего пользователя по порядку.
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Когда пользователи закончились, срабатывает политика исчерпания раздатчика.
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
+
+        Raises:
+            SeedsExhaustedError: Если пользователей не осталось и политика не позволяет продолжить.
+        """
+        return self.dispenser.take()
+
+    def return_user(self, user: SeedUserResult) -> None:
+        """
+        Возвращает пользователя, полученного через get_next_user, для повторной выдачи.
+
+        Args:
+            user (SeedUserResult): Ранее выданный пользователь.
+        """
+        self.dispenser.release(user)
+
+    @contextmanager
+    def lease_user(self) -> Iterator[SeedUserResult]:
+        """
+        Выдаёт следующего пользователя на время блока with и возвращает его по выходу из блока.
         """
-        return self.users.pop(0)
+        with self.dispenser.lease() as user:
+            yield user
 
     def get_random_user(self) -> SeedUserResult:
         """
@@ -91,4 +147,4 @@ class SeedsResult(BaseModel):
         Returns:
             SeedUserResult: Случайный пользователь.
         """
-        return random.choice(self.users)
+        return self.dispenser.pick()
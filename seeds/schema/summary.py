@@ -0,0 +1,87 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SeedsCallSummary(BaseModel):
+    """
+    Статистика одного метода gateway, вызываемого сидером (create_user, open_credit_card_account...).
+
+    Attributes:
+        calls (int): Количество вызовов, включая завершившиеся ошибкой.
+        errors (int): Количество вызовов, завершившихся ошибкой.
+        retries (int): Количество повторов вызова.
+        total_s (float): Суммарное время вызовов в секундах — по нему видно, какие вызовы доминируют.
+        mean_ms (float): Среднее время вызова.
+        p50_ms (float): Медиана времени вызова.
+        p90_ms (float): 90-й процентиль времени вызова.
+        p99_ms (float): 99-й процентиль времени вызова.
+        max_ms (float): Максимальное время вызова.
+    """
+    calls: int
+    errors: int
+    retries: int
+    total_s: float
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class SeedsEntitiesSummary(BaseModel):
+    """
+    Количество сущностей, созданных сидером (без пользователей, переиспользованных из чекпоинта или дампа).
+    """
+    users: int = 0
+    accounts: int = 0
+    cards: int = 0
+    operations: int = 0
+
+
+class SeedsThroughputSummary(BaseModel):
+    """
+    Пропускная способность сидинга: сущностей и вызовов gateway в секунду.
+    """
+    users_per_second: float
+    accounts_per_second: float
+    cards_per_second: float
+    operations_per_second: float
+    calls_per_second: float
+
+
+class SeedsSummary(BaseModel):
+    """
+    Итоги генерации сидинговых данных. Сохраняется рядом с дампом ({scenario}_seeds.summary.json),
+    в том числе если генерация завершилась ошибкой.
+
+    Attributes:
+        scenario (str): Название сценария.
+        host (str): Адрес сервиса, в котором создавались данные.
+        completed (bool): Генерация завершилась успешно.
+        started_at (datetime): Время начала генерации.
+        finished_at (datetime): Время окончания генерации.
+        duration_s (float): Длительность генерации в секундах.
+        workers (int): Количество пользователей, создававшихся параллельно.
+        planned_users (int): Количество пользователей по плану.
+        reused_users (int): Пользователи, переиспользованные из чекпоинта или предыдущего дампа.
+        created (SeedsEntitiesSummary): Созданные сущности.
+        skipped_users (int): Пользователи, пропущенные после ошибки (SEEDS.FAILURE_POLICY=skip).
+        user_retries (int): Повторные попытки создать пользователя (SEEDS.FAILURE_POLICY=retry).
+        throughput (SeedsThroughputSummary): Сущностей и вызовов в секунду.
+        calls (dict[str, SeedsCallSummary]): Статистика по методам gateway.
+    """
+    scenario: str
+    host: str
+    completed: bool
+    started_at: datetime
+    finished_at: datetime
+    duration_s: float
+    workers: int
+    planned_users: int
+    reused_users: int
+    created: SeedsEntitiesSummary
+    skipped_users: int = 0
+    user_retries: int = 0
+    throughput: SeedsThroughputSummary
+    calls: dict[str, SeedsCallSummary]
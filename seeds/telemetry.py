@@ -0,0 +1,223 @@
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+from seeds.schema.result import SeedUserResult
+from seeds.schema.summary import (
+    SeedsSummary,
+    SeedsCallSummary,
+    SeedsEntitiesSummary,
+    SeedsThroughputSummary
+)
+from tools.hdr import HDRHistogram
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_TELEMETRY")
+
+T = TypeVar("T")
+
+# Время вызова хранится в микросекундах; вызовы дольше 10 минут ограничиваются этим значением
+HIGHEST_TRACKABLE_US = 600_000_000
+# Двух значащих цифр (погрешность до 1%) достаточно для сравнения методов между собой
+SIGNIFICANT_FIGURES = 2
+
+
+class SeedsCallStats:
+    """
+    Статистика одного метода gateway: гистограмма времени вызовов, ошибки и повторы.
+    """
+
+    def __init__(self):
+        self.histogram = HDRHistogram(HIGHEST_TRACKABLE_US, SIGNIFICANT_FIGURES)
+        self.total_time = 0.0
+        self.errors = 0
+        self.retries = 0
+
+    def to_summary(self) -> SeedsCallSummary:
+        histogram = self.histogram
+        return SeedsCallSummary(
+            calls=histogram.total_count,
+            errors=self.errors,
+            retries=self.retries,
+            total_s=round(self.total_time, 3),
+            mean_ms=round(histogram.get_mean() / 1000, 3),
+            p50_ms=histogram.get_value_at_percentile(50) / 1000,
+            p90_ms=histogram.get_value_at_percentile(90) / 1000,
+            p99_ms=histogram.get_value_at_percentile(99) / 1000,
+            max_ms=histogram.max_value / 1000
+        )
+
+
+class SeedsTelemetry:
+    """
+    Телеметрия генерации сидинговых данных.
+
+    Каждый вызов gateway из SeedsBuilder проходит через call: время вызова попадает
+    в HDR-гистограмму своего метода, исключения считаются ошибками. По каждому созданному
+    пользователю (record_user) считаются созданные сущности и не чаще раза в progress_interval
+    секунд пишется прогресс: готовность, скорость за последний интервал, среднее время вызова
+    за интервал и оценка оставшегося времени. Рост времени вызова от интервала к интервалу
+    показывает, что gateway замедлился по ходу генерации.
+    """
+
+    def __init__(self, progress_interval: float = 0.0):
+        """
+        :param progress_interval: Интервал вывода прогресса в секундах (0 — не выводить).
+        """
+        self.progress_interval = progress_interval
+        self.start()
+
+    def start(self, planned_users: int = 0, reused_users: int = 0, workers: int = 1) -> None:
+        """
+        Сбрасывает телеметрию перед генерацией.
+
+        :param planned_users: Количество пользователей по плану.
+        :param reused_users: Пользователи, уже созданные ранее (из чекпоинта или дампа).
+        :param workers: Количество пользователей, создаваемых параллельно.
+        """
+        self.planned_users = planned_users
+        self.reused_users = reused_users
+        self.workers = workers
+        self.calls: dict[str, SeedsCallStats] = {}
+        self.created = SeedsEntitiesSummary()
+        self.skipped_users = 0
+        self.user_retries = 0
+
+        self.started_at = datetime.now()
+        self.start_time = time.perf_counter()
+
+        # Показатели текущего интервала прогресса
+        self.interval_start_time = self.start_time
+        self.interval_users = 0
+        self.interval_calls = 0
+        self.interval_call_time = 0.0
+
+    def get_call_stats(self, name: str) -> SeedsCallStats:
+        stats = self.calls.get(name)
+        if stats is None:
+            stats = self.calls[name] = SeedsCallStats()
+
+        return stats
+
+    def call(self, name: str, func: Callable[..., T], **kwargs: Any) -> T:
+        """
+        Выполняет вызов gateway и учитывает его время и ошибку.
+
+        :param name: Имя метода в статистике (например, open_credit_card_account).
+        :param func: Метод клиента.
+        :param kwargs: Аргументы метода.
+        :return: Результат метода.
+        """
+        stats = self.get_call_stats(name)
+        start_time = time.perf_counter()
+        try:
+            return func(**kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start_time
+            stats.histogram.record(round(elapsed * 1_000_000))
+            stats.total_time += elapsed
+            self.interval_calls += 1
+            self.interval_call_time += elapsed
+
+    def record_retry(self, name: str) -> None:
+        """
+        Учитывает повтор вызова метода gateway.
+        """
+        self.get_call_stats(name).retries += 1
+
+    def record_skipped_user(self) -> None:
+        """
+        Учитывает пользователя, пропущенного после ошибки (политика SEEDS.FAILURE_POLICY=skip).
+        """
+        self.skipped_users += 1
+
+    def record_user_retry(self) -> None:
+        """
+        Учитывает повторное создание пользователя после ошибки (политика SEEDS.FAILURE_POLICY=retry).
+        """
+        self.user_retries += 1
+
+    def record_user(self, user: SeedUserResult) -> None:
+        """
+        Учитывает созданного пользователя и его счета, карты и операции, при необходимости выводит прогресс.
+        """
+        accounts = [
+            *user.savings_accounts,
+            *user.deposit_accounts,
+            *user.debit_card_accounts,
+            *user.credit_card_accounts
+        ]
+        self.created.users += 1
+        self.created.accounts += len(accounts)
+        for account in accounts:
+            self.created.cards += len(account.virtual_cards) + len(account.physical_cards)
+            self.created.operations += (
+                    len(account.top_up_operations)
+                    + len(account.purchase_operations)
+                    + len(account.transfer_operations)
+                    + len(account.cash_withdrawal_operations)
+            )
+
+        self.interval_users += 1
+        if self.progress_interval > 0 and time.perf_counter() - self.interval_start_time >= self.progress_interval:
+            self.log_progress()
+
+    def log_progress(self) -> None:
+        now = time.perf_counter()
+        elapsed = max(now - self.interval_start_time, 1e-9)
+
+        done = self.reused_users + self.created.users
+        remaining = max(self.planned_users - done, 0)
+        users_per_second = self.interval_users / elapsed
+        eta = timedelta(seconds=round(remaining / users_per_second)) if users_per_second else "unknown"
+        mean_call_ms = self.interval_call_time / self.interval_calls * 1000 if self.interval_calls else 0.0
+
+        logger.info(
+            f"Seeding progress: {done}/{self.planned_users} users "
+            f"({done / max(self.planned_users, 1):.1%}), {users_per_second:.1f} users/s, "
+            f"{self.interval_calls / elapsed:.1f} calls/s, mean call {mean_call_ms:.1f} ms, ETA {eta}"
+        )
+
+        self.interval_start_time = now
+        self.interval_users = 0
+        self.interval_calls = 0
+        self.interval_call_time = 0.0
+
+    def get_summary(self, scenario: str, host: str, completed: bool) -> SeedsSummary:
+        """
+        Возвращает итоги генерации.
+
+        :param scenario: Название сценария.
+        :param host: Адрес сервиса, в котором создавались данные.
+        :param completed: Генерация завершилась успешно.
+        """
+        duration = time.perf_counter() - self.start_time
+        per_second = 1 / duration if duration > 0 else 0.0
+        calls = {name: stats.to_summary() for name, stats in sorted(self.calls.items())}
+
+        return SeedsSummary(
+            scenario=scenario,
+            host=host,
+            completed=completed,
+            started_at=self.started_at,
+            finished_at=datetime.now(),
+            duration_s=round(duration, 3),
+            workers=self.workers,
+            planned_users=self.planned_users,
+            reused_users=self.reused_users,
+            created=self.created.model_copy(),
+            skipped_users=self.skipped_users,
+            user_retries=self.user_retries,
+            throughput=SeedsThroughputSummary(
+                users_per_second=round(self.created.users * per_second, 2),
+                accounts_per_second=round(self.created.accounts * per_second, 2),
+                cards_per_second=round(self.created.cards * per_second, 2),
+                operations_per_second=round(self.created.operations * per_second, 2),
+                calls_per_second=round(sum(call.calls for call in calls.values()) * per_second, 2)
+            ),
+            calls=calls
+        )
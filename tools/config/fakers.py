@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class FakeConfig(BaseModel):
+    # Выдавать тестовые данные из заранее сгенерированных пулов вместо вызова Faker на каждое значение
+    pooled: bool = False
+
+    # Размер каждого пула значений (имена, телефоны, суммы, категории, значения перечислений)
+    pool_size: int = Field(default=10000, gt=0)
+
+    # Зерно запуска: при заданном значении каждый worker и виртуальный пользователь получает
+    # свой воспроизводимый поток данных (суммы, статусы, категории, имена совпадают между запусками)
+    seed: int | None = None
@@ -1,6 +1,17 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
 
+class GRPCChannelPoolStrategy(StrEnum):
+    # Пользователи назначаются на каналы по очереди: 0, 1, 2, ..., 0, 1, ...
+    ROUND_ROBIN = "round_robin"
+    # Канал выбирается по хэшу пользователя — один и тот же пользователь всегда попадает в один канал
+    STICKY = "sticky"
+    # Пользователь назначается на канал с наименьшим числом закреплённых пользователей
+    LEAST_LOADED = "least_loaded"
+
+
 class GRPCClientConfig(BaseModel):
     # Порт gRPC-сервиса, к которому подключаемся (например, 9003)
     port: int
@@ -8,6 +19,14 @@ class GRPCClientConfig(BaseModel):
     # Хост (например, localhost или grpc-gateway.internal)
     host: str
 
+    # Размер общего пула gRPC-каналов (HTTP/2 соединений) на процесс.
+    # 0 — пул выключен: каждый виртуальный пользователь открывает свой канал (каналы делят
+    # общее соединение gRPC, как и без пула).
+    pool_size: int = 0
+
+    # Стратегия назначения виртуальных пользователей на каналы пула
+    pool_strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN
+
     @property
     def client_url(self) -> str:
         """
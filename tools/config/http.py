@@ -1,6 +1,27 @@
+from enum import StrEnum
+
+from httpx import Limits
 from pydantic import BaseModel, HttpUrl
 
 
+class HTTPTransportScope(StrEnum):
+    # Отдельный транспорт (пул соединений) на каждый клиент — пять пулов на виртуального пользователя
+    CLIENT = "client"
+    # Один транспорт на виртуального пользователя, общий для всех его клиентов
+    USER = "user"
+    # Один транспорт на весь процесс, общий для всех виртуальных пользователей
+    PROCESS = "process"
+
+
+class HTTPDecodeMode(StrEnum):
+    # Полная валидация ответа Pydantic-схемой (даты, перечисления, все вложенные модели)
+    FULL = "full"
+    # Ответ разбирается без валидации, поля читаются из JSON по обращению
+    TRUSTED = "trusted"
+    # Валидируются только идентификаторы (поля id и *_id) и вложенные модели, в которых они лежат
+    IDS = "ids"
+
+
 class HTTPClientConfig(BaseModel):
     # URL сервиса, к которому будем подключаться через httpx
     url: HttpUrl
@@ -8,6 +29,24 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Область, в пределах которой переиспользуется транспорт (пул соединений) httpx
+    transport_scope: HTTPTransportScope = HTTPTransportScope.CLIENT
+
+    # Максимальное число соединений в пуле транспорта (значения по умолчанию совпадают с httpx)
+    max_connections: int = 100
+
+    # Максимальное число простаивающих keep-alive соединений в пуле
+    max_keepalive_connections: int = 20
+
+    # Время (в секундах), через которое простаивающее keep-alive соединение закрывается
+    keepalive_expiry: float = 5.0
+
+    # Использовать HTTP/2 (требует установленного пакета h2: pip install httpx[http2])
+    http2: bool = False
+
+    # Режим декодирования ответов клиентами в нагрузочных тестах (может переопределяться сценарием)
+    decode_mode: HTTPDecodeMode = HTTPDecodeMode.FULL
+
     @property
     def client_url(self) -> str:
         """
@@ -19,3 +58,14 @@ class HTTPClientConfig(BaseModel):
         - Если передать HttpUrl напрямую, будет ошибка типов.
         """
         return str(self.url)
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Возвращает лимиты пула соединений в виде httpx.Limits для создания транспорта.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
@@ -1,4 +1,20 @@
-from pydantic import BaseModel
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class LocustLoadModel(StrEnum):
+    # Закрытая модель: пользователь ждёт wait_time_min..wait_time_max после каждой задачи
+    CLOSED = "closed"
+    # Открытая модель: задачи запускаются по расписанию с заданной интенсивностью (arrival_rate)
+    OPEN = "open"
+
+
+class LocustArrivalProcess(StrEnum):
+    # Равные интервалы между запусками задач
+    CONSTANT = "constant"
+    # Пуассоновский поток: экспоненциально распределённые интервалы с той же средней интенсивностью
+    POISSON = "poisson"
 
 
 class LocustUserConfig(BaseModel):
@@ -7,3 +23,54 @@ class LocustUserConfig(BaseModel):
 
     # Максимальное время ожидания между задачами (в секундах)
     wait_time_max: float = 3
+
+    # Модель нагрузки: closed (по числу пользователей) или open (по интенсивности запусков задач)
+    load_model: LocustLoadModel = LocustLoadModel.CLOSED
+
+    # Суммарная интенсивность запуска задач (в секунду) на весь сценарий для открытой модели
+    arrival_rate: float = Field(default=10, gt=0)
+
+    # Распределение интервалов между запусками задач для открытой модели
+    arrival_process: LocustArrivalProcess = LocustArrivalProcess.CONSTANT
+
+
+class LocustMetricsMode(StrEnum):
+    # Каждый запрос сразу отправляется в environment.events.request (стандартное поведение Locust)
+    IMMEDIATE = "immediate"
+    # Запросы складываются в кольцевой буфер и пачками переносятся в статистику фоновым greenlet'ом
+    BUFFERED = "buffered"
+
+
+class LocustMetricsOverflow(StrEnum):
+    # Буфер переполнен — запрос, добавивший запись, сам переносит буфер в статистику (back-pressure)
+    FLUSH = "flush"
+    # Буфер переполнен — самая старая запись вытесняется и учитывается как потерянная
+    DROP_OLDEST = "drop_oldest"
+    # Буфер переполнен — новая запись отбрасывается и учитывается как потерянная
+    DROP_NEWEST = "drop_newest"
+
+
+class LocustMetricsConfig(BaseModel):
+    # Способ доставки метрик запросов в статистику Locust
+    mode: LocustMetricsMode = LocustMetricsMode.IMMEDIATE
+
+    # Ёмкость кольцевого буфера (количество записей) для режима buffered
+    buffer_size: int = 65536
+
+    # Интервал (в секундах) переноса буфера в статистику Locust
+    flush_interval: float = 0.5
+
+    # Поведение при переполнении буфера
+    overflow: LocustMetricsOverflow = LocustMetricsOverflow.FLUSH
+
+    # Вести HDR-гистограммы времени ответа (точные p99.9/p99.99, экспорт в {csv-префикс}_hdr.csv/.json)
+    hdr: bool = False
+
+    # Количество значащих цифр точности HDR-гистограмм (от 1 до 5)
+    hdr_significant_figures: int = Field(default=3, ge=1, le=5)
+
+    # Максимальное время ответа (в миллисекундах), сохраняемое в HDR-гистограмме
+    hdr_highest_trackable_ms: int = 3_600_000
+
+    # Процентили, выгружаемые из HDR-гистограмм
+    hdr_percentiles: list[float] = [50, 90, 95, 99, 99.9, 99.99, 100]
@@ -0,0 +1,105 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class SeedsExhaustionPolicy(StrEnum):
+    """
+    Поведение раздатчика сидинговых пользователей, когда последовательная выдача исчерпана.
+
+    - wrap: начать раздачу заново с первого пользователя;
+    - block: ждать, пока другой виртуальный пользователь вернёт арендованного пользователя;
+    - fail: сразу завершиться понятной ошибкой SeedsExhaustedError.
+    """
+    WRAP = "wrap"
+    BLOCK = "block"
+    FAIL = "fail"
+
+
+class SeedsDistribution(StrEnum):
+    """
+    Способ получения сидинговых данных в распределённом запуске Locust (master/worker).
+
+    - partition: сидинг выполняет только master, каждый worker получает свой непересекающийся срез пользователей;
+    - replicate: каждый процесс сам выполняет сидинг всего плана и раздаёт всех пользователей.
+    """
+    PARTITION = "partition"
+    REPLICATE = "replicate"
+
+
+class SeedsDumpFormat(StrEnum):
+    """
+    Формат дампа сидинга.
+
+    - json: весь SeedsResult одним JSON-документом, при загрузке валидируется целиком;
+    - jsonl: по одному пользователю на строку плюс индекс смещений, пользователи читаются лениво через mmap.
+    """
+    JSON = "json"
+    JSONL = "jsonl"
+
+
+class SeedsFailurePolicy(StrEnum):
+    """
+    Поведение сидера, когда создание пользователя завершилось ошибкой после всех повторов отдельных вызовов.
+
+    - abort: прервать генерацию (созданные пользователи остаются в чекпоинте);
+    - skip: пропустить пользователя и продолжить — в дампе будет меньше пользователей, чем по плану,
+      недостающие создаются при следующем запуске;
+    - retry: создать пользователя заново (всего SEEDS.USER_ATTEMPTS попыток), затем прервать генерацию.
+    """
+    ABORT = "abort"
+    SKIP = "skip"
+    RETRY = "retry"
+
+
+class SeedsRetryConfig(BaseModel):
+    # Количество попыток одного вызова gateway (1 — без повторов)
+    attempts: int = Field(default=3, ge=1)
+    # Верхняя граница паузы перед первым повтором (в секундах); пауза выбирается случайно от 0 до границы
+    initial_backoff: float = Field(default=0.2, ge=0)
+    # Максимальная граница паузы между повторами (в секундах)
+    max_backoff: float = Field(default=5.0, ge=0)
+    # Множитель границы паузы для каждого следующего повтора
+    multiplier: float = Field(default=2.0, ge=1)
+    # Дедлайн одного gRPC-вызова сидера в секундах (None — без дедлайна).
+    # HTTP-вызовы ограничены таймаутом GATEWAY_HTTP_CLIENT.TIMEOUT
+    deadline: float | None = 30.0
+    # Коды gRPC (имена grpc.StatusCode), при которых вызов повторяется
+    retryable_grpc_codes: list[str] = ["UNAVAILABLE", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED", "ABORTED", "INTERNAL"]
+    # HTTP-статусы, при которых вызов повторяется (сетевые ошибки и таймауты повторяются всегда)
+    retryable_http_statuses: list[int] = [429, 500, 502, 503, 504]
+
+
+class SeedsConfig(BaseModel):
+    # Количество пользователей, которые сидер создаёт параллельно (размер пула greenlet'ов).
+    # Значение 1 означает строго последовательную генерацию.
+    workers: int = 1
+    # Поведение get_next_user, когда все пользователи уже выданы
+    exhaustion_policy: SeedsExhaustionPolicy = SeedsExhaustionPolicy.FAIL
+    # Максимальное время ожидания возврата пользователя для политики block (в секундах)
+    block_timeout: float = 30.0
+    # Способ получения сидинговых данных worker'ами в распределённом запуске
+    distribution: SeedsDistribution = SeedsDistribution.PARTITION
+    # Максимальное время ожидания worker'ом своего среза от master (в секундах)
+    distribution_timeout: float = 600.0
+    # Повторно использовать дамп, если план сидинга и адрес сервиса не изменились
+    cache: bool = True
+    # Принудительно пересоздать данные, игнорируя кэш
+    force_rebuild: bool = False
+    # Время жизни дампа в секундах (None — без ограничения)
+    cache_ttl: float | None = None
+    # Сколько случайных пользователей из дампа проверить через gateway перед переиспользованием (0 — не проверять)
+    liveness_sample: int = 0
+    # Формат дампа сидинга
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+    # Хранить загруженных пользователей в компактном представлении (таблица строк и массивы номеров)
+    # вместо дерева Pydantic-моделей — снижает потребление памяти на больших пулах
+    compact: bool = False
+    # Интервал вывода прогресса сидинга (готовность, скорость, ETA) в секундах; 0 — не выводить
+    progress_interval: float = 10.0
+    # Повторы и дедлайны вызовов gateway при генерации
+    retry: SeedsRetryConfig = Field(default_factory=SeedsRetryConfig)
+    # Поведение при ошибке создания пользователя (abort, skip, retry)
+    failure_policy: SeedsFailurePolicy = SeedsFailurePolicy.ABORT
+    # Количество попыток создать пользователя для политики retry
+    user_attempts: int = Field(default=3, ge=1)
@@ -0,0 +1,67 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class StandInLatencyDistribution(StrEnum):
+    # Одинаковая задержка latency_ms
+    CONSTANT = "constant"
+    # Равномерно в диапазоне latency_ms ± latency_jitter_ms
+    UNIFORM = "uniform"
+    # Экспоненциально со средним latency_ms
+    EXPONENTIAL = "exponential"
+    # Логнормально с медианой latency_ms и разбросом latency_sigma (длинный «хвост», как у реальных сервисов)
+    LOGNORMAL = "lognormal"
+
+
+class StandInProfileConfig(BaseModel):
+    # Распределение задержки ответа
+    latency_distribution: StandInLatencyDistribution = StandInLatencyDistribution.CONSTANT
+
+    # Задержка ответа в миллисекундах (константа, среднее или медиана — в зависимости от распределения)
+    latency_ms: float = Field(default=0, ge=0)
+
+    # Половина ширины диапазона для равномерного распределения (в миллисекундах)
+    latency_jitter_ms: float = Field(default=0, ge=0)
+
+    # Параметр разброса логнормального распределения
+    latency_sigma: float = Field(default=0.5, gt=0)
+
+    # Доля ответов с ошибкой (от 0 до 1)
+    error_rate: float = Field(default=0, ge=0, le=1)
+
+    # HTTP-статус ответа с ошибкой
+    error_http_status: int = Field(default=500, ge=400, le=599)
+
+    # Код статуса gRPC ответа с ошибкой (имя grpc.StatusCode)
+    error_grpc_code: str = "INTERNAL"
+
+
+class StandInConfig(StandInProfileConfig):
+    # Адрес, на котором слушают серверы
+    host: str = "localhost"
+
+    # Порт HTTP-сервера (по умолчанию совпадает с GATEWAY_HTTP_CLIENT.URL)
+    http_port: int = 8003
+
+    # Порт gRPC-сервера (по умолчанию совпадает с GATEWAY_GRPC_CLIENT.PORT)
+    grpc_port: int = 9003
+
+    # Количество потоков gRPC-сервера (одновременно обрабатываемых вызовов с задержкой)
+    grpc_max_workers: int = Field(default=100, gt=0)
+
+    # Количество элементов в списках ответов (операции, счета, карты счёта)
+    list_size: int = Field(default=10, ge=0)
+
+    # Размер документов, чеков и тарифов в ответах (в байтах)
+    document_size: int = Field(default=1024, ge=0)
+
+    # Профили отдельных методов по имени gRPC-метода (GetOperations, MakePurchaseOperation...),
+    # действуют и для соответствующих HTTP-маршрутов. Заменяют общий профиль целиком
+    methods: dict[str, StandInProfileConfig] = Field(default_factory=dict)
+
+    def get_profile(self, method: str) -> StandInProfileConfig:
+        """
+        Возвращает профиль задержек и ошибок метода: переопределённый или общий.
+        """
+        return self.methods.get(method, self)
@@ -1,10 +1,55 @@
+import hashlib
+import itertools
 import time
+import uuid
+from collections.abc import Callable, Sequence
+from functools import cache
+from typing import Any
 
 from faker import Faker
 from faker.providers.python import TEnum
+from gevent.local import local
 
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+from config import settings
+from tools.config.fakers import FakeConfig
+
+try:
+    import numpy
+except ImportError:  # NumPy необязателен: без него пулы заполняются генератором случайных чисел Faker
+    numpy = None
+
+# Категории покупок для операций purchase
+PURCHASE_CATEGORIES = [
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+]
+
+
+@cache
+def get_proto_enum_values(value: EnumTypeWrapper) -> tuple[int, ...]:
+    """
+    Возвращает таблицу значений proto enum-типа (строится один раз на процесс).
+    EnumTypeWrapper.values() на каждый вызов создаёт новый список.
+    """
+    return tuple(value.values())
+
 
 class Fake:
     """
@@ -24,7 +69,7 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.random_element(value.values())
+        return self.faker.random.choice(get_proto_enum_values(value))
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -53,25 +98,7 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        return self.faker.random_element(PURCHASE_CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -123,6 +150,242 @@ class Fake:
         """
         return self.float(1, 1000)
 
+    def fork(self, seed: int, stream_id: str = "0") -> "Fake":
+        """
+        Создаёт независимый генератор с воспроизводимым потоком значений.
+
+        :param seed: Зерно потока (например, производное от зерна запуска, номера worker'а и пользователя).
+        :param stream_id: Идентификатор потока внутри процесса.
+        :return: Новый генератор того же типа.
+        """
+        return Fake(faker=build_seeded_faker(seed))
+
+
+class PooledFake(Fake):
+    """
+    Генератор тестовых данных, выдающий значения из заранее заполненных пулов.
+
+    Каждый пул (фамилии, телефоны, суммы, категории, значения конкретного перечисления)
+    заполняется целиком при первом обращении, после чего значения выдаются по кругу за O(1)
+    без вызова Faker. Суммы и выбор из перечислений генерируются пачкой через NumPy
+    (если установлен). Уникальность email обеспечивается счётчиком и идентификатором
+    запуска, а не текущим временем.
+
+    Пулы общие для процесса, а позиции выдачи (курсоры) — свои у каждого экземпляра:
+    экземпляры, созданные через fork, читают общие пулы независимо и без блокировок.
+    """
+
+    def __init__(
+            self,
+            faker: Faker,
+            pool_size: int,
+            pool_seed: int | None = None,
+            cursor_seed: int | None = None,
+            pools: dict[str, list] | None = None,
+            run_id: str | None = None,
+            stream_id: str = "0"
+    ):
+        """
+        :param faker: Экземпляр Faker, которым заполняются пулы (если pool_seed не задан).
+        :param pool_size: Количество значений в каждом пуле.
+        :param pool_seed: Зерно содержимого пулов (общее для всех потоков процесса).
+        :param cursor_seed: Зерно начальных позиций выдачи (своё у каждого потока).
+        :param pools: Общие пулы (передаются при fork).
+        :param run_id: Идентификатор запуска для email (передаётся при fork).
+        :param stream_id: Идентификатор потока внутри процесса для email.
+        """
+        super().__init__(faker)
+        self.pool_size = pool_size
+        self.pool_seed = pool_seed
+        self.cursor_seed = cursor_seed
+        self.pools: dict[str, list] = {} if pools is None else pools
+        self.cursors: dict[str, int] = {}
+
+        # Идентификатор запуска различает email'ы разных процессов и запусков,
+        # идентификатор потока и счётчик — внутри процесса
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.stream_id = stream_id
+        self.counter = itertools.count()
+
+    def fork(self, seed: int, stream_id: str = "0") -> "PooledFake":
+        # Пулы остаются общими и заполняются от зерна запуска, а не потока, чтобы их содержимое
+        # не зависело от того, какой поток первым обратился к пулу. Поток получает свои курсоры
+        return PooledFake(
+            faker=self.faker,
+            pool_size=self.pool_size,
+            pool_seed=self.pool_seed,
+            cursor_seed=seed,
+            pools=self.pools,
+            run_id=self.run_id,
+            stream_id=stream_id
+        )
+
+    def get_pool_faker(self, key: str) -> Faker:
+        """
+        Возвращает Faker для заполнения пула key: при заданном зерне — отдельный, с зерном пула.
+        """
+        if self.pool_seed is None:
+            return self.faker
+
+        return build_seeded_faker(derive_seed(self.pool_seed, "pool", key))
+
+    def pooled(self, key: str, fill: Callable[[Faker, int], list]) -> Any:
+        """
+        Возвращает следующее значение пула key, заполняя пул функцией fill при первом обращении.
+
+        :param key: Ключ пула.
+        :param fill: Функция (faker, size), возвращающая список из size значений.
+        :return: Значение из пула.
+        """
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = fill(self.get_pool_faker(key), self.pool_size)
+
+        cursor = self.cursors.get(key)
+        if cursor is None:
+            cursor = 0 if self.cursor_seed is None else derive_seed(self.cursor_seed, "cursor", key) % len(pool)
+
+        self.cursors[key] = cursor + 1
+        return pool[cursor % len(pool)]
+
+    @staticmethod
+    def choices(faker: Faker, values: Sequence, size: int) -> list:
+        """
+        Возвращает size случайных элементов values (с повторениями).
+        """
+        if numpy is not None:
+            rng = numpy.random.default_rng(faker.random.getrandbits(64))
+            return [values[index] for index in rng.integers(0, len(values), size).tolist()]
+
+        return faker.random.choices(values, k=size)
+
+    @staticmethod
+    def uniforms(faker: Faker, start: float, end: float, size: int) -> list[float]:
+        """
+        Возвращает size случайных чисел из диапазона [start, end], округлённых до 2 знаков.
+        """
+        if numpy is not None:
+            rng = numpy.random.default_rng(faker.random.getrandbits(64))
+            return numpy.round(rng.uniform(start, end, size), 2).tolist()
+
+        uniform = faker.random.uniform
+        return [round(uniform(start, end), 2) for _ in range(size)]
+
+    @staticmethod
+    def generate(method: str) -> Callable[[Faker, int], list]:
+        return lambda faker, size: [getattr(faker, method)() for _ in range(size)]
+
+    def proto_enum(self, value: EnumTypeWrapper) -> int:
+        return self.pooled(
+            f"proto_enum:{value.DESCRIPTOR.full_name}",
+            lambda faker, size: self.choices(faker, get_proto_enum_values(value), size)
+        )
+
+    def enum(self, value: type[TEnum]) -> TEnum:
+        return self.pooled(
+            f"enum:{value.__module__}.{value.__qualname__}",
+            lambda faker, size: self.choices(faker, list(value), size)
+        )
+
+    def email(self) -> str:
+        email = self.pooled("email", self.generate("email"))
+        return f"{self.run_id}.{self.stream_id}.{next(self.counter)}.{email}"
+
+    def category(self) -> str:
+        return self.pooled("category", lambda faker, size: self.choices(faker, PURCHASE_CATEGORIES, size))
+
+    def last_name(self) -> str:
+        return self.pooled("last_name", self.generate("last_name"))
+
+    def first_name(self) -> str:
+        return self.pooled("first_name", self.generate("first_name"))
+
+    def middle_name(self) -> str:
+        return self.pooled("middle_name", self.generate("first_name"))
+
+    def phone_number(self) -> str:
+        return self.pooled("phone_number", self.generate("phone_number"))
+
+    def float(self, start: int = 1, end: int = 100) -> float:
+        return self.pooled(f"float:{start}:{end}", lambda faker, size: self.uniforms(faker, start, end, size))
+
+
+def derive_seed(*parts: Any) -> int:
+    """
+    Выводит 64-битное зерно из составных частей (зерно запуска, номер worker'а, номер пользователя...).
+    Результат одинаков во всех процессах и запусках, в отличие от hash().
+    """
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def build_seeded_faker(seed: int) -> Faker:
+    """
+    Создаёт экземпляр Faker с собственным генератором случайных чисел, инициализированным зерном seed.
+    """
+    faker = Faker()
+    faker.seed_instance(seed)
+    return faker
+
+
+def build_fake(config: FakeConfig) -> Fake:
+    """
+    Создаёт генератор тестовых данных согласно настройкам.
+
+    :param config: Настройки генерации тестовых данных.
+    :return: Fake или PooledFake.
+    """
+    faker = Faker() if config.seed is None else build_seeded_faker(derive_seed(config.seed, "process"))
+    if config.pooled:
+        return PooledFake(faker=faker, pool_size=config.pool_size, pool_seed=config.seed, cursor_seed=config.seed)
+
+    return Fake(faker=faker)
+
+
+class FakeProxy:
+    """
+    Глобальный генератор тестовых данных, переключаемый на поток текущего greenlet'а.
+
+    Обращения вида fake.amount() выполняются генератором, привязанным к текущему
+    greenlet'у (виртуальному пользователю Locust) через bind, а если привязки нет —
+    общим генератором процесса. Каждый пользователь работает со своим генератором,
+    поэтому общего изменяемого состояния и блокировок между пользователями нет.
+
+    Атрибуты прокси — функции-переадресаторы, поэтому их можно сохранять заранее,
+    например в Field(default_factory=fake.amount).
+    """
+
+    def __init__(self, default: Fake):
+        """
+        :param default: Генератор процесса, используемый вне привязанных greenlet'ов.
+        """
+        self.default = default
+        self.local = local()
+
+    def bind(self, instance: Fake | None) -> None:
+        """
+        Привязывает генератор к текущему greenlet'у (None — снять привязку).
+        """
+        self.local.fake = instance
+
+    def current(self) -> Fake:
+        return getattr(self.local, "fake", None) or self.default
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self.current(), name)
+        if name.startswith("_") or not callable(value):
+            return value
+
+        current = self.current
+
+        def forward(*args, **kwargs):
+            return getattr(current(), name)(*args, **kwargs)
+
+        forward.__name__ = name
+        setattr(self, name, forward)
+        return forward
+
 
-# Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
+# Глобальный генератор тестовых данных: Faker на каждое значение или пулы (FAKE.POOLED),
+# при заданном FAKE.SEED — воспроизводимые потоки для каждого виртуального пользователя
+fake = FakeProxy(build_fake(settings.fake))
@@ -0,0 +1,181 @@
+import math
+from array import array
+
+
+class HDRHistogram:
+    """
+    Гистограмма с высоким динамическим диапазоном (HDR Histogram) на чистом Python.
+
+    Значения (целые, например микросекунды) от 1 до highest_trackable_value хранятся
+    с относительной погрешностью не хуже 10^-significant_figures: при 3 знаках
+    значение 1 234 567 отличается от сохранённого не более чем на ~1 234.
+    В отличие от округления до бакетов статистики Locust, точность сохраняется
+    на всём диапазоне — от долей миллисекунды до минут.
+
+    Гистограммы с одинаковыми параметрами можно складывать (add), поэтому
+    снимки с разных worker'ов объединяются без потери точности.
+    """
+
+    def __init__(self, highest_trackable_value: int, significant_figures: int = 3):
+        """
+        :param highest_trackable_value: Максимальное сохраняемое значение (большие значения ограничиваются им).
+        :param significant_figures: Количество значащих цифр точности (от 1 до 5).
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(f"significant_figures must be between 1 and 5, got {significant_figures}")
+
+        self.highest_trackable_value = max(int(highest_trackable_value), 2)
+        self.significant_figures = significant_figures
+
+        largest_value_with_single_unit_resolution = 2 * 10 ** significant_figures
+        sub_bucket_count_magnitude = math.ceil(math.log2(largest_value_with_single_unit_resolution))
+        self.sub_bucket_half_count_magnitude = sub_bucket_count_magnitude - 1
+        self.sub_bucket_count = 1 << sub_bucket_count_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        smallest_untrackable_value = self.sub_bucket_count
+        bucket_count = 1
+        while smallest_untrackable_value <= self.highest_trackable_value:
+            smallest_untrackable_value <<= 1
+            bucket_count += 1
+
+        self.counts = array("Q", bytes(8 * (bucket_count + 1) * self.sub_bucket_half_count))
+        self.total_count = 0
+        self.min_value = 0
+        self.max_value = 0
+
+    def _get_bucket_indices(self, value: int) -> tuple[int, int]:
+        bucket_index = (value | self.sub_bucket_mask).bit_length() - (self.sub_bucket_half_count_magnitude + 1)
+        return bucket_index, value >> bucket_index
+
+    def _get_counts_index(self, value: int) -> int:
+        bucket_index, sub_bucket_index = self._get_bucket_indices(value)
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + sub_bucket_index - self.sub_bucket_half_count
+
+    def _get_value_from_index(self, index: int) -> int:
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+
+        return sub_bucket_index << bucket_index
+
+    def _get_highest_equivalent_value(self, value: int) -> int:
+        bucket_index, sub_bucket_index = self._get_bucket_indices(value)
+        return (sub_bucket_index << bucket_index) + (1 << bucket_index) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        """
+        Добавляет значение в гистограмму.
+
+        :param value: Значение (меньше 1 — считается 1, больше highest_trackable_value — ограничивается им).
+        :param count: Сколько раз учесть значение.
+        """
+        value = min(max(int(value), 1), self.highest_trackable_value)
+        self.counts[self._get_counts_index(value)] += count
+
+        if self.total_count == 0 or value < self.min_value:
+            self.min_value = value
+
+        if value > self.max_value:
+            self.max_value = value
+
+        self.total_count += count
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        """
+        Возвращает значение, не превышаемое заданной долей записей.
+
+        :param percentile: Перцентиль от 0 до 100 (например, 99.99).
+        :return: Значение перцентиля (0, если гистограмма пуста).
+        """
+        if self.total_count == 0:
+            return 0
+
+        target = max(math.ceil(min(percentile, 100.0) / 100.0 * self.total_count), 1)
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self._get_highest_equivalent_value(self._get_value_from_index(index)), self.max_value)
+
+        return self.max_value
+
+    def get_mean(self) -> float:
+        """
+        Возвращает среднее значение (по серединам ячеек гистограммы).
+        """
+        if self.total_count == 0:
+            return 0.0
+
+        total = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                value = self._get_value_from_index(index)
+                total += count * (value + self._get_highest_equivalent_value(value)) / 2
+
+        return total / self.total_count
+
+    def add(self, other: "HDRHistogram") -> None:
+        """
+        Прибавляет к гистограмме записи другой гистограммы с теми же параметрами.
+        """
+        self.merge_counts(other.to_dict())
+
+    def reset(self) -> None:
+        """
+        Очищает гистограмму.
+        """
+        self.counts = array("Q", bytes(8 * len(self.counts)))
+        self.total_count = 0
+        self.min_value = 0
+        self.max_value = 0
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает компактное (разреженное) представление гистограммы для передачи между процессами.
+        """
+        return {
+            "significant_figures": self.significant_figures,
+            "highest_trackable_value": self.highest_trackable_value,
+            "min": self.min_value,
+            "max": self.max_value,
+            "counts": [[index, count] for index, count in enumerate(self.counts) if count]
+        }
+
+    def merge_counts(self, data: dict) -> None:
+        """
+        Прибавляет к гистограмме записи из представления to_dict.
+
+        :param data: Представление гистограммы с теми же параметрами точности и диапазона.
+        """
+        if (
+                data["significant_figures"] != self.significant_figures
+                or data["highest_trackable_value"] != self.highest_trackable_value
+        ):
+            raise ValueError("Cannot merge HDR histograms with different precision or range")
+
+        count_added = 0
+        for index, count in data["counts"]:
+            self.counts[index] += count
+            count_added += count
+
+        if count_added == 0:
+            return
+
+        if self.total_count == 0 or data["min"] < self.min_value:
+            self.min_value = data["min"]
+
+        self.max_value = max(self.max_value, data["max"])
+        self.total_count += count_added
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HDRHistogram":
+        """
+        Восстанавливает гистограмму из представления to_dict.
+        """
+        histogram = cls(data["highest_trackable_value"], data["significant_figures"])
+        histogram.merge_counts(data)
+        return histogram
@@ -0,0 +1,91 @@
+import random
+import time
+
+from gevent.local import local
+from locust import User
+from locust.runners import WorkerRunner
+
+from tools.config.locust import LocustArrivalProcess
+
+# Запланированное время запуска текущей задачи — своё у каждого greenlet'а виртуального пользователя
+_schedule = local()
+
+
+def get_user_arrival_rate(user: User, arrival_rate: float) -> float:
+    """
+    Возвращает интенсивность запуска задач одного виртуального пользователя.
+
+    Суммарная интенсивность сценария делится между worker'ами (--expect-workers)
+    и между пользователями процесса. Пересчитывается при каждом ожидании, поэтому
+    следует за изменением числа пользователей.
+
+    :param user: Виртуальный пользователь Locust.
+    :param arrival_rate: Суммарная интенсивность запуска задач сценария (в секунду).
+    :return: Интенсивность запуска задач пользователя (в секунду).
+    """
+    environment = user.environment
+    workers = 1
+    if isinstance(environment.runner, WorkerRunner):
+        workers = max(getattr(environment.parsed_options, "expect_workers", 1) or 1, 1)
+
+    users = max(getattr(environment.runner, "target_user_count", 0) or 0, 1)
+    return arrival_rate / workers / users
+
+
+def open_arrival(arrival_rate: float, process: LocustArrivalProcess = LocustArrivalProcess.CONSTANT):
+    """
+    Возвращает функцию wait_time для открытой модели нагрузки.
+
+    Задачи пользователя запускаются по расписанию: следующий запуск планируется от
+    предыдущего запланированного, а не от фактического завершения задачи. Если сервис
+    замедлился и задача не успела к своему времени, ожидания нет, а задержка запуска
+    добавляется ко времени ответа (см. correct_response_time) — так медленные ответы
+    не уменьшают число измерений (коррекция coordinated omission).
+
+    Пример::
+
+        class MyUser(LocustBaseUser):
+            wait_time = open_arrival(50, LocustArrivalProcess.POISSON)
+
+    :param arrival_rate: Суммарная интенсивность запуска задач сценария (в секунду).
+    :param process: Распределение интервалов между запусками (constant или poisson).
+    :return: Функция wait_time для User.
+    """
+
+    def wait_time_func(user: User) -> float:
+        rate = get_user_arrival_rate(user, arrival_rate)
+        interval = random.expovariate(rate) if process == LocustArrivalProcess.POISSON else 1 / rate
+
+        now = time.perf_counter()
+        intended_start = getattr(user, "_arrival_intended_start", None)
+        if intended_start is None:
+            # Первый запуск сдвигаем на случайную долю интервала, чтобы одновременно
+            # запущенные пользователи не отправляли запросы синхронными пачками
+            intended_start = now + random.random() * interval
+        else:
+            intended_start += interval
+
+        user._arrival_intended_start = intended_start
+        _schedule.intended_start = intended_start
+        return max(intended_start - now, 0)
+
+    return wait_time_func
+
+
+def correct_response_time(response_time: float) -> float:
+    """
+    Возвращает время ответа, отсчитанное от запланированного запуска задачи.
+
+    Коррекция применяется к первому запросу после запланированного запуска
+    (в открытой модели задача — это один запрос); для остальных запросов и
+    в закрытой модели время ответа возвращается без изменений.
+
+    :param response_time: Измеренное время выполнения запроса в миллисекундах.
+    :return: Время ответа с учётом задержки запуска в миллисекундах.
+    """
+    intended_start = getattr(_schedule, "intended_start", None)
+    if intended_start is None:
+        return response_time
+
+    _schedule.intended_start = None
+    return max(response_time, (time.perf_counter() - intended_start) * 1000)
@@ -0,0 +1,158 @@
+import csv
+import json
+from pathlib import Path
+
+from tools.config.locust import LocustMetricsConfig
+from tools.hdr import HDRHistogram
+
+# Имя строки с агрегированной статистикой — как в CSV-отчётах Locust
+AGGREGATED_NAME = "Aggregated"
+
+
+class LatencyRecorder:
+    """
+    Регистратор времени ответа на HDR-гистограммах.
+
+    Для каждой пары (тип запроса, имя) и для всех запросов вместе ведётся отдельная
+    гистограмма. Значения хранятся в микросекундах, поэтому различия в доли миллисекунды
+    не теряются, а p99.9/p99.99 считаются с заданной точностью, а не по бакетам Locust.
+    """
+
+    def __init__(self, highest_trackable_ms: int, significant_figures: int, percentiles: list[float]):
+        """
+        :param highest_trackable_ms: Максимальное сохраняемое время ответа (в миллисекундах).
+        :param significant_figures: Количество значащих цифр точности гистограмм.
+        :param percentiles: Процентили для экспорта (например, [50, 99, 99.9]).
+        """
+        self.highest_trackable_value = highest_trackable_ms * 1000
+        self.significant_figures = significant_figures
+        self.percentiles = percentiles
+
+        self.histograms: dict[tuple[str, str], HDRHistogram] = {}
+        self.total = self.build_histogram()
+
+    def build_histogram(self) -> HDRHistogram:
+        return HDRHistogram(self.highest_trackable_value, self.significant_figures)
+
+    def get_histogram(self, request_type: str, name: str) -> HDRHistogram:
+        key = (request_type, name)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = self.build_histogram()
+
+        return histogram
+
+    def record(self, request_type: str, name: str, response_time: float) -> None:
+        """
+        Учитывает время ответа запроса.
+
+        :param request_type: Тип запроса (HTTP, gRPC).
+        :param name: Имя запроса в статистике.
+        :param response_time: Время выполнения запроса в миллисекундах.
+        """
+        value = max(round(response_time * 1000), 1)
+        self.get_histogram(request_type, name).record(value)
+        self.total.record(value)
+
+    def snapshot(self, reset: bool = False) -> list[dict]:
+        """
+        Возвращает сериализуемый снимок гистограмм по запросам.
+
+        :param reset: Очистить гистограммы после снимка (worker отправляет master'у только приращение).
+        :return: Список словарей {"request_type", "name", "histogram"}.
+        """
+        snapshot = [
+            {"request_type": request_type, "name": name, "histogram": histogram.to_dict()}
+            for (request_type, name), histogram in self.histograms.items()
+            if histogram.total_count
+        ]
+        if reset:
+            self.histograms.clear()
+            self.total.reset()
+
+        return snapshot
+
+    def merge(self, snapshot: list[dict]) -> None:
+        """
+        Добавляет к гистограммам снимок, полученный от другого процесса.
+
+        :param snapshot: Снимок, возвращённый snapshot().
+        """
+        for item in snapshot:
+            self.get_histogram(item["request_type"], item["name"]).merge_counts(item["histogram"])
+            self.total.merge_counts(item["histogram"])
+
+    def get_rows(self) -> list[dict]:
+        """
+        Возвращает сводку по запросам и итоговую строку: количество, min, mean, max и процентили (в миллисекундах).
+        """
+        items = sorted(self.histograms.items()) + [(("", AGGREGATED_NAME), self.total)]
+        return [
+            {
+                "type": request_type,
+                "name": name,
+                "count": histogram.total_count,
+                "min": histogram.min_value / 1000,
+                "mean": round(histogram.get_mean() / 1000, 3),
+                "max": histogram.max_value / 1000,
+                "percentiles": {
+                    f"{percentile:g}": histogram.get_value_at_percentile(percentile) / 1000
+                    for percentile in self.percentiles
+                }
+            }
+            for (request_type, name), histogram in items
+            if histogram.total_count
+        ]
+
+    def export(self, prefix: str) -> tuple[Path, Path]:
+        """
+        Сохраняет сводку рядом с CSV-отчётами Locust: {prefix}_hdr.csv и {prefix}_hdr.json.
+        JSON дополнительно содержит сериализованные гистограммы для последующего объединения.
+
+        :param prefix: Префикс CSV-файлов Locust (--csv).
+        :return: Пути к CSV и JSON файлам.
+        """
+        rows = self.get_rows()
+        csv_file = Path(f"{prefix}_hdr.csv")
+        json_file = Path(f"{prefix}_hdr.json")
+
+        with csv_file.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["Type", "Name", "Request Count", "Min (ms)", "Average (ms)", "Max (ms)"]
+                + [f"p{percentile:g}" for percentile in self.percentiles]
+            )
+            for row in rows:
+                writer.writerow(
+                    [row["type"], row["name"], row["count"], row["min"], row["mean"], row["max"]]
+                    + list(row["percentiles"].values())
+                )
+
+        json_file.write_text(
+            json.dumps(
+                {
+                    "significant_figures": self.significant_figures,
+                    "unit": "ms",
+                    "stats": rows,
+                    "histograms": self.snapshot()
+                },
+                ensure_ascii=False
+            ),
+            encoding="utf-8"
+        )
+
+        return csv_file, json_file
+
+
+def build_latency_recorder(config: LocustMetricsConfig) -> LatencyRecorder:
+    """
+    Создаёт регистратор времени ответа согласно настройкам.
+
+    :param config: Настройки доставки метрик.
+    :return: LatencyRecorder.
+    """
+    return LatencyRecorder(
+        highest_trackable_ms=config.hdr_highest_trackable_ms,
+        significant_figures=config.hdr_significant_figures,
+        percentiles=config.hdr_percentiles
+    )
@@ -0,0 +1,270 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any
+
+import gevent
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
+from config import settings
+from tools.config.locust import LocustMetricsConfig, LocustMetricsMode, LocustMetricsOverflow
+from tools.locust.arrival import correct_response_time
+from tools.locust.latency import LatencyRecorder, build_latency_recorder
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_METRICS")
+
+
+class RequestMetricsEmitter(ABC):
+    """
+    Точка, через которую HTTP-хуки и gRPC-интерцепторы передают метрики запросов в Locust.
+    Если задан latency_recorder, время ответа дополнительно учитывается в HDR-гистограммах.
+    В открытой модели нагрузки время ответа отсчитывается от запланированного запуска задачи.
+    """
+
+    latency_recorder: LatencyRecorder | None = None
+
+    @abstractmethod
+    def emit(
+            self,
+            request_type: str,
+            name: str,
+            response_time: float,
+            response_length: int,
+            exception: BaseException | None = None,
+            context: dict[str, Any] | None = None,
+            response: Any = None
+    ) -> None:
+        """
+        Регистрирует выполненный запрос.
+
+        :param request_type: Тип запроса (HTTP, gRPC).
+        :param name: Имя запроса в статистике.
+        :param response_time: Время выполнения запроса в миллисекундах.
+        :param response_length: Размер ответа в байтах.
+        :param exception: Исключение, если запрос завершился ошибкой.
+        :param context: Дополнительные данные для слушателей events.request.
+        :param response: Объект ответа для слушателей events.request.
+        """
+        ...
+
+
+class ImmediateRequestMetricsEmitter(RequestMetricsEmitter):
+    """
+    Стандартное поведение Locust: каждый запрос сразу отправляется в environment.events.request,
+    и все слушатели события выполняются на пути запроса.
+    """
+
+    def __init__(self, environment: Environment):
+        self.environment = environment
+
+    def emit(self, request_type, name, response_time, response_length, exception=None, context=None, response=None):
+        corrected_response_time = correct_response_time(response_time)
+        if corrected_response_time != response_time:
+            # Исходное время обработки запроса остаётся доступным слушателям
+            context = {**(context or {}), "service_time": response_time}
+            response_time = corrected_response_time
+
+        if self.latency_recorder is not None:
+            self.latency_recorder.record(request_type, name, response_time)
+
+        self.environment.events.request.fire(
+            request_type=request_type,
+            name=name,
+            response_time=response_time,
+            response_length=response_length,
+            exception=exception,
+            context=context or {},
+            response=response
+        )
+
+
+class BufferedRequestMetricsEmitter(RequestMetricsEmitter):
+    """
+    Буферизованная доставка метрик.
+
+    На пути запроса в кольцевой буфер добавляется только компактная запись
+    (тип, имя, время, размер, исключение). Фоновый greenlet раз в flush_interval
+    переносит накопленные записи пачкой напрямую в environment.stats — так же,
+    как это делает стандартный слушатель events.request раннера Locust.
+
+    Слушатели events.request в этом режиме не вызываются, context и response не сохраняются.
+    Секундные счётчики RPS в статистике Locust смещаются не более чем на flush_interval.
+    """
+
+    def __init__(
+            self,
+            environment: Environment,
+            capacity: int,
+            flush_interval: float,
+            overflow: LocustMetricsOverflow
+    ):
+        """
+        :param environment: Окружение Locust, в статистику которого переносятся записи.
+        :param capacity: Ёмкость буфера (количество записей).
+        :param flush_interval: Интервал переноса буфера в статистику (в секундах).
+        :param overflow: Поведение при переполнении буфера.
+        """
+        self.environment = environment
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+
+        self.buffer: deque[tuple[str, str, float, int, BaseException | None]] = deque()
+        self.dropped = 0
+        self.greenlet: gevent.Greenlet | None = None
+
+    def emit(self, request_type, name, response_time, response_length, exception=None, context=None, response=None):
+        response_time = correct_response_time(response_time)
+        if len(self.buffer) >= self.capacity:
+            match self.overflow:
+                case LocustMetricsOverflow.DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                case LocustMetricsOverflow.DROP_OLDEST:
+                    self.buffer.popleft()
+                    self.dropped += 1
+                case _:
+                    self.flush()
+
+        self.buffer.append((request_type, name, response_time, response_length, exception))
+
+    def flush(self) -> int:
+        """
+        Переносит все накопленные записи в статистику Locust.
+
+        :return: Количество перенесённых записей.
+        """
+        # Статистику берём при каждом переносе: WorkerRunner подменяет environment.stats при создании
+        stats = self.environment.stats
+        latency_recorder = self.latency_recorder
+        count = len(self.buffer)
+        for _ in range(count):
+            request_type, name, response_time, response_length, exception = self.buffer.popleft()
+            stats.log_request(request_type, name, response_time, response_length)
+            if latency_recorder is not None:
+                latency_recorder.record(request_type, name, response_time)
+            if exception:
+                stats.log_error(request_type, name, exception)
+
+        return count
+
+    def run(self) -> None:
+        while True:
+            gevent.sleep(self.flush_interval)
+            self.flush()
+
+    def start(self) -> None:
+        """
+        Запускает фоновый greenlet переноса буфера.
+        """
+        if self.greenlet is None:
+            self.greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        """
+        Останавливает фоновый greenlet и переносит оставшиеся записи.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
+
+        self.flush()
+
+
+def build_request_metrics_emitter(environment: Environment, config: LocustMetricsConfig) -> RequestMetricsEmitter:
+    """
+    Создаёт emitter метрик согласно настройкам и подписывает его на события жизненного цикла Locust.
+
+    :param environment: Окружение Locust.
+    :param config: Настройки доставки метрик.
+    :return: Emitter метрик.
+    """
+    if config.mode == LocustMetricsMode.IMMEDIATE:
+        emitter = ImmediateRequestMetricsEmitter(environment)
+    else:
+        emitter = BufferedRequestMetricsEmitter(
+            environment=environment,
+            capacity=config.buffer_size,
+            flush_interval=config.flush_interval,
+            overflow=config.overflow
+        )
+        emitter.start()
+
+        # Worker отправляет статистику master'у по событию report_to_master — переносим буфер перед отправкой,
+        # чтобы в отчёт попали все завершённые запросы
+        @environment.events.report_to_master.add_listener
+        def flush_before_report(**kwargs):
+            emitter.flush()
+
+        @environment.events.test_stop.add_listener
+        def flush_on_test_stop(**kwargs):
+            emitter.flush()
+            if emitter.dropped:
+                logger.warning(f"Request metrics buffer overflowed: {emitter.dropped} records dropped")
+
+    if config.hdr:
+        emitter.latency_recorder = build_latency_recorder(config)
+        register_latency_recorder(environment, emitter.latency_recorder)
+
+    @environment.events.quitting.add_listener
+    def stop_on_quitting(**kwargs):
+        if isinstance(emitter, BufferedRequestMetricsEmitter):
+            emitter.stop()
+
+        # Экспорт после остановки буфера, чтобы в гистограммы попали последние записи
+        if emitter.latency_recorder is not None:
+            export_latency_recorder(environment, emitter.latency_recorder)
+
+    return emitter
+
+
+def register_latency_recorder(environment: Environment, latency_recorder: LatencyRecorder) -> None:
+    """
+    Подписывает регистратор времени ответа на обмен отчётами между worker'ами и master'ом:
+    worker добавляет к отчёту приращение гистограмм, master объединяет приращения всех worker'ов.
+
+    :param environment: Окружение Locust.
+    :param latency_recorder: Регистратор времени ответа.
+    """
+
+    # Слушатель регистрируется после переноса буфера (flush_before_report), поэтому в отчёт попадают все записи
+    @environment.events.report_to_master.add_listener
+    def add_latency_histograms(client_id: str, data: dict, **kwargs):
+        data["latency_histograms"] = latency_recorder.snapshot(reset=True)
+
+    @environment.events.worker_report.add_listener
+    def merge_latency_histograms(client_id: str, data: dict, **kwargs):
+        latency_recorder.merge(data.get("latency_histograms", []))
+
+
+def export_latency_recorder(environment: Environment, latency_recorder: LatencyRecorder) -> None:
+    """
+    Сохраняет сводку HDR-гистограмм рядом с CSV-отчётами Locust (только если запуск с --csv).
+    Worker'ы не экспортируют: их гистограммы передаются master'у.
+
+    :param environment: Окружение Locust.
+    :param latency_recorder: Регистратор времени ответа.
+    """
+    prefix = getattr(environment.parsed_options, "csv_prefix", None)
+    if not prefix or isinstance(environment.runner, WorkerRunner):
+        return
+
+    csv_file, json_file = latency_recorder.export(prefix)
+    logger.info(f"HDR latency histograms exported to {csv_file} and {json_file}")
+
+
+def get_request_metrics_emitter(environment: Environment) -> RequestMetricsEmitter:
+    """
+    Возвращает общий на процесс emitter метрик, создавая его при первом обращении.
+    Emitter хранится в окружении Locust (environment.request_metrics_emitter).
+
+    :param environment: Окружение Locust.
+    :return: Emitter метрик.
+    """
+    emitter: RequestMetricsEmitter | None = getattr(environment, "request_metrics_emitter", None)
+    if emitter is None:
+        emitter = build_request_metrics_emitter(environment, settings.locust_metrics)
+        environment.request_metrics_emitter = emitter
+
+    return emitter
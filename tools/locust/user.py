@@ -1,5 +1,74 @@
-from locust import User, between
+import itertools
+
+import locust.stats  # Модуль Locust, отвечающий за сбор и хранение статистики
+from locust import User, between, events
+from locust.env import Environment
+from locust.runners import WorkerRunner
+
 from config import settings
+from tools.config.locust import LocustLoadModel, LocustUserConfig
+from tools.fakers import fake, derive_seed
+from tools.locust.arrival import open_arrival
+from tools.locust.metrics import get_request_metrics_emitter
+
+# Настройка списка процентилей, которые будут попадать в отчёты Locust
+locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
+
+# Интервал (в секундах) между записями агрегированной статистики в CSV
+locust.stats.CSV_STATS_INTERVAL_SEC = 5
+
+# Интервал (в секундах) между записями "исторической" статистики (динамика значений)
+locust.stats.HISTORY_STATS_INTERVAL_SEC = 5
+
+# Интервал (в секундах) между обновлением статистики в консоли Locust
+locust.stats.CONSOLE_STATS_INTERVAL_SEC = 5
+
+# Интервал (в секундах) между принудительной записью CSV на диск
+locust.stats.CSV_STATS_FLUSH_INTERVAL_SEC = 5
+
+
+@events.init.add_listener
+def init_request_metrics(environment: Environment, **kwargs):
+    # Emitter метрик создаётся при старте каждого процесса, а не при первом запросе:
+    # master'у он нужен для приёма HDR-гистограмм от worker'ов, хотя сам master запросов не выполняет
+    if settings.locust_metrics.hdr:
+        get_request_metrics_emitter(environment)
+
+
+def build_wait_time(config: LocustUserConfig):
+    """
+    Возвращает функцию wait_time согласно модели нагрузки.
+
+    Открытая модель: задачи запускаются с заданной интенсивностью, время ответа отсчитывается
+    от запланированного запуска. Закрытая: случайная пауза между задачами каждого пользователя.
+
+    :param config: Настройки виртуального пользователя.
+    :return: Функция wait_time для User.
+    """
+    if config.load_model == LocustLoadModel.OPEN:
+        return open_arrival(arrival_rate=config.arrival_rate, process=config.arrival_process)
+
+    return between(min_wait=config.wait_time_min, max_wait=config.wait_time_max)
+
+
+def bind_user_fake(user: "LocustBaseUser") -> None:
+    """
+    Привязывает к greenlet'у виртуального пользователя собственный генератор тестовых данных.
+
+    Зерно потока выводится из FAKE.SEED, номера worker'а и порядкового номера пользователя
+    в процессе, поэтому при одинаковой конфигурации запуска каждый пользователь получает
+    ту же последовательность сумм, статусов, категорий и имён. Без FAKE.SEED ничего не делает.
+
+    :param user: Виртуальный пользователь Locust.
+    """
+    if settings.fake.seed is None:
+        return
+
+    runner = user.environment.runner
+    worker_index = runner.worker_index if isinstance(runner, WorkerRunner) else 0
+    seed = derive_seed(settings.fake.seed, worker_index, user.user_index)
+    fake.bind(fake.default.fork(seed, stream_id=f"{worker_index}.{user.user_index}"))
+
 
 class LocustBaseUser(User):
     """
@@ -8,7 +77,15 @@ class LocustBaseUser(User):
     """
     host: str = "localhost"  # Фиктивный хост, необходим для соответствия API Locust
     abstract = True  # Пометка, что этот класс не должен запускаться напрямую
-    wait_time = between(
-        min_wait=settings.locust_user.wait_time_min,
-        max_wait=settings.locust_user.wait_time_max
-    )
\ No newline at end of file
+    wait_time = build_wait_time(settings.locust_user)
+
+    # Порядковые номера пользователей процесса (в порядке создания) — для воспроизводимых потоков данных
+    user_indexes = itertools.count()
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        self.user_index = next(LocustBaseUser.user_indexes)
+
+    def on_start(self) -> None:
+        # Выполняется в greenlet'е пользователя до запуска задач
+        bind_user_fake(self)
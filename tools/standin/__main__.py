@@ -0,0 +1,35 @@
+from config import settings
+from tools.config.standin import StandInConfig
+from tools.logger import get_logger
+from tools.standin.grpc_server import build_standin_grpc_server
+from tools.standin.http_server import build_standin_http_server
+
+logger = get_logger("STANDIN")
+
+
+def run_standin(config: StandInConfig) -> None:
+    """
+    Запускает заменитель gateway: gRPC-сервер в пуле потоков и HTTP-сервер на gevent
+    в основном потоке. Работает до прерывания (Ctrl+C).
+
+    :param config: Настройки заменителя gateway.
+    """
+    grpc_server = build_standin_grpc_server(config)
+    http_server = build_standin_http_server(config)
+
+    grpc_server.start()
+    logger.info(
+        f"Stand-in gateway: HTTP http://{config.host}:{config.http_port}, gRPC {config.host}:{config.grpc_port}, "
+        f"latency {config.latency_distribution} {config.latency_ms}ms, error rate {config.error_rate}"
+    )
+    try:
+        http_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http_server.stop()
+        grpc_server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    run_standin(settings.standin)
@@ -0,0 +1,78 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+from google.protobuf.descriptor import MethodDescriptor
+from google.protobuf.message_factory import GetMessageClass
+
+from contracts.services.gateway.accounts import accounts_gateway_service_pb2
+from contracts.services.gateway.cards import cards_gateway_service_pb2
+from contracts.services.gateway.documents import documents_gateway_service_pb2
+from contracts.services.gateway.operations import operations_gateway_service_pb2
+from contracts.services.gateway.users import users_gateway_service_pb2
+from tools.config.standin import StandInConfig
+from tools.standin.payloads import PayloadBuilder
+from tools.standin.profile import ResponseProfile
+
+# Модули контрактов сервисов gateway (AccountsGatewayService, OperationsGatewayService...)
+GATEWAY_SERVICE_MODULES = [
+    users_gateway_service_pb2,
+    accounts_gateway_service_pb2,
+    cards_gateway_service_pb2,
+    documents_gateway_service_pb2,
+    operations_gateway_service_pb2,
+]
+
+
+def build_method_handler(
+        method: MethodDescriptor,
+        builder: PayloadBuilder,
+        profile: ResponseProfile
+) -> grpc.RpcMethodHandler:
+    """
+    Создаёт обработчик unary-unary метода: запрос разбирается по контракту,
+    ответ — заранее сериализованное сообщение (отдаётся без повторной сериализации).
+
+    :param method: Дескриптор метода сервиса.
+    :param builder: Построитель тел ответов.
+    :param profile: Профиль задержек и ошибок метода.
+    :return: Обработчик метода для grpc.method_handlers_generic_handler.
+    """
+    request_class = GetMessageClass(method.input_type)
+    response = builder.build_message(method.output_type).SerializeToString()
+    error_code = grpc.StatusCode[profile.config.error_grpc_code]
+    error_details = f"Stand-in error in {method.name}"
+
+    def handle(request, context: grpc.ServicerContext) -> bytes:
+        latency = profile.get_latency()
+        if latency:
+            time.sleep(latency)
+
+        if profile.is_error():
+            context.abort(error_code, error_details)
+
+        return response
+
+    return grpc.unary_unary_rpc_method_handler(handle, request_deserializer=request_class.FromString)
+
+
+def build_standin_grpc_server(config: StandInConfig) -> grpc.Server:
+    """
+    Создаёт gRPC-сервер заменителя gateway со всеми сервисами из contracts/services/gateway.
+
+    :param config: Настройки заменителя gateway.
+    :return: Не запущенный grpc.Server.
+    """
+    builder = PayloadBuilder(list_size=config.list_size, document_size=config.document_size)
+    server = grpc.server(ThreadPoolExecutor(max_workers=config.grpc_max_workers))
+
+    for module in GATEWAY_SERVICE_MODULES:
+        for service in module.DESCRIPTOR.services_by_name.values():
+            handlers = {
+                method.name: build_method_handler(method, builder, ResponseProfile(config.get_profile(method.name)))
+                for method in service.methods
+            }
+            server.add_generic_rpc_handlers([grpc.method_handlers_generic_handler(service.full_name, handlers)])
+
+    server.add_insecure_port(f"{config.host}:{config.grpc_port}")
+    return server
@@ -0,0 +1,205 @@
+import json
+import socket
+from typing import Callable, Iterable
+
+import gevent
+from gevent.pywsgi import WSGIHandler, WSGIServer
+from pydantic import BaseModel
+
+from clients.http.gateway.accounts.schema import (
+    GetAccountsResponseSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountResponseSchema
+)
+from clients.http.gateway.cards.schema import IssueVirtualCardResponseSchema, IssuePhysicalCardResponseSchema
+from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema, GetContractDocumentResponseSchema
+from clients.http.gateway.operations.schema import (
+    GetOperationResponseSchema,
+    GetOperationsResponseSchema,
+    GetOperationReceiptResponseSchema,
+    GetOperationsSummaryResponseSchema,
+    MakeFeeOperationResponseSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeCashbackOperationResponseSchema,
+    MakeTransferOperationResponseSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeBillPaymentOperationResponseSchema,
+    MakeCashWithdrawalOperationResponseSchema
+)
+from clients.http.gateway.users.schema import GetUserResponseSchema, CreateUserResponseSchema
+from tools.config.standin import StandInConfig
+from tools.routes import APIRoutes
+from tools.standin.payloads import PayloadBuilder
+from tools.standin.profile import ResponseProfile
+
+# Маршруты gateway: (HTTP-метод, путь, имя gRPC-метода, схема ответа).
+# Путь, оканчивающийся на "/", — префикс маршрута с параметром пути ({user_id}, {account_id}...)
+HTTP_ROUTES: list[tuple[str, str, str, type[BaseModel]]] = [
+    ("GET", f"{APIRoutes.USERS}/", "GetUser", GetUserResponseSchema),
+    ("POST", APIRoutes.USERS, "CreateUser", CreateUserResponseSchema),
+    ("GET", APIRoutes.ACCOUNTS, "GetAccounts", GetAccountsResponseSchema),
+    ("POST", f"{APIRoutes.ACCOUNTS}/open-deposit-account", "OpenDepositAccount", OpenDepositAccountResponseSchema),
+    ("POST", f"{APIRoutes.ACCOUNTS}/open-savings-account", "OpenSavingsAccount", OpenSavingsAccountResponseSchema),
+    (
+        "POST",
+        f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+        "OpenDebitCardAccount",
+        OpenDebitCardAccountResponseSchema
+    ),
+    (
+        "POST",
+        f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+        "OpenCreditCardAccount",
+        OpenCreditCardAccountResponseSchema
+    ),
+    ("POST", f"{APIRoutes.CARDS}/issue-virtual-card", "IssueVirtualCard", IssueVirtualCardResponseSchema),
+    ("POST", f"{APIRoutes.CARDS}/issue-physical-card", "IssuePhysicalCard", IssuePhysicalCardResponseSchema),
+    ("GET", f"{APIRoutes.DOCUMENTS}/tariff-document/", "GetTariffDocument", GetTariffDocumentResponseSchema),
+    ("GET", f"{APIRoutes.DOCUMENTS}/contract-document/", "GetContractDocument", GetContractDocumentResponseSchema),
+    ("GET", APIRoutes.OPERATIONS, "GetOperations", GetOperationsResponseSchema),
+    ("GET", f"{APIRoutes.OPERATIONS}/operations-summary", "GetOperationsSummary", GetOperationsSummaryResponseSchema),
+    # Клиент запрашивает чек по /api/v1/operation-receipt/{operation_id}, поддерживаем и путь внутри operations
+    ("GET", "/api/v1/operation-receipt/", "GetOperationReceipt", GetOperationReceiptResponseSchema),
+    ("GET", f"{APIRoutes.OPERATIONS}/operation-receipt/", "GetOperationReceipt", GetOperationReceiptResponseSchema),
+    ("GET", f"{APIRoutes.OPERATIONS}/", "GetOperation", GetOperationResponseSchema),
+    ("POST", f"{APIRoutes.OPERATIONS}/make-fee-operation", "MakeFeeOperation", MakeFeeOperationResponseSchema),
+    ("POST", f"{APIRoutes.OPERATIONS}/make-top-up-operation", "MakeTopUpOperation", MakeTopUpOperationResponseSchema),
+    (
+        "POST",
+        f"{APIRoutes.OPERATIONS}/make-cashback-operation",
+        "MakeCashbackOperation",
+        MakeCashbackOperationResponseSchema
+    ),
+    (
+        "POST",
+        f"{APIRoutes.OPERATIONS}/make-transfer-operation",
+        "MakeTransferOperation",
+        MakeTransferOperationResponseSchema
+    ),
+    (
+        "POST",
+        f"{APIRoutes.OPERATIONS}/make-purchase-operation",
+        "MakePurchaseOperation",
+        MakePurchaseOperationResponseSchema
+    ),
+    (
+        "POST",
+        f"{APIRoutes.OPERATIONS}/make-bill-payment-operation",
+        "MakeBillPaymentOperation",
+        MakeBillPaymentOperationResponseSchema
+    ),
+    (
+        "POST",
+        f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
+        "MakeCashWithdrawalOperation",
+        MakeCashWithdrawalOperationResponseSchema
+    ),
+]
+
+JSON_HEADERS = [("Content-Type", "application/json")]
+NOT_FOUND_BODY = b'{"detail":"Not Found"}'
+
+
+class HTTPRoute:
+    """
+    Маршрут заменителя gateway: заранее сериализованное тело ответа и профиль задержек и ошибок.
+    """
+
+    def __init__(self, name: str, body: bytes, profile: ResponseProfile):
+        self.name = name
+        self.body = body
+        self.profile = profile
+        self.error_body = json.dumps({"detail": f"Stand-in error in {name}"}).encode("utf-8")
+        self.error_status = f"{profile.config.error_http_status} Stand-in Error"
+
+
+class StandInHTTPApplication:
+    """
+    WSGI-приложение, отвечающее на все маршруты gateway (tools.routes.APIRoutes).
+
+    Тела ответов строятся по схемам ответов HTTP-клиентов и сериализуются один раз при
+    запуске, поэтому обработка запроса сводится к поиску маршрута, задержке по профилю
+    и отправке готовых байт. Идентификаторы в ответах одного маршрута совпадают.
+    """
+
+    def __init__(self, config: StandInConfig):
+        """
+        :param config: Настройки заменителя gateway.
+        """
+        builder = PayloadBuilder(list_size=config.list_size, document_size=config.document_size)
+
+        self.routes: dict[tuple[str, str], HTTPRoute] = {}
+        self.prefix_routes: list[tuple[str, str, HTTPRoute]] = []
+        for method, path, name, schema in HTTP_ROUTES:
+            body = json.dumps(builder.build_json(schema)).encode("utf-8")
+            # Тело ответа должно разбираться клиентом так же, как ответ настоящего gateway
+            schema.model_validate_json(body)
+
+            route = HTTPRoute(name=name, body=body, profile=ResponseProfile(config.get_profile(name)))
+            if path.endswith("/"):
+                self.prefix_routes.append((method, path, route))
+            else:
+                self.routes[(method, path)] = route
+
+    def match(self, method: str, path: str) -> HTTPRoute | None:
+        route = self.routes.get((method, path.rstrip("/") or "/"))
+        if route is not None:
+            return route
+
+        for route_method, prefix, route in self.prefix_routes:
+            if method == route_method and path.startswith(prefix) and "/" not in path[len(prefix):]:
+                return route
+
+        return None
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        # Тело запроса вычитываем целиком, чтобы соединение можно было переиспользовать
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        if length:
+            environ["wsgi.input"].read(length)
+
+        route = self.match(environ["REQUEST_METHOD"], environ["PATH_INFO"])
+        if route is None:
+            start_response("404 Not Found", JSON_HEADERS)
+            return [NOT_FOUND_BODY]
+
+        latency = route.profile.get_latency()
+        if latency:
+            gevent.sleep(latency)
+
+        if route.profile.is_error():
+            start_response(route.error_status, JSON_HEADERS)
+            return [route.error_body]
+
+        start_response("200 OK", JSON_HEADERS)
+        return [route.body]
+
+
+class StandInWSGIHandler(WSGIHandler):
+    """
+    Обработчик соединения с отключённым алгоритмом Нейгла (TCP_NODELAY).
+
+    pywsgi отправляет заголовки и тело ответа отдельными записями в сокет; без TCP_NODELAY
+    вторая запись ждёт подтверждения первой (delayed ACK) и каждый ответ задерживается на ~40 мс.
+    """
+
+    def handle(self):
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().handle()
+
+
+def build_standin_http_server(config: StandInConfig) -> WSGIServer:
+    """
+    Создаёт HTTP-сервер заменителя gateway (gevent WSGI, keep-alive соединения).
+
+    :param config: Настройки заменителя gateway.
+    :return: Не запущенный WSGIServer.
+    """
+    return WSGIServer(
+        (config.host, config.http_port),
+        StandInHTTPApplication(config),
+        handler_class=StandInWSGIHandler,
+        log=None
+    )
@@ -0,0 +1,140 @@
+import base64
+import os
+import uuid
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any
+
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+from google.protobuf.message import Message
+from google.protobuf.message_factory import GetMessageClass
+from pydantic import BaseModel
+
+from clients.http.decoding import get_list_model_type, get_model_type
+
+# Правдоподобные значения строковых полей ответов по имени поля
+STRING_VALUES = {
+    "pin": "1234",
+    "cvv": "123",
+    "category": "supermarkets",
+    "last_name": "Standin",
+    "first_name": "Gateway",
+    "middle_name": "Local",
+    "card_number": "4000000000000002",
+    "card_holder": "GATEWAY STANDIN",
+    "phone_number": "+70000000000",
+}
+
+
+class PayloadBuilder:
+    """
+    Строит тела ответов заменителя gateway по схемам ответов клиентов.
+
+    HTTP-ответы строятся по Pydantic-схемам (с алиасами полей), gRPC-ответы — по
+    дескрипторам protobuf-сообщений. Значения выбираются по типу и имени поля:
+    идентификаторы — UUID, даты — текущая дата, перечисления — первое значимое значение,
+    списки — list_size элементов, документы — document_size случайных байт.
+    """
+
+    def __init__(self, list_size: int, document_size: int):
+        """
+        :param list_size: Количество элементов в списках ответов.
+        :param document_size: Размер документов в ответах (в байтах).
+        """
+        self.list_size = list_size
+        self.document_size = document_size
+
+    def build_string(self, name: str) -> str:
+        if name == "id" or name.endswith("_id"):
+            return str(uuid.uuid4())
+
+        if name == "email":
+            return f"{uuid.uuid4().hex}@example.com"
+
+        if name == "url":
+            return f"http://localhost/documents/{uuid.uuid4()}.pdf"
+
+        if name == "document":
+            return base64.b64encode(os.urandom(self.document_size)).decode("ascii")
+
+        if name in ("expiry_date", "created_at"):
+            return datetime.now(timezone.utc).isoformat() if name == "created_at" else date.today().isoformat()
+
+        return STRING_VALUES.get(name, name)
+
+    def build_json_value(self, name: str, annotation: Any) -> Any:
+        if model := get_model_type(annotation):
+            return self.build_json(model)
+
+        if model := get_list_model_type(annotation):
+            return [self.build_json(model) for _ in range(self.list_size)]
+
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+
+        if annotation is datetime:
+            return datetime.now(timezone.utc).isoformat()
+
+        if annotation is date:
+            return date.today().isoformat()
+
+        if annotation is float:
+            return 100.0
+
+        if annotation is int:
+            return 1
+
+        if annotation is bool:
+            return True
+
+        return self.build_string(name)
+
+    def build_json(self, schema: type[BaseModel]) -> dict:
+        """
+        Строит JSON-совместимое тело ответа по Pydantic-схеме (ключи — алиасы полей).
+
+        :param schema: Схема ответа, например GetOperationsResponseSchema.
+        :return: Словарь, проходящий валидацию схемы.
+        """
+        return {
+            field.alias or name: self.build_json_value(name, field.annotation)
+            for name, field in schema.model_fields.items()
+        }
+
+    def build_message(self, descriptor: Descriptor) -> Message:
+        """
+        Строит protobuf-ответ по дескриптору сообщения.
+
+        :param descriptor: Дескриптор сообщения ответа, например GetOperationsResponse.DESCRIPTOR.
+        :return: Заполненное сообщение.
+        """
+        message = GetMessageClass(descriptor)()
+        for field in descriptor.fields:
+            repeated = field.label == FieldDescriptor.LABEL_REPEATED
+            if field.type == FieldDescriptor.TYPE_MESSAGE:
+                if repeated:
+                    items = [self.build_message(field.message_type) for _ in range(self.list_size)]
+                    getattr(message, field.name).extend(items)
+                else:
+                    getattr(message, field.name).CopyFrom(self.build_message(field.message_type))
+            elif not repeated:
+                setattr(message, field.name, self.build_scalar(field))
+
+        return message
+
+    def build_scalar(self, field: FieldDescriptor) -> Any:
+        match field.type:
+            case FieldDescriptor.TYPE_ENUM:
+                # Нулевое значение proto3-перечисления — UNSPECIFIED, выбираем первое значимое
+                values = [value.number for value in field.enum_type.values]
+                return next((number for number in values if number != 0), values[0])
+            case FieldDescriptor.TYPE_DOUBLE | FieldDescriptor.TYPE_FLOAT:
+                return 100.0
+            case FieldDescriptor.TYPE_BOOL:
+                return True
+            case FieldDescriptor.TYPE_BYTES:
+                return os.urandom(self.document_size)
+            case FieldDescriptor.TYPE_STRING:
+                return self.build_string(field.name)
+            case _:
+                return 1
@@ -0,0 +1,41 @@
+import math
+import random
+
+from tools.config.standin import StandInLatencyDistribution, StandInProfileConfig
+
+
+class ResponseProfile:
+    """
+    Профиль ответа метода заменителя gateway: распределение задержки и доля ошибок.
+    """
+
+    def __init__(self, config: StandInProfileConfig):
+        """
+        :param config: Настройки профиля (общие или переопределённые для метода).
+        """
+        self.config = config
+        self.latency = config.latency_ms / 1000
+        self.jitter = config.latency_jitter_ms / 1000
+
+    def get_latency(self) -> float:
+        """
+        Возвращает задержку очередного ответа в секундах.
+        """
+        if self.latency == 0 and self.jitter == 0:
+            return 0.0
+
+        match self.config.latency_distribution:
+            case StandInLatencyDistribution.UNIFORM:
+                return random.uniform(max(self.latency - self.jitter, 0), self.latency + self.jitter)
+            case StandInLatencyDistribution.EXPONENTIAL:
+                return random.expovariate(1 / self.latency) if self.latency else 0.0
+            case StandInLatencyDistribution.LOGNORMAL:
+                return random.lognormvariate(math.log(self.latency), self.config.latency_sigma) if self.latency else 0.0
+            case _:
+                return self.latency
+
+    def is_error(self) -> bool:
+        """
+        Определяет, должен ли очередной ответ завершиться ошибкой.
+        """
+        return self.config.error_rate > 0 and random.random() < self.config.error_rate